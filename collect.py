@@ -8,7 +8,8 @@ import argparse
 import logging
 import io
 
-from commons import mido_util, dgxdump
+from commons import mido_util, dgxdump, transfer
+from commons.exceptions import TransferTimeoutError, MessageError
 
 argparser = argparse.ArgumentParser(
     description="Writes out bulk dump data to standard output")
@@ -45,6 +46,21 @@ argparser.add_argument(
     '-q', '--quiet', action='store_true',
     help="Don't print progress messages to stderr")
 
+timegroup = argparser.add_argument_group("Deadlines")
+timegroup.add_argument(
+    '--message-timeout', type=float, metavar='SECONDS',
+    help="Give up if no message comes in for this long, "
+         "once the transfer has started")
+timegroup.add_argument(
+    '--timeout', type=float, metavar='SECONDS',
+    help="Give up if the whole transfer (including the wait for the first "
+         "message) takes longer than this")
+timegroup.add_argument(
+    '--partial', type=str, metavar='FILE',
+    help="If the transfer is given up on or goes wrong, save all the "
+         "messages received so far to this file "
+         "(in the same format as the output)")
+
 # argparser.add_argument(
 #     'outfile', type=str,
 #     help="File to write to. Error if file already exists")
@@ -64,44 +80,90 @@ if args.quiet:
     logger.setLevel(logging.WARNING)
 else:
     logger.setLevel(logging.INFO)
+# (the monitor reports the progress instead)
+logging.getLogger('collect.read').setLevel(logging.WARNING)
 
 
-def _get_msgs(msgs):
+if args.plaintext:
+    logger.info('Writing hex to stdout')
+    # Force ASCII
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding="ascii")
+else:
+    logger.info('writing bytes to stdout')
+    out = sys.stdout.buffer
+
+
+def _write_msgs(messages):
+    if args.plaintext:
+        mido_util.writeout_hex(out, messages)
+    else:
+        mido_util.writeout_bytes(out, messages)
+    # so whatever's reading from the other end of a pipe gets it now
+    out.flush()
+
+
+def _collect_msgs(msgs):
     if args.all:
         messages = []
         for message in mido_util.grab_sysex_until_clock(msgs):
-            logger.info('Message received...')
             messages.append(message)
         logger.info('Messages finished')
-        return messages
+        _write_msgs(messages)
     else:
-        dump = dgxdump.DgxDump(msgs, log='collect')
-        return dump.iter_messages()
-
-
-# I should probably refactor this with the one in extractor.py
-if args.mfile:
-    with open(args.input, 'rt') as infile:
-        logger.info('Reading from midotext file %r', args.input)
-        messages = _get_msgs(mido_util.readin_strings(infile))
-elif args.sfile:
-    with open(args.input, 'rb') as infile:
-        logger.info('Reading from syx file %r', args.input)
-        messages = _get_msgs(mido_util.read_syx_file(infile))
-else:
-    with mido_util.open_input(args.input,
-                              args.guessport, args.virtual) as inport:
-        logger.info('Reading from port %r', inport.name)
-        messages = _get_msgs(inport)
+        # write out each section as soon as it's complete
+        for section in dgxdump.iter_sections(msgs, log='collect.read'):
+            _write_msgs(section.iter_messages())
 
-if args.plaintext:
-    logger.info('Writing hex to stdout')
-    # Force ASCII
-    out = io.TextIOWrapper(sys.stdout.buffer, encoding="ascii")
-    mido_util.writeout_hex(out, messages)
-else:
-    logger.info('writing bytes to stdout')
-    mido_util.writeout_bytes(sys.stdout.buffer, messages)
-sys.stdout.flush()
 
+# everything received so far, in case we need to save it
+received = []
+monitor = transfer.TransferMonitor(
+    expected_count=None if args.all else transfer.EXPECTED_COUNT)
+
+
+def _monitored(source):
+    for message in transfer.monitor_messages(
+            source, monitor, args.message_timeout, args.timeout):
+        received.append(message)
+        if message.type == 'sysex':
+            logger.info(monitor.status_line())
+        yield message
+
+
+def _save_partial():
+    if args.plaintext:
+        with open(args.partial, 'wt', encoding='ascii') as outfile:
+            mido_util.writeout_hex(outfile, received)
+    else:
+        with open(args.partial, 'wb') as outfile:
+            mido_util.writeout_bytes(outfile, received)
+    logger.warning('%d messages saved to %r', len(received), args.partial)
+
+
+try:
+    # I should probably refactor this with the one in extractor.py
+    if args.mfile:
+        with open(args.input, 'rt') as infile:
+            logger.info('Reading from midotext file %r', args.input)
+            _collect_msgs(_monitored(mido_util.readin_strings(infile)))
+    elif args.sfile:
+        with open(args.input, 'rb') as infile:
+            logger.info('Reading from syx file %r', args.input)
+            _collect_msgs(_monitored(mido_util.read_syx_file(infile)))
+    else:
+        with mido_util.open_input(args.input,
+                                  args.guessport, args.virtual) as inport:
+            logger.info('Reading from port %r', inport.name)
+            _collect_msgs(_monitored(inport))
+except (TransferTimeoutError, MessageError, KeyboardInterrupt) as e:
+    logger.error('Transfer aborted: %s',
+                 getattr(e, 'description', str(e)) or "interrupted")
+    for line in monitor.summary_lines():
+        logger.warning(line)
+    if args.partial is not None:
+        _save_partial()
+    sys.exit(1)
+
+for line in monitor.summary_lines():
+    logger.info(line)
 logger.info('Done!')
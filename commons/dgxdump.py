@@ -2,13 +2,74 @@ import collections
 
 from .dumpdata.messages import SongDumpSection, RegDumpSection
 from .util import YAMAHA
-from .mido_util import writeout_bytes
+from .mido_util import writeout_bytes, read_messages_file
+
+# index of the section byte in a bulk dump message's data
+SECTION_INDEX = 5
 
 
 def filter_yamaha_sysex(messages):
     return (m for m in messages if m.type == 'sysex' and m.data[0] == YAMAHA)
 
 
+def filter_section(messages, section_byte):
+    """
+    Only the (Yamaha sysex) messages with the section byte,
+    e.g. SongDumpSection.SECTION_BYTE.
+    """
+    return (m for m in messages
+            if len(m.data) > SECTION_INDEX
+            and m.data[SECTION_INDEX] == section_byte)
+
+
+def iter_sections(messages, log=None, song=True, reg=True):
+    """
+    Generator, yields the SongDumpSection then the RegDumpSection
+    (or just the one asked for) from the messages, each one as soon as its
+    last message has come in, without waiting for the rest.
+    """
+    stream = filter_yamaha_sysex(messages)
+
+    if song:
+        if not reg:
+            stream = filter_section(stream, SongDumpSection.SECTION_BYTE)
+        yield SongDumpSection(stream, log=log)
+
+    if reg:
+        if not song:
+            # skip over the song section
+            stream = filter_section(stream, RegDumpSection.SECTION_BYTE)
+        yield RegDumpSection(stream, log=log)
+
+
+def wanted_sections(song=True, reg=True):
+    """
+    The section bytes to read for the sections wanted, for the sections
+    argument of mido_util.read_messages_file (None for everything).
+    """
+    # (the song section is most of the dump)
+    if song and reg:
+        return None
+    sections = []
+    if song:
+        sections.append(SongDumpSection.SECTION_BYTE)
+    if reg:
+        sections.append(RegDumpSection.SECTION_BYTE)
+    return sections
+
+
+def read_dump_file(filename, mfile=False, log=__name__, sublog=None,
+                   song=True, reg=True, timeout=None):
+    """
+    Read a DgxDump from a file (see mido_util.read_messages_file),
+    with only the sections wanted.
+    log: logger name for reading the file, sublog: for the dump messages.
+    """
+    with read_messages_file(filename, mfile, log,
+                            wanted_sections(song, reg), timeout) as messages:
+        return DgxDump(messages, log=sublog, song=song, reg=reg)
+
+
 class DgxDump(object):
     # Object-Orientation?
     # More Abstractions, More Often!
@@ -16,20 +77,15 @@ class DgxDump(object):
     def __init__(self, messages, log=None, song=True, reg=True):
 
         self._sections = []
-        stream = filter_yamaha_sysex(messages)
-        # could be improved...
-
-        if song:
-            self.song_data = SongDumpSection(stream, log=log)
-            self._sections.append(self.song_data)
-        else:
-            self.song_data = None
-
-        if reg:
-            self.reg_data = RegDumpSection(stream, log=log)
-            self._sections.append(self.reg_data)
-        else:
-            self.reg_data = None
+        self.song_data = None
+        self.reg_data = None
+
+        for section in iter_sections(messages, log, song, reg):
+            if isinstance(section, SongDumpSection):
+                self.song_data = section
+            else:
+                self.reg_data = section
+            self._sections.append(section)
 
     def iter_messages(self):
         for section in self._sections:
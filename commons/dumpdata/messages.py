@@ -4,8 +4,7 @@ from ..exceptions import MessageParsingError, MessageSequenceError
 from ..util import (YAMAHA,
                     unpack_seven, reconstitute_all, not_none_get,
                     lazy_property)
-from .songdata import SongData
-from .regdata import RegData
+from .payload import LazyPayload
 
 
 class DumpMessage(object):
@@ -111,7 +110,8 @@ class DumpSection(object):
         Verifies that all the sizes and running total match and everything.
         MessageParsingError raised if the messages don't match.
         DumpMessage objects stored in self.dm_list,
-        Concatenated payload memoryview in self.data
+        Concatenated payload memoryview in self.data,
+        or decoded on demand in self.payload
 
         message_seq = an iterable of mido messages
         log = name of a logger (logging module)
@@ -184,10 +184,13 @@ class DumpSection(object):
         for dm in self.dm_list:
             yield dm.message
 
+    @lazy_property
+    def payload(self):
+        return LazyPayload(self.dm_list)
+
     @lazy_property
     def data(self):
-        return memoryview(
-                b''.join(dm.payload for dm in self.dm_list if dm.payload))
+        return self.payload.full()
 
 
 class SongDumpSection(DumpSection):
@@ -201,7 +204,10 @@ class SongDumpSection(DumpSection):
 
     @lazy_property
     def songs(self):
-        return SongData(self.data)
+        # imported here, so the song data (and its dependencies)
+        # are only loaded when actually needed.
+        from .songdata import SongData
+        return SongData(self.payload)
 
     def _cereal(self):
         return self.songs._cereal()
@@ -218,7 +224,9 @@ class RegDumpSection(DumpSection):
 
     @lazy_property
     def settings(self):
-        return RegData(self.data)
+        # (likewise, this brings in all the tables)
+        from .regdata import RegData
+        return RegData(self.payload)
 
     def _cereal(self):
         return self.settings._cereal()
@@ -0,0 +1,154 @@
+"""
+payload.py
+
+Decoding the payload data of a dump section on demand.
+
+Every eight bytes of the encoded payload (a 'group') decode to seven bytes
+independently of the others, so a byte range of the decoded data can be
+got by reconstituting only the groups covering it. The offset map finds the
+groups from the running totals of the messages.
+"""
+
+import bisect
+
+from ..util import reconstitute
+
+
+class PayloadOffsetMap(object):
+    """
+    Maps offsets in the decoded (concatenated, unpadded) payload data of a
+    section to the message and 8-byte group they're encoded in.
+    Made from the DumpMessage objects of a section (as DumpSection.dm_list).
+    """
+    def __init__(self, dm_list):
+        # decoded offset of the start of each message's payload.
+        self.starts = []
+        # the messages with payloads (i.e. not the end message)
+        self.messages = []
+        padding = 0
+        for dm in dm_list:
+            if dm.end:
+                break
+            # run is the count of encoded bytes before this message, so
+            # run // 8 groups, each 7 bytes decoded, less the padding so far
+            self.starts.append(dm.run // 8 * 7 - padding)
+            self.messages.append(dm)
+            padding += dm.padding_size
+        if self.messages:
+            last = self.messages[-1]
+            self.size = (self.starts[-1] + last.padded_size // 8 * 7
+                         - last.padding_size)
+        else:
+            self.size = 0
+        # index of each message's first group, counting across messages
+        self.group_starts = [dm.run // 8 for dm in self.messages]
+        self.group_count = sum(dm.padded_size // 8 for dm in self.messages)
+
+    def locate(self, offset):
+        """
+        Returns (message index, group index within the message,
+        offset within the group) for the decoded offset.
+        IndexError raised if the offset is out of range.
+        """
+        if not 0 <= offset < self.size:
+            raise IndexError(f"Offset out of range: {offset}")
+        i = bisect.bisect_right(self.starts, offset) - 1
+        group, byte = divmod(offset - self.starts[i], 7)
+        return i, group, byte
+
+    def message_end(self, i):
+        """The decoded offset where message i's payload ends"""
+        if i + 1 < len(self.starts):
+            return self.starts[i+1]
+        return self.size
+
+
+class LazyPayload(object):
+    """
+    The decoded payload data of a section, decoded a group at a time as
+    it's accessed. Supports len(), indexing (returns an int) and slicing
+    (returns a memoryview). bytes() or full() decodes everything.
+    (The views share the decoded buffer, so don't write to them.)
+    """
+    __slots__ = ('offset_map', '_buffer', '_decoded', '_complete')
+
+    def __init__(self, dm_list):
+        self.offset_map = PayloadOffsetMap(dm_list)
+        self._buffer = bytearray(self.offset_map.size)
+        # one flag for each group
+        self._decoded = bytearray(self.offset_map.group_count)
+        self._complete = False
+
+    @property
+    def groups_decoded(self):
+        """Number of groups that have been decoded so far"""
+        return self.offset_map.group_count - self._decoded.count(0)
+
+    def decode_range(self, start, stop):
+        """
+        Make sure the bytes [start:stop] are decoded
+        (start and stop must be in range)
+        """
+        if self._complete or start >= stop:
+            return
+        omap = self.offset_map
+        i, group, _ = omap.locate(start)
+        pos = start
+        while pos < stop:
+            dm = omap.messages[i]
+            msg_start = omap.starts[i]
+            msg_end = omap.message_end(i)
+            last_group = (min(stop, msg_end) - msg_start - 1) // 7
+            for g in range(group, last_group + 1):
+                flag = omap.group_starts[i] + g
+                if self._decoded[flag]:
+                    continue
+                dest = msg_start + g * 7
+                # (the last group may be partly padding)
+                size = min(7, msg_end - dest)
+                self._buffer[dest:dest+size] = reconstitute(
+                    dm.raw_payload[g*8:g*8+8])[:size]
+                self._decoded[flag] = 1
+            pos = msg_end
+            i += 1
+            group = 0
+
+    def full(self):
+        """Decode everything, returns a memoryview of it all"""
+        if not self._complete:
+            omap = self.offset_map
+            for i, dm in enumerate(omap.messages):
+                start, end = omap.starts[i], omap.message_end(i)
+                first = omap.group_starts[i]
+                flags = slice(first, first + dm.padded_size // 8)
+                if any(self._decoded[flags]):
+                    self.decode_range(start, end)
+                else:
+                    # quicker to do the whole message in one go
+                    self._buffer[start:end] = dm.payload
+                    self._decoded[flags] = b'\x01' * (flags.stop - first)
+            self._complete = True
+        return memoryview(self._buffer)
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._buffer))
+            if step != 1:
+                return self.full()[key]
+            self.decode_range(start, stop)
+            return memoryview(self._buffer)[start:stop]
+        if key < 0:
+            key += len(self._buffer)
+        if not 0 <= key < len(self._buffer):
+            raise IndexError("Payload index out of range")
+        self.decode_range(key, key+1)
+        return self._buffer[key]
+
+    def __iter__(self):
+        return iter(self.full())
+
+    def __bytes__(self):
+        return bytes(self.full())
@@ -1,7 +1,7 @@
 import collections
 import collections.abc
 
-from ..util import CachedSequence
+from ..util import CachedSequence, lazy_property
 from ..exceptions import MalformedDataError
 from ..values import BLANK, UnknownBytesValue
 from .regvalues import DATA_SPECS
@@ -12,7 +12,7 @@ class RegData(CachedSequence):
     """
     Container for the useful data in a reg section
     """
-    __slots__ = ('data')
+    __slots__ = ('data', '_raw_values')
 
     START_SLICE = slice(0x000, 0x004)
     SETTINGS_SLICE = slice(0x004, 0x2C4)
@@ -32,16 +32,31 @@ class RegData(CachedSequence):
 
     def __init__(self, data):
 
+        """
+        data = the concatenated payload data (or a payload.LazyPayload)
+        """
         self.data = data
         self._message_format_checks()
 
+        # All the raw values for all the settings, in one go.
+        # (The values only get looked up when they're accessed)
+        self._raw_values = list(DATA_SPECS.SETTING_STRUCT.iter_unpack(
+            data[self.SETTINGS_SLICE]))
+
         # more absolute silliness for no real gain
 
-        def make_bank(idx, s=self.SETTING_SIZE, d=data[self.SETTINGS_SLICE]):
-            return RegBank(idx+1, (d[idx*s:(idx+1)*s], d[(idx+8)*s:(idx+9)*s]))
+        def make_bank(idx, setting_data=self._setting_data,
+                      r=self._raw_values):
+            return RegBank(idx+1, (setting_data(idx), setting_data(idx+8)),
+                           (r[idx], r[idx+8]))
 
         super().__init__(8, make_bank)
 
+    def _setting_data(self, idx):
+        # the bytes for setting idx, in storage order
+        start = self.SETTINGS_SLICE.start + idx*self.SETTING_SIZE
+        return self.data[start:start+self.SETTING_SIZE]
+
     def get_setting(self, bank, button):
         """Get the RegSetting object corresponding to the bank and button"""
         # data is stored by button, then banks
@@ -58,6 +73,19 @@ class RegData(CachedSequence):
         for bank in self:
             yield from bank
 
+    def iter_raw_values(self):
+        """
+        Iterate through (bank, button, data, raw values) for each setting,
+        grouped by bank then button, without creating the RegSetting objects.
+        data is the setting's bytes, and raw values is the tuple unpacked
+        with regvalues.DATA_SPECS.SETTING_STRUCT.
+        """
+        for bank in range(8):
+            for button in range(2):
+                idx = bank + 8*button
+                yield (bank+1, button+1,
+                       self._setting_data(idx), self._raw_values[idx])
+
     def _cereal(self):
         return [setting._cereal() for setting in self.iter_settings()]
 
@@ -65,11 +93,14 @@ class RegData(CachedSequence):
 class RegBank(CachedSequence):
     __slots__ = ('bank')
 
-    def __init__(self, bank, setting_data):
+    def __init__(self, bank, setting_data, raw_values=None):
         self.bank = bank
+        if raw_values is None:
+            raw_values = (None,) * len(setting_data)
 
-        def make_setting(idx, bank=bank, setting_data=setting_data):
-            return RegSetting(bank, idx+1, setting_data[idx])
+        def make_setting(idx, bank=bank, setting_data=setting_data,
+                         raw_values=raw_values):
+            return RegSetting(bank, idx+1, setting_data[idx], raw_values[idx])
 
         super().__init__(len(setting_data), make_setting)
 
@@ -80,69 +111,78 @@ class RegSetting(collections.abc.Mapping):
     Implements the Mapping abc.
     keys are the strings in regvalues.DATA_NAMES, which
     are supposed to be the names in the function menu
-    Values are a namedtuple
+    Values are a namedtuple, created when first accessed
     """
     SettingValue = collections.namedtuple(
         "SettingValue",
         "prop recorded value bytes unusual")
 
-    def __init__(self, bank, button, data):
-
+    def __init__(self, bank, button, data, raw_values=None):
+        """
+        raw_values is the tuple of raw values unpacked from the data
+        with regvalues.DATA_SPECS.SETTING_STRUCT, if already done.
+        """
         self.bank = bank
         self.button = button
 
         self.data = data
+        if raw_values is None:
+            raw_values = DATA_SPECS.SETTING_STRUCT.unpack(data)
+        self._raw_values = raw_values
 
-        self._dict = dict.fromkeys(DATA_SPECS.SETTING_MAP.keys())
-        self._unusual = []
+        # We look ahead at the first byte:
+        self.recorded = (self.data[0] != 0)
 
-        self._parse_values()
+        self._dict = {}
 
     # parse values
-    def _parse_values(self):
-        # We look ahead at the first byte:
-        self.recorded = (self.data[0] != 0)
-        for dname, (dslice, dfunc) in DATA_SPECS.SETTING_MAP.items():
-            # get the data as byte slice:
-            raw_bytes = self.data[dslice]
-            # then interpret it:
-            unusual = False
-            if self.recorded:
-                try:
-                    value = dfunc(raw_bytes)
-                except KeyError:
-                    unusual = True
+    def _parse_value(self, dname):
+        index, dslice, mapping = DATA_SPECS.SETTING_FIELDS[dname]
+        # get the data as byte slice:
+        raw_bytes = self.data[dslice]
+        # then interpret it:
+        unusual = False
+        if self.recorded:
+            try:
+                value = mapping[self._raw_values[index]]
+            except KeyError:
+                unusual = True
+        else:
+            if all(b == 0 for b in raw_bytes):
+                value = BLANK
             else:
-                if all(b == 0 for b in raw_bytes):
-                    value = BLANK
-                else:
-                    unusual = True
-            if unusual:
-                value = UnknownBytesValue(raw_bytes)
-            # we build the tuple...
-            val = self.SettingValue(
-                dname, self.recorded, value, raw_bytes, unusual)
-            # then save it
-            self._dict[dname] = val
-            if unusual:
-                self._note_unusual(val)
+                unusual = True
+        if unusual:
+            value = UnknownBytesValue(raw_bytes)
+        return self.SettingValue(
+            dname, self.recorded, value, raw_bytes, unusual)
+
+    @lazy_property
+    def _unusual(self):
+        # this needs all of the values.
+        unusual = [sval for sval in self.values() if sval.unusual]
         # Do a check for the two split points
-        if self.recorded and (self._dict["Split Point"].value
-                              != self._dict["_Split Point 2"].value):
-            self._note_unusual(self._dict["Split Point"])
-            self._note_unusual(self._dict["_Split Point 2"])
-
-    def _note_unusual(self, value):
-        self._unusual.append(value)
+        if self.recorded and (self["Split Point"].value
+                              != self["_Split Point 2"].value):
+            unusual.append(self["Split Point"])
+            unusual.append(self["_Split Point 2"])
+        return unusual
 
     def __getitem__(self, key):
-        return self._dict[key]
+        try:
+            return self._dict[key]
+        except KeyError:
+            if key not in DATA_SPECS.SETTING_FIELDS:
+                raise
+        val = self._parse_value(key)
+        self._dict[key] = val
+        return val
 
     def __iter__(self):
-        return iter(self._dict)
+        return iter(DATA_SPECS.SETTING_FIELDS)
 
     def __len__(self):
-        return len(self._dict)
+        return len(DATA_SPECS.SETTING_FIELDS)
 
     def print_settings(self):
         print(f"Bank {self.bank}, Button {self.button}:")
@@ -163,7 +203,7 @@ class RegSetting(collections.abc.Mapping):
         padding and the duplicate split point.
         """
         for key in DATA_SPECS.DISPLAY_ORDER:
-            yield (key, self._dict[key])
+            yield (key, self[key])
 
     def unusual_len(self):
         return len(self._unusual)
@@ -0,0 +1,166 @@
+"""
+regstore.py
+
+A columnar store of registration settings, gathered from many dumps.
+"""
+import array
+import collections
+import functools
+import itertools
+import operator
+
+from ..values import BLANK, UnknownBytesValue
+from .regdata import RegData, RegSetting
+from .regvalues import DATA_SPECS
+
+# struct format -> array typecode, for the fields we keep columns of
+_TYPECODES = {
+    'B': 'B',
+    'b': 'b',
+    'H': 'H',
+}
+
+
+class RegStore(object):
+    """
+    Stores the registration settings of many dumps, one row per setting,
+    as arrays of the raw codes for each field (named as in
+    regvalues.DATA_SPECS), plus the 'dump', 'bank', 'button' and 'recorded'
+    columns. ('dump' is the index into dump_keys)
+    The raw bytes of each setting are kept too, so the values can be
+    decoded for just the rows that are wanted.
+
+    Filtering is done on the raw codes, e.g. to find the settings in bank 3
+    with style 042 (stored as 41) and Harmony ON (0x7F):
+    store.select({'bank': 3, 'Style number': 41, 'Harmony': 0x7F})
+    """
+    ROW_SIZE = RegData.SETTING_SIZE
+
+    def __init__(self):
+        self.dump_keys = []
+        self._columns = collections.OrderedDict([
+            ('dump', array.array('L')),
+            ('bank', array.array('B')),
+            ('button', array.array('B')),
+            ('recorded', array.array('B')),
+        ])
+        # the index into the raw values tuple for each field column
+        self._field_indices = collections.OrderedDict()
+        for name, bformat, _ in DATA_SPECS.SETTING_FORMATS:
+            if bformat in _TYPECODES:
+                index, _, _ = DATA_SPECS.SETTING_FIELDS[name]
+                self._field_indices[name] = index
+                self._columns[name] = array.array(_TYPECODES[bformat])
+        self._data = bytearray()
+
+    def __len__(self):
+        return len(self._columns['dump'])
+
+    @property
+    def fields(self):
+        """The names of the columns"""
+        return list(self._columns)
+
+    def column(self, name):
+        """The array of values for a column"""
+        return self._columns[name]
+
+    def add_reg_data(self, key, reg_data):
+        """
+        Add all the settings from a RegData object, under the dump key.
+        Returns the dump index.
+        """
+        dump = len(self.dump_keys)
+        self.dump_keys.append(key)
+        columns = self._columns
+        field_columns = [(columns[name], index)
+                         for name, index in self._field_indices.items()]
+        for bank, button, data, raw_values in reg_data.iter_raw_values():
+            columns['dump'].append(dump)
+            columns['bank'].append(bank)
+            columns['button'].append(button)
+            columns['recorded'].append(data[0] != 0)
+            for column, index in field_columns:
+                column.append(raw_values[index])
+            self._data += data
+        return dump
+
+    def add_dump(self, key, dump):
+        """
+        Add the registration settings of a DgxDump (if it has them).
+        """
+        if dump.reg_data is not None:
+            return self.add_reg_data(key, dump.reg_data.settings)
+
+    @staticmethod
+    def _predicate(condition):
+        if callable(condition):
+            return condition
+        # (not condition.__eq__, which gives NotImplemented, a true value,
+        # for the wrong type)
+        return functools.partial(operator.eq, condition)
+
+    def select(self, conditions, rows=None):
+        """
+        Returns a list of the row indices that meet all the conditions,
+        a dict of column name -> raw value (or predicate function).
+        If rows is given, only those rows are considered.
+        """
+        if rows is None:
+            rows = range(len(self))
+        for name, condition in conditions.items():
+            column = self._columns[name]
+            pred = self._predicate(condition)
+            if isinstance(rows, range):
+                # whole columns at a time
+                mask = map(pred, column[rows.start:rows.stop])
+                rows = list(itertools.compress(rows, mask))
+            else:
+                rows = [row for row in rows if pred(column[row])]
+        return list(rows)
+
+    def group_by(self, name, rows=None):
+        """
+        Returns a dict of raw value -> list of row indices, for a column.
+        """
+        column = self._columns[name]
+        if rows is None:
+            rows = range(len(self))
+        groups = collections.defaultdict(list)
+        for row in rows:
+            groups[column[row]].append(row)
+        return dict(groups)
+
+    def row_key(self, row):
+        """The (dump key, bank, button) of a row"""
+        columns = self._columns
+        return (self.dump_keys[columns['dump'][row]],
+                columns['bank'][row], columns['button'][row])
+
+    def row_data(self, row):
+        """The raw bytes of the setting of a row"""
+        return bytes(self._data[row*self.ROW_SIZE:(row+1)*self.ROW_SIZE])
+
+    def decode(self, row, name):
+        """
+        The decoded value of a field for a row (as in
+        RegSetting.SettingValue.value)
+        """
+        if name not in self._field_indices:
+            # We don't keep columns for the odd fields, go the long way
+            return self.setting(row)[name].value
+        code = self._columns[name][row]
+        _, dslice, mapping = DATA_SPECS.SETTING_FIELDS[name]
+        if self._columns['recorded'][row]:
+            try:
+                return mapping[code]
+            except KeyError:
+                pass
+        elif code == 0:
+            return BLANK
+        return UnknownBytesValue(self.row_data(row)[dslice])
+
+    def setting(self, row):
+        """The full RegSetting object for a row"""
+        _, bank, button = self.row_key(row)
+        return RegSetting(bank, button, self.row_data(row))
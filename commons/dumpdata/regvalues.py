@@ -6,7 +6,7 @@ from .. import util
 from ..maps import BytesAssertMap, RangeMapBase, RangeMap, EffectTypeMap, KeyMap
 from ..values import (HarmonyType, ReverbType, ChorusType,
     AcmpSection, BLANK, SwitchBool)
-from ..tables import styles, voices
+from ..tables import lookup
 
 
 @functools.lru_cache()  # cache it, because why not eh
@@ -18,8 +18,9 @@ def get_struct(bformat):
 class _RegLookup(object):
     PAD_MAP = BytesAssertMap(b'\x00\x00')
     NUMBER_MAP = RangeMap()
-    VOICE_MAP = RangeMapBase(voices.from_number, 1, 494, +1)
-    STYLE_MAP = RangeMapBase(styles.from_number, 1, 136, +1, none_val=0xFF)
+    VOICE_MAP = RangeMapBase(lookup.voice_from_number, 1, 494, +1)
+    STYLE_MAP = RangeMapBase(lookup.style_from_number, 1, 136, +1,
+                             none_val=0xFF)
     OCTAVE_MAP = RangeMap(-2, +2, format_string="1d")
     SPLIT_MAP = KeyMap()
     REVERB_MAP = EffectTypeMap(ReverbType)
@@ -122,6 +123,27 @@ class _RegLookup(object):
             for (name, dslice, bstruct, mapping) in
             zip(names, dslices, bstructs, mappings))
 
+    @util.lazy_property
+    def SETTING_STRUCT(self):
+        """
+        A single struct for unpacking all the raw values of a setting
+        """
+        return get_struct(''.join(fmt for _, fmt, _ in self.SETTING_FORMATS))
+
+    @util.lazy_property
+    def SETTING_FIELDS(self):
+        """
+        OrderedDict of name -> (index, slice, mapping), where index is the
+        position of the raw value in the SETTING_STRUCT unpacked tuple
+        """
+        names, bformats, mappings = zip(*self.SETTING_FORMATS)
+        dslices = util.cumulative_slices(
+            get_struct(fmt).size for fmt in bformats)
+        return collections.OrderedDict(
+            (name, (index, dslice, mapping))
+            for index, (name, dslice, mapping) in
+            enumerate(zip(names, dslices, mappings)))
+
     DISPLAY_ORDER = (
         # front panel
         "Style number",
@@ -1,9 +1,20 @@
 import collections
+import collections.abc
 import struct
 
 from ..util import (slicebyn, boolean_bitarray_tuple, lazy_property,
-                    CachedSequence)
+                    CachedSequence, write_buffers)
 from ..exceptions import MalformedDataError, NotRecordedError
+from .songevents import decode_track_blocks, correct_octaves
+from ..tempomap import TempoMap
+
+
+def midi_header(track_count):
+    """
+    The MThd chunk for a user song MIDI file with track_count tracks.
+    """
+    # chunk length 6, MIDI file format 1, 96 ticks per quarter note.
+    return struct.pack('>4sL3H', b'MThd', 6, 1, track_count, 96)
 
 
 class SongData(CachedSequence):
@@ -49,7 +60,8 @@ class SongData(CachedSequence):
 
     def __init__(self, data):
         """
-        data = the concatenated payload data.
+        data = the concatenated payload data
+        (or a payload.LazyPayload, so only what's needed gets decoded).
         songs are available through the songs attribute.
         """
         self.data = data
@@ -58,7 +70,7 @@ class SongData(CachedSequence):
         self._mystery = self.data[self.MYSTERY_SLICE]
 
         self._block_system = SongDataBlockSystem(
-            data[self.NEXT_BLOCKS_SLICE], data[self.BLOCK_DATA_SLICE])
+            data[self.NEXT_BLOCKS_SLICE], data, self.BLOCK_DATA_SLICE.start)
 
         def make_song(idx,
                       block_system=self._block_system,
@@ -84,6 +96,14 @@ class SongData(CachedSequence):
 
         super().__init__(5, make_song)
 
+    def check_blocks(self):
+        """
+        Check the integrity of the block chains of all the tracks.
+        Returns a SongDataBlockSystem.BlockChainReport.
+        """
+        return self._block_system.integrity_report(
+            self.data[self.BEGINNING_BLOCKS_SLICE])
+
     def get_song(self, number):
         """
         Get song, 1-based indexing. (if you can call it that).
@@ -105,18 +125,40 @@ class SongDataBlockSystem(object):
     BLOCK_COUNT = 0x82
     BLOCK_SIZE = 0x200
 
-    def __init__(self, next_blocks_table, block_data):
+    # values in the next blocks table
+    UNUSED_BLOCK = 0x00
+    END_BLOCK = 0xFF
+
+    # how a chain of blocks ends
+    CHAIN_END = "end"
+    CHAIN_EMPTY = "empty"
+    CHAIN_INVALID = "invalid"
+    CHAIN_CYCLE = "cycle"
+
+    BlockChain = collections.namedtuple("BlockChain", "blocks end")
+
+    BlockChainReport = collections.namedtuple(
+        "BlockChainReport", "chains broken cycles orphans shared")
+
+    def __init__(self, next_blocks_table, block_data, offset=0):
+        """
+        block_data is only sliced one block at a time, starting at offset
+        (so it can be the whole of the song data, decoded on demand)
+        """
         self._next_blocks_table = next_blocks_table
         self._block_data = block_data
+        self._offset = offset
 
-    def get_block_data(self, n):
+    def get_block_data(self, n, length=None):
         """
         Returns the specified block data of block n
+        (or just the first length bytes of it)
         """
         if 1 <= n <= self.BLOCK_COUNT:
-            end = self.BLOCK_SIZE * n
-            start = end - self.BLOCK_SIZE
-            return self._block_data[start:end]
+            start = self.BLOCK_SIZE * (n-1) + self._offset
+            if length is None or length > self.BLOCK_SIZE:
+                length = self.BLOCK_SIZE
+            return self._block_data[start:start+length]
         else:
             raise IndexError(f"Invalid index: {n}")
 
@@ -128,24 +170,107 @@ class SongDataBlockSystem(object):
             raise IndexError(f"Invalid index: {n}")
         return self._next_blocks_table[n-1]
 
-    def _block_data_iter(self, start_block, length):
+    @lazy_property
+    def _predecessor_counts(self):
+        # How many blocks point to each block (index 0 unused)
+        counts = [0] * (self.BLOCK_COUNT + 1)
+        for nxt in self._next_blocks_table:
+            if 1 <= nxt <= self.BLOCK_COUNT:
+                counts[nxt] += 1
+        return counts
+
+    @lazy_property
+    def chain_index(self):
         """
-        Yields data blocks up to length from start_block
+        The chain of blocks starting from each block number, resolved
+        in a single pass over the next blocks table.
+        A dict of block number -> BlockChain(blocks, end), where
+        blocks is a tuple of block numbers in order, and end is how the
+        chain ends:
+        CHAIN_END if properly terminated,
+        CHAIN_EMPTY if it leads to the unused marker,
+        CHAIN_INVALID if it leads to an out of range block number,
+        CHAIN_CYCLE if it loops back on itself.
         """
-        num = start_block
-        rem = length
-        while rem > 0:
-            if num == 0xFF:
-                raise MalformedDataError("ran out too early")
-            elif num == 0x00:
-                raise MalformedDataError("referenced empty block")
-            block = self.get_block_data(num)
-            if rem < self.BLOCK_SIZE:
-                block = block[:rem]
-                # We don't want to read too much, so chop off the end
-            rem -= len(block)
-            num = self.get_next_block_number(num)
-            yield block
+        table = self._next_blocks_table
+        index = {}
+        for first in range(1, self.BLOCK_COUNT+1):
+            if first in index:
+                continue
+            # walk along until we reach the end, or a resolved chain
+            path = []
+            on_path = set()
+            num = first
+            while True:
+                if num in index:
+                    tail = index[num]
+                    break
+                if num in on_path:
+                    # been here before: the chain loops.
+                    # Each block in the loop gets the loop once round.
+                    loop = path[path.index(num):]
+                    del path[-len(loop):]
+                    for i, n in enumerate(loop):
+                        index[n] = self.BlockChain(
+                            tuple(loop[i:] + loop[:i]), self.CHAIN_CYCLE)
+                    tail = index[num]
+                    break
+                path.append(num)
+                on_path.add(num)
+                num = table[num-1]
+                if num == self.END_BLOCK:
+                    tail = self.BlockChain((), self.CHAIN_END)
+                    break
+                elif num == self.UNUSED_BLOCK:
+                    tail = self.BlockChain((), self.CHAIN_EMPTY)
+                    break
+                elif num > self.BLOCK_COUNT:
+                    tail = self.BlockChain((), self.CHAIN_INVALID)
+                    break
+            # then fill in the chains from the back
+            blocks = tail.blocks
+            for num in reversed(path):
+                blocks = (num,) + blocks
+                index[num] = self.BlockChain(blocks, tail.end)
+        return index
+
+    def integrity_report(self, start_blocks):
+        """
+        Check the chains from the starting blocks (with END_BLOCK for
+        unused tracks, which are skipped).
+        Returns BlockChainReport(chains, broken, cycles, orphans, shared):
+        chains: dict of start block -> BlockChain
+        broken: set of start blocks whose chain isn't properly terminated
+        cycles: set of blocks that are part of a loop
+        orphans: set of blocks in use, but not in any of the chains
+        shared: set of blocks that more than one block leads to
+        """
+        index = self.chain_index
+        chains = {}
+        for start in start_blocks:
+            if start != self.END_BLOCK:
+                try:
+                    chains[start] = index[start]
+                except KeyError:
+                    chains[start] = self.BlockChain((), self.CHAIN_INVALID)
+        broken = {start for start, chain in chains.items()
+                  if chain.end != self.CHAIN_END}
+        reached = set()
+        for chain in chains.values():
+            reached.update(chain.blocks)
+        cycles = set()
+        for chain in index.values():
+            if chain.end == self.CHAIN_CYCLE:
+                # the blocks from the repeated one onwards are the loop
+                last = chain.blocks[-1]
+                repeat = self._next_blocks_table[last-1]
+                cycles.update(chain.blocks[chain.blocks.index(repeat):])
+        in_use = {n for n, nxt in enumerate(self._next_blocks_table, 1)
+                  if nxt != self.UNUSED_BLOCK}
+        orphans = in_use - reached
+        shared = {n for n, count in enumerate(self._predecessor_counts)
+                  if count > 1}
+        return self.BlockChainReport(chains, broken, cycles, orphans, shared)
 
     def get_track_blocks(self, start_block):
         """
@@ -153,12 +278,13 @@ class SongDataBlockSystem(object):
         MalformedDataError raised if chunk is invalid somehow
         returns (size, blocks), where:
         size is the total number of bytes in the chunk (including header)
-        blocks is a list of the blocks (as memoryviews, with the last one
-        truncated appropriately for the chunk size)
+        blocks is a TrackBlocks sequence of the blocks (as memoryviews,
+        with the last one truncated appropriately for the chunk size)
         """
         # First, we need to check if this is actually a block.
+        # (only the header is needed for now)
         try:
-            block = self.get_block_data(start_block)
+            block = self.get_block_data(start_block, 8)
         except IndexError:
             raise MalformedDataError("Invalid starting block")
         # Then, we see if the block indeed contains the start of a track:
@@ -170,8 +296,51 @@ class SongDataBlockSystem(object):
         # i.e. not including the 8-byte header.
         # so, we need to add 8 to get the total size of the chunk
         size = dlength + 8
-        blocks = list(self._block_data_iter(start_block, size))
-        return size, blocks
+        count, rem = divmod(size, self.BLOCK_SIZE)
+        if rem:
+            count += 1
+        chain = self.chain_index[start_block]
+        if len(chain.blocks) < count:
+            if chain.end == self.CHAIN_END:
+                raise MalformedDataError("ran out too early")
+            elif chain.end == self.CHAIN_EMPTY:
+                raise MalformedDataError("referenced empty block")
+            elif chain.end == self.CHAIN_CYCLE:
+                raise MalformedDataError("block chain loops")
+            else:
+                raise MalformedDataError("referenced invalid block")
+        return size, TrackBlocks(self, chain.blocks[:count], rem)
+
+
+class TrackBlocks(CachedSequence):
+    """
+    The blocks of a track chunk, as memoryviews, each got from the
+    block system when first accessed (so the song data only gets decoded
+    for the tracks that are actually read).
+    Compares equal to any sequence of equal blocks.
+    """
+    __slots__ = ()
+
+    def __init__(self, block_system, numbers, last_size=0):
+        """
+        numbers: the block numbers, in order
+        last_size: the size of the last block, if truncated
+        """
+        def get_block(idx, last=len(numbers)-1):
+            if idx == last and last_size:
+                # We don't want to read too much, so chop off the end
+                return block_system.get_block_data(numbers[idx], last_size)
+            return block_system.get_block_data(numbers[idx])
+
+        super().__init__(len(numbers), get_block)
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return (len(self) == len(other)
+                and all(a == b for a, b in zip(self, other)))
+
+    __hash__ = None
 
 
 class UserSong(object):
@@ -234,19 +403,49 @@ class UserSong(object):
         for item in (self, *self._tracks):
             print(columns(item.name, item.active, item.duration, item.size))
 
-    def _midi_blocks_iter(self):
+    def _midi_blocks_iter(self, octave_correct=False):
         # yield the blocks for a Type 1 smf MIDI file.
         if not self._datatracks:
             raise NotRecordedError("Song not recorded")
-        # Construct the header:
-        # chunk length 6, MIDI file format 1, 96 ticks per quarter note.
-        header = struct.pack('>4sL3H',
-                             b'MThd', 6, 1, len(self._datatracks), 96)
+        header = midi_header(len(self._datatracks))
         # yield header then all the blocks for all the tracks.
         # This is why Track A went first.
         yield header
         for track in self._datatracks:
-            yield from track.blocks
+            if octave_correct and track.track != 0:
+                # (Track A has no notes, so we leave it alone)
+                yield correct_octaves(track.blocks)
+            else:
+                yield from track.blocks
+
+    def midi_buffers(self, octave_correct=False):
+        """
+        The MIDI file, as a list of the header and the track blocks
+        (as memoryviews, without copying),
+        e.g. for util.write_buffers.
+        If octave_correct, the song tracks are rewritten with the main voice
+        octave applied to the notes (see songevents.correct_octaves),
+        so those are new bytes objects, not views.
+        NotRecordedError raised if the song isn't recorded.
+        """
+        return list(self._midi_blocks_iter(octave_correct))
+
+    def write_midi(self, outfile, octave_correct=False):
+        """
+        Write the MIDI file to a (binary-mode) file object,
+        without joining the blocks together first.
+        """
+        write_buffers(outfile, self.midi_buffers(octave_correct))
+
+    def track_blocks(self):
+        """
+        List of (track number, blocks) for the tracks with data,
+        Track A (0) first.
+        NotRecordedError raised if the song isn't recorded.
+        """
+        if not self._datatracks:
+            raise NotRecordedError("Song not recorded")
+        return [(track.track, track.blocks) for track in self._datatracks]
 
     @lazy_property
     def midi(self):
@@ -255,18 +454,57 @@ class UserSong(object):
         """
         return b''.join(self._midi_blocks_iter())
 
-    def _cereal(self):
-        return collections.OrderedDict([
+    @lazy_property
+    def midi_octave_corrected(self):
+        """
+        The MIDI file, as bytes, with the octave correction applied.
+        """
+        return b''.join(self._midi_blocks_iter(octave_correct=True))
+
+    @lazy_property
+    def events(self):
+        """
+        The decoded events of each track, as songevents.TrackEvents,
+        in the same order as the tracks (index 0 = Track A, 1 = Track 1 ...)
+        or None for tracks without data. Decoded on first access.
+        """
+        def make_events(idx, tracks=self._tracks):
+            blocks = tracks[idx].blocks
+            if blocks is None:
+                return None
+            return decode_track_blocks(blocks)
+
+        return CachedSequence(len(self._tracks), make_events)
+
+    @lazy_property
+    def tempo_map(self):
+        """
+        A tempomap.TempoMap of the song, from the events of Track A.
+        (with no tempo changes if Track A has no data)
+        """
+        time_events = self.events[0]
+        if time_events is None:
+            return TempoMap()
+        return TempoMap.from_track_events(time_events)
+
+    def _cereal(self, tracks=True):
+        cereal = collections.OrderedDict([
             ('number', self.number),
             ('name', self.name),
             ('active', self.active),
             ('duration', self.duration),
             ('size', self.size),
-            ('tracks', [collections.OrderedDict([
+        ])
+        if tracks:
+            cereal['tracks'] = list(self._cereal_tracks())
+        return cereal
+
+    def _cereal_tracks(self):
+        for track in self._tracks:
+            yield collections.OrderedDict([
                 ('track', track.track),
                 ('name', track.name),
                 ('active', track.active),
                 ('duration', track.duration),
                 ('size', track.size)
-            ]) for track in self._tracks])
-        ])
+            ])
@@ -0,0 +1,335 @@
+"""
+songevents.py
+
+Decoding the MTrk chunks of the user songs straight out of the blocks,
+into compact columns of events (without going through mido).
+"""
+import array
+import itertools
+import struct
+
+from ..util import unpack_variable_length, pack_variable_length
+from ..exceptions import MalformedDataError
+
+# Status byte constants
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+POLYTOUCH = 0xA0
+CONTROL_CHANGE = 0xB0
+PROGRAM_CHANGE = 0xC0
+AFTERTOUCH = 0xD0
+PITCHWHEEL = 0xE0
+SYSEX = 0xF0
+SYSEX_ESCAPE = 0xF7
+META = 0xFF
+
+# Meta event types
+META_END_OF_TRACK = 0x2F
+META_TEMPO = 0x51
+META_TIME_SIGNATURE = 0x58
+META_SEQSPEC = 0x7F
+
+# number of data bytes for each kind of channel message
+_DATA_LENGTHS = {
+    NOTE_OFF: 2,
+    NOTE_ON: 2,
+    POLYTOUCH: 2,
+    CONTROL_CHANGE: 2,
+    PROGRAM_CHANGE: 1,
+    AFTERTOUCH: 1,
+    PITCHWHEEL: 2,
+}
+
+
+def _read_variable_length(byte_iter):
+    """
+    Read a variable-length number from an iterator over the bytes.
+    """
+    vbytes = bytearray()
+    for b in byte_iter:
+        vbytes.append(b)
+        if b < 0x80:
+            return unpack_variable_length(vbytes)
+        if len(vbytes) >= 4:
+            break
+    raise MalformedDataError("Invalid variable-length number")
+
+
+def _read_bytes(byte_iter, length):
+    data = bytes(itertools.islice(byte_iter, length))
+    if len(data) != length:
+        raise MalformedDataError("Event data runs past end of chunk")
+    return data
+
+
+class TrackEvents(object):
+    """
+    The events of one MTrk chunk, stored as columns (arrays),
+    one entry per event:
+
+    ticks: absolute time of the event, in ticks
+    statuses: the status byte (with the channel nybble removed for
+        channel messages). META (0xFF) for meta events,
+        SYSEX (0xF0) or SYSEX_ESCAPE (0xF7) for sysex events
+    data1: the first data byte, or the type for meta events (else 0)
+    data2: the second data byte (else 0)
+    channels: the channel 0-15, or -1 for non-channel events
+    extras: dict of event index -> bytes, for the data of meta and
+        sysex events
+    """
+    __slots__ = ('ticks', 'statuses', 'data1', 'data2', 'channels', 'extras')
+
+    def __init__(self):
+        self.ticks = array.array('L')
+        self.statuses = array.array('B')
+        self.data1 = array.array('B')
+        self.data2 = array.array('B')
+        self.channels = array.array('b')
+        self.extras = {}
+
+    def __len__(self):
+        return len(self.statuses)
+
+    def _append(self, tick, status, data1, data2, channel, extra=None):
+        if extra is not None:
+            self.extras[len(self.statuses)] = extra
+        self.ticks.append(tick)
+        self.statuses.append(status)
+        self.data1.append(data1)
+        self.data2.append(data2)
+        self.channels.append(channel)
+
+    @property
+    def end_tick(self):
+        """The time of the final event (i.e. the length of the track)"""
+        if self.ticks:
+            return self.ticks[-1]
+        return 0
+
+    def count(self, status):
+        """Number of events with this status"""
+        return self.statuses.count(status)
+
+    def note_on_count(self):
+        """Number of note on events, not counting zero velocity"""
+        return sum(1 for s, v in zip(self.statuses, self.data2)
+                   if s == NOTE_ON and v)
+
+    def iter_indices(self, status, channel=None):
+        """Indices of the events with this status (and channel)"""
+        if channel is None:
+            return (i for i, s in enumerate(self.statuses) if s == status)
+        return (i for i, (s, c) in enumerate(zip(self.statuses, self.channels))
+                if s == status and c == channel)
+
+    def iter_meta(self, meta_type):
+        """Yields (tick, data) for the meta events of meta_type"""
+        for i in self.iter_indices(META):
+            if self.data1[i] == meta_type:
+                yield self.ticks[i], self.extras[i]
+
+    def iter_sysex(self):
+        """Yields (tick, data) for the sysex events"""
+        for i in self.iter_indices(SYSEX):
+            yield self.ticks[i], self.extras[i]
+
+
+def iter_raw_events(blocks):
+    """
+    Iterate over the events of an MTrk chunk from a sequence of blocks
+    (bytes-like objects, such as those from
+    SongDataBlockSystem.get_track_blocks), reading the blocks in turn
+    without joining them together.
+    Yields (delta, status, data) tuples, where:
+    delta is the delta time in ticks
+    status is the status byte (running status already applied)
+    data is a tuple of the data bytes for channel messages,
+    the bytes data for sysex events, or (meta type, bytes data)
+    for meta events.
+    Stops after the End of Track meta event.
+    MalformedDataError raised if the chunk is invalid.
+    """
+    byte_iter = itertools.chain.from_iterable(blocks)
+    tag, length = struct.unpack('>4sL', _read_bytes(byte_iter, 8))
+    if tag != b'MTrk':
+        raise MalformedDataError("Chunk start not found")
+    byte_iter = itertools.islice(byte_iter, length)
+
+    running = None
+    for b in byte_iter:
+        # delta time. (we've already got the first byte)
+        if b < 0x80:
+            delta = b
+        else:
+            delta = _read_variable_length(itertools.chain((b,), byte_iter))
+
+        status = next(byte_iter, None)
+        if status is None:
+            raise MalformedDataError("Event runs past end of chunk")
+
+        if status == META:
+            running = None
+            meta_type, = _read_bytes(byte_iter, 1)
+            data = _read_bytes(byte_iter, _read_variable_length(byte_iter))
+            yield delta, status, (meta_type, data)
+            if meta_type == META_END_OF_TRACK:
+                return
+        elif status == SYSEX or status == SYSEX_ESCAPE:
+            running = None
+            data = _read_bytes(byte_iter, _read_variable_length(byte_iter))
+            yield delta, status, data
+        else:
+            if status < 0x80:
+                # running status: this is actually the first data byte
+                if running is None:
+                    raise MalformedDataError("Running status not set")
+                data = (status,)
+                status = running
+            else:
+                data = ()
+                running = status
+            try:
+                dlen = _DATA_LENGTHS[status & 0xF0]
+            except KeyError:
+                raise MalformedDataError(f"Unexpected status {status:02X}")
+            data += tuple(_read_bytes(byte_iter, dlen - len(data)))
+            yield delta, status, data
+
+
+def decode_track_blocks(blocks):
+    """
+    Decode an MTrk chunk from a sequence of blocks (see iter_raw_events).
+    Returns a TrackEvents object.
+    MalformedDataError raised if the chunk is invalid.
+    """
+    events = TrackEvents()
+    append = events._append
+    tick = 0
+    for delta, status, data in iter_raw_events(blocks):
+        tick += delta
+        if status == META:
+            meta_type, mdata = data
+            append(tick, META, meta_type, 0, -1, mdata)
+        elif status == SYSEX or status == SYSEX_ESCAPE:
+            append(tick, status, 0, 0, -1, data)
+        elif len(data) == 1:
+            append(tick, status & 0xF0, data[0], 0, status & 0x0F)
+        else:
+            append(tick, status & 0xF0, data[0], data[1], status & 0x0F)
+    return events
+
+
+def _shift_octaves(note, octaves):
+    # shift, but keep it within range.
+    note += 12 * octaves
+    while note > 0x7F:
+        note -= 12
+    while note < 0x00:
+        note += 12
+    return note
+
+
+class OctaveCorrector(object):
+    """
+    Applies the main voice octave offsets to the channel events of a track,
+    one at a time, in order.
+
+    The DGX-505 records the Main Octave setting as a polyphonic aftertouch
+    message on note 0 (An 00 xx, xx = 0x40 + offset) instead of in the
+    notes themselves. Here, the notes on that channel following the message
+    are transposed by the offset.
+    Note offs are transposed the same as their note ons, even if the
+    octave changes in between.
+    """
+    def __init__(self):
+        self.octaves = [0] * 16
+        # (channel, original note) -> transposed note, for sounding notes.
+        self._sounding = {}
+
+    def correct(self, status, data):
+        """
+        Returns the data bytes of a channel event (status, data as from
+        iter_raw_events) with the octave applied,
+        or None for the octave messages themselves (which should be dropped).
+        """
+        kind = status & 0xF0
+        channel = status & 0x0F
+        if kind == POLYTOUCH and data[0] == 0x00:
+            # The octave message.
+            self.octaves[channel] = data[1] - 0x40
+            return None
+        if kind == NOTE_ON or kind == NOTE_OFF:
+            note, velocity = data
+            key = (channel, note)
+            if kind == NOTE_ON and velocity:
+                shifted = _shift_octaves(note, self.octaves[channel])
+                self._sounding[key] = shifted
+            else:
+                shifted = self._sounding.pop(
+                    key, _shift_octaves(note, self.octaves[channel]))
+            data = (shifted, velocity)
+        return data
+
+
+def correct_octaves(blocks):
+    """
+    Rewrite an MTrk chunk from a sequence of blocks (see iter_raw_events),
+    applying the main voice octave offsets to the notes
+    (see OctaveCorrector).
+    The octave messages are removed (their delta times carried over to the
+    next event).
+    Returns the new chunk as bytes (header included, length corrected).
+    """
+    corrector = OctaveCorrector()
+    out = bytearray(b'MTrk\0\0\0\0')
+    running = None
+    carry = 0
+    for delta, status, data in iter_raw_events(blocks):
+        if status < SYSEX:
+            data = corrector.correct(status, data)
+            if data is None:
+                carry += delta
+                continue
+        out += pack_variable_length(delta + carry)
+        carry = 0
+        if status == META:
+            running = None
+            meta_type, mdata = data
+            out.append(META)
+            out.append(meta_type)
+            out += pack_variable_length(len(mdata))
+            out += mdata
+            continue
+        elif status == SYSEX or status == SYSEX_ESCAPE:
+            running = None
+            out.append(status)
+            out += pack_variable_length(len(data))
+            out += data
+            continue
+        if status != running:
+            out.append(status)
+            running = status
+        out += bytes(data)
+    out[4:8] = struct.pack('>L', len(out) - 8)
+    return bytes(out)
+
+
+def iter_chord_changes(events):
+    """
+    Yields (tick, chord) for the chord change events in the events of a
+    time track (Track A), where chord is a chords.Chord,
+    or None if the chord bytes couldn't be interpreted.
+    """
+    # not needed for anything else here, so these are loaded on demand
+    from ..messages import exclusives
+    from ..messages.wrappers import SeqSpec
+    from ..tables import lookup
+    for tick, data in events.iter_meta(META_SEQSPEC):
+        matchdict = exclusives.SeqSpecMatcher.match(data)
+        if matchdict is None or matchdict['type'] is not SeqSpec.CHORD:
+            continue
+        try:
+            chord = lookup.chord_from_bytes(matchdict['chordbytes'])
+        except (KeyError, ValueError):
+            chord = None
+        yield tick, chord
@@ -0,0 +1,232 @@
+"""
+verify.py
+
+Checking that a syx file holds a complete, valid bulk dump,
+straight from the raw bytes.
+
+This does the same checks as DumpMessage, DumpSection and the format
+checks of SongData and RegData, but without making any message objects or
+decoding the payloads (apart from the few bytes holding the markers),
+so it's much quicker when that's all that's needed.
+"""
+
+import bisect
+import collections
+import re
+
+from ..util import YAMAHA, reconstitute
+from .messages import SongDumpSection, RegDumpSection
+from .songdata import SongData
+from .regdata import RegData
+
+# A complete sysex message. (the data bytes are group 1)
+_SYSEX_RE = re.compile(rb'\xF0([\x00-\x7F]*)\xF7')
+
+# Offsets in the message data (mido-style, i.e. without the F0 and F7)
+_HEADER_SLICE = slice(None, 5)
+_TYPE_INDEX = 5
+_PADDED_SIZE_SLICE = slice(6, 8)
+_UNPADDED_SIZE_SLICE = slice(8, 10)
+_RUN_SLICE = slice(10, 13)
+_PAYLOAD_START = 13
+_CHECK_START = 6
+_END_MARKER = b'\x7F\x7F\x7F'
+
+# What to expect of each section, in order:
+# (section class, expected size of the decoded data, [(slice, marker)])
+_SECTION_SPECS = collections.OrderedDict([
+    ('song', (SongDumpSection, SongData.EXPECTED_SIZE, [
+        (SongData.START_MARKER_SLICE, SongData.MARKER),
+        (slice(SongData.END_MARKER_SLICE.start, SongData.EXPECTED_SIZE),
+         SongData.MARKER),
+    ])),
+    ('reg', (RegDumpSection, RegData.EXPECTED_SIZE, [
+        (RegData.START_SLICE, RegData.BOOKEND),
+        (RegData.END_SLICE, RegData.BOOKEND),
+    ])),
+])
+
+SectionSummary = collections.namedtuple("SectionSummary",
+    "name section_byte count run")
+
+
+class VerifyReport(collections.namedtuple("VerifyReport",
+                                          "errors sections")):
+    """
+    The result of verify_dump_bytes.
+    errors: list of error descriptions (empty if valid)
+    sections: list of SectionSummary for the sections found
+    """
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+def _unpack_seven(data):
+    # (we already know all the bytes are below 0x80)
+    value = 0
+    for b in data:
+        value = (value << 7) | b
+    return value
+
+
+def _decode_range(data, starts, raw_starts, start, stop):
+    """
+    Decode the bytes [start:stop] of a section's decoded data,
+    reconstituting only the 8-byte groups covering them.
+    starts has the decoded offset where each message's payload starts
+    (plus the total size at the end), and raw_starts has the index in data
+    where each message's payload starts.
+    """
+    out = bytearray()
+    pos = start
+    i = bisect.bisect_right(starts, start) - 1
+    while pos < stop:
+        while pos >= starts[i+1]:
+            i += 1
+            if i + 1 >= len(starts):
+                # ran out of data
+                return bytes(out)
+        offset = pos - starts[i]
+        group = raw_starts[i] + offset // 7 * 8
+        decoded = reconstitute(data[group:group+8])
+        end = min(stop, starts[i+1]) - pos
+        piece = decoded[offset % 7:offset % 7 + end]
+        out += piece
+        pos += len(piece)
+    return bytes(out)
+
+
+def _verify_frames(data, sections, errors):
+    frames = _SYSEX_RE.finditer(data)
+    last_end = 0
+    # state for the current section
+    spec_iter = iter(_SECTION_SPECS.items())
+    current = None
+    header = None
+    for match in frames:
+        if data.find(b'\xF0', last_end, match.start()) >= 0:
+            errors.append(f"Broken message before offset {match.start()}")
+            return
+        last_end = match.end()
+        mstart, mend = match.span(1)
+        if data[mstart] != YAMAHA:
+            continue
+        if mend - mstart < _RUN_SLICE.stop:
+            errors.append(f"Message too short at offset {match.start()}")
+            return
+        if current is None:
+            try:
+                name, (section_class, size, markers) = next(spec_iter)
+            except StopIteration:
+                errors.append("Extra messages after the last section")
+                return
+            current = name
+            count = 0
+            run = 0
+            starts = []
+            raw_starts = []
+            decoded_size = 0
+            if header is None:
+                header = data[mstart:mstart+5]
+        count += 1
+        where = f"{current} section message {count}"
+        if data[mstart:mstart+5] != header:
+            errors.append(f"Header mismatch: {where}")
+            return
+        if data[mstart+_TYPE_INDEX] != section_class.SECTION_BYTE:
+            errors.append(f"Section mismatch: {where}")
+            return
+        zbytes = data[mstart+_RUN_SLICE.start:mstart+_RUN_SLICE.stop]
+        if zbytes == _END_MARKER:
+            # end of section.
+            if count != section_class.EXPECTED_COUNT:
+                errors.append(f"Wrong number of messages: {where}")
+            if run != section_class.EXPECTED_RUN:
+                errors.append(f"Wrong running total at end: {where}")
+            if decoded_size != size:
+                errors.append(f"Data wrong length: {current} section")
+            if errors:
+                return
+            starts.append(decoded_size)
+            for slc, marker in markers:
+                if _decode_range(data, starts, raw_starts,
+                                 slc.start, slc.stop) != marker:
+                    errors.append(f"Markers not present: {current} section")
+                    return
+            sections.append(SectionSummary(
+                current, section_class.SECTION_BYTE, count, run))
+            current = None
+            continue
+        if sum(data[mstart+_CHECK_START:mend]) % 0x80 != 0:
+            errors.append(f"Checksum invalid: {where}")
+            return
+        if _unpack_seven(zbytes) != run:
+            errors.append(f"Running count mismatch: {where}")
+            return
+        padded_size = _unpack_seven(
+            data[mstart+_PADDED_SIZE_SLICE.start:
+                 mstart+_PADDED_SIZE_SLICE.stop])
+        unpadded_size = _unpack_seven(
+            data[mstart+_UNPADDED_SIZE_SLICE.start:
+                 mstart+_UNPADDED_SIZE_SLICE.stop])
+        payload_start = mstart + _PAYLOAD_START
+        payload_end = mend - 1
+        if payload_end - payload_start != padded_size or padded_size % 8:
+            errors.append(f"Content length mismatch: {where}")
+            return
+        padding_size = padded_size - unpadded_size
+        if not (0 <= padding_size <= 6):
+            errors.append(f"Data size mismatch: {where}")
+            return
+        if padding_size:
+            lastbyte = data[payload_end-1]
+            if (sum(data[payload_end-1-padding_size:payload_end-1])
+                    + (lastbyte % 2**padding_size)) != 0:
+                errors.append(f"Padding bytes not clear: {where}")
+                return
+        starts.append(decoded_size)
+        raw_starts.append(payload_start)
+        decoded_size += padded_size // 8 * 7 - padding_size
+        run += padded_size
+    if data.find(b'\xF0', last_end) >= 0:
+        errors.append("Broken message at end")
+    elif current is not None:
+        errors.append(f"Section incomplete: {current} section")
+    elif len(sections) < len(_SECTION_SPECS):
+        errors.append("Section missing: "
+                      + ", ".join(list(_SECTION_SPECS)[len(sections):]))
+
+
+def verify_dump_bytes(data):
+    """
+    Check that data (the contents of a syx file, either binary or hex)
+    holds a complete, valid bulk dump (the song section then the
+    registration section).
+    Returns a VerifyReport.
+    """
+    if not data:
+        return VerifyReport(["Empty"], [])
+    if data[0] != 0xF0:
+        # hex. get rid of the whitespace.
+        try:
+            data = bytes.fromhex(data.translate(None, b' \t\n\r\f\v')
+                                 .decode('latin1'))
+        except ValueError:
+            return VerifyReport(["Not a syx file"], [])
+    else:
+        data = bytes(data)
+    errors = []
+    sections = []
+    _verify_frames(data, sections, errors)
+    return VerifyReport(errors, sections)
+
+
+def verify_dump_file(filename):
+    """
+    verify_dump_bytes, for the contents of the file.
+    """
+    with open(filename, 'rb') as infile:
+        return verify_dump_bytes(infile.read())
@@ -0,0 +1,219 @@
+"""
+dumpdiff.py
+
+Finding the differences between two bulk dumps.
+
+The raw data is compared range by range first, and only the songs, tracks
+and settings where the bytes differ get decoded and compared properly.
+"""
+import collections
+
+from .dumpdata.songdata import SongData
+from .dumpdata.regdata import RegData
+
+# The byte ranges of each section, for the first pass.
+SONG_RANGES = collections.OrderedDict([
+    ('songs', slice(SongData.SONGS_OFFSET, SongData.SONGS_OFFSET+1)),
+    ('mystery', SongData.MYSTERY_SLICE),
+    ('tracks', SongData.TRACKS_SLICE),
+    ('song durations', SongData.SONG_DURATION_SLICE),
+    ('track durations', SongData.TRACK_DURATION_SLICE),
+    ('preset styles', SongData.PRESETSTYLES_SLICE),
+    ('beginning blocks', SongData.BEGINNING_BLOCKS_SLICE),
+    ('next blocks', SongData.NEXT_BLOCKS_SLICE),
+    ('start marker', SongData.START_MARKER_SLICE),
+    ('block data', SongData.BLOCK_DATA_SLICE),
+    ('end marker', SongData.END_MARKER_SLICE),
+])
+
+REG_RANGES = collections.OrderedDict([
+    ('start', RegData.START_SLICE),
+    ('settings', RegData.SETTINGS_SLICE),
+    ('end', RegData.END_SLICE),
+])
+
+
+def changed_ranges(ranges, old_data, new_data):
+    """
+    List of the names of the ranges (an OrderedDict of name -> slice)
+    where the bytes of old_data and new_data differ.
+    """
+    return [name for name, slc in ranges.items()
+            if old_data[slc] != new_data[slc]]
+
+
+def _changes(pairs):
+    # OrderedDict of name -> [old, new] for the pairs that differ
+    return collections.OrderedDict(
+        (name, [old, new]) for name, old, new in pairs if old != new)
+
+
+def _song_meta(data, idx):
+    # The metadata bytes for song idx (zero based)
+    # (the song bit is checked separately)
+    return (data[SongData.TRACKS_SLICE][idx],
+            data[SongData.SONG_DURATION_SLICE][4*idx:4*(idx+1)],
+            data[SongData.TRACK_DURATION_SLICE][24*idx:24*(idx+1)],
+            data[SongData.BEGINNING_BLOCKS_SLICE][6*idx:6*(idx+1)])
+
+
+def _diff_track(old_track, new_track, old_events, new_events):
+    changes = _changes((name, getattr(old_track, name),
+                        getattr(new_track, name))
+                       for name in ('active', 'duration', 'size'))
+    data_changed = old_track.blocks != new_track.blocks
+    if not (changes or data_changed):
+        return None
+    record = collections.OrderedDict([
+        ('track', old_track.track),
+        ('name', old_track.name),
+        ('changes', changes),
+        ('data_changed', data_changed),
+    ])
+    if data_changed:
+        # only decode the tracks that actually changed.
+        def counts(events):
+            if events is None:
+                return (None, None)
+            return (len(events), events.note_on_count())
+        (old_count, old_notes), (new_count, new_notes) = (
+            counts(old_events), counts(new_events))
+        record['events'] = _changes((('events', old_count, new_count),
+                                     ('notes', old_notes, new_notes)))
+    return record
+
+
+def diff_song_data(old, new):
+    """
+    Compare two SongData objects.
+    Returns an OrderedDict:
+    ranges: the names of the SONG_RANGES where the bytes differ
+    songs: a list with one record (OrderedDict) for each song that differs,
+        with the changes in the song's values and each differing track.
+    """
+    old_data, new_data = old.data, new.data
+    ranges = changed_ranges(SONG_RANGES, old_data, new_data)
+    songs = []
+    if ranges:
+        blocks_changed = ('next blocks' in ranges or 'block data' in ranges)
+        song_bits = (old_data[SongData.SONGS_OFFSET]
+                     ^ new_data[SongData.SONGS_OFFSET])
+        for idx in range(5):
+            if not (blocks_changed
+                    or (song_bits >> idx) & 1
+                    or _song_meta(old_data, idx) != _song_meta(new_data, idx)):
+                continue
+            record = _diff_song(old[idx], new[idx])
+            if record is not None:
+                songs.append(record)
+    return collections.OrderedDict([('ranges', ranges), ('songs', songs)])
+
+
+def _diff_song(old_song, new_song):
+    changes = _changes((name, getattr(old_song, name),
+                        getattr(new_song, name))
+                       for name in ('active', 'duration', 'size'))
+    tracks = []
+    for idx, (old_track, new_track) in enumerate(
+            zip(old_song._tracks, new_song._tracks)):
+        if old_track.blocks != new_track.blocks:
+            old_events = old_song.events[idx]
+            new_events = new_song.events[idx]
+        else:
+            old_events = new_events = None
+        record = _diff_track(old_track, new_track, old_events, new_events)
+        if record is not None:
+            tracks.append(record)
+    if not (changes or tracks):
+        return None
+    return collections.OrderedDict([
+        ('number', old_song.number),
+        ('name', old_song.name),
+        ('changes', changes),
+        ('tracks', tracks),
+    ])
+
+
+def diff_reg_data(old, new):
+    """
+    Compare two RegData objects.
+    Returns an OrderedDict:
+    ranges: the names of the REG_RANGES where the bytes differ
+    settings: a list with one record (OrderedDict) for each setting that
+        differs, with the values (as strings) that changed.
+    """
+    ranges = changed_ranges(REG_RANGES, old.data, new.data)
+    settings = []
+    if 'settings' in ranges:
+        for (bank, button, old_bytes, _), (_, _, new_bytes, _) in zip(
+                old.iter_raw_values(), new.iter_raw_values()):
+            if old_bytes == new_bytes:
+                continue
+            old_setting = old.get_setting(bank, button)
+            new_setting = new.get_setting(bank, button)
+            settings.append(collections.OrderedDict([
+                ('bank', bank),
+                ('button', button),
+                ('changes', _changes(
+                    (key, str(old_setting[key].value),
+                     str(new_setting[key].value))
+                    for key in old_setting)),
+            ]))
+    return collections.OrderedDict([('ranges', ranges),
+                                    ('settings', settings)])
+
+
+def diff_dumps(old, new):
+    """
+    Compare two DgxDump objects.
+    Returns an OrderedDict with song_data and reg_data,
+    from diff_song_data and diff_reg_data,
+    or None where the section is missing from either dump.
+    """
+    if old.song_data and new.song_data:
+        song_diff = diff_song_data(old.song_data.songs, new.song_data.songs)
+    else:
+        song_diff = None
+    if old.reg_data and new.reg_data:
+        reg_diff = diff_reg_data(old.reg_data.settings, new.reg_data.settings)
+    else:
+        reg_diff = None
+    return collections.OrderedDict([('song_data', song_diff),
+                                    ('reg_data', reg_diff)])
+
+
+def _format_changes(changes, indent):
+    for name, (old, new) in changes.items():
+        yield f"{indent}{name}: {old} -> {new}"
+
+
+def format_diff(diff):
+    """
+    Yields the lines of a human-readable version of a diff_dumps result.
+    """
+    song_diff = diff['song_data']
+    if song_diff is None:
+        yield "Song data: not compared"
+    elif not song_diff['ranges']:
+        yield "Song data: no differences"
+    else:
+        yield "Song data: differs in " + ", ".join(song_diff['ranges'])
+        for song in song_diff['songs']:
+            yield f" {song['name']}:"
+            yield from _format_changes(song['changes'], "  ")
+            for track in song['tracks']:
+                yield f"  {track['name']}:"
+                yield from _format_changes(track['changes'], "   ")
+                if track['data_changed']:
+                    yield "   data changed"
+                    yield from _format_changes(track['events'], "   ")
+    reg_diff = diff['reg_data']
+    if reg_diff is None:
+        yield "Registration data: not compared"
+    elif not reg_diff['ranges']:
+        yield "Registration data: no differences"
+    else:
+        yield "Registration data: differs in " + ", ".join(reg_diff['ranges'])
+        for setting in reg_diff['settings']:
+            yield f" Bank {setting['bank']}, Button {setting['button']}:"
+            yield from _format_changes(setting['changes'], "  ")
@@ -0,0 +1,74 @@
+"""
+dumprecords.py
+
+Streaming the contents of bulk dumps as NDJSON (one JSON object per line),
+one record per dump, song, track and setting, written out as they're made
+instead of building the whole nested _cereal tree first.
+"""
+import collections
+import json
+
+
+def _record(rtype, source, items):
+    record = collections.OrderedDict([('type', rtype)])
+    if source is not None:
+        record['source'] = source
+    record.update(items)
+    return record
+
+
+def iter_dump_records(dump, source=None):
+    """
+    Yields the records (OrderedDicts) for a DgxDump, in order:
+    a 'dump' record, then for the song data each 'song' record followed
+    by its 'track' records, then a 'setting' record for each registration
+    setting (grouped by bank then button).
+    Every record has its type under 'type', and the source (e.g. the
+    filename) under 'source' if not None.
+    The songs and settings are decoded as they are reached.
+    """
+    yield _record('dump', source, [
+        ('song_data', dump.song_data is not None),
+        ('reg_data', dump.reg_data is not None),
+    ])
+    if dump.song_data is not None:
+        for song in dump.song_data.songs:
+            yield _record('song', source, song._cereal(tracks=False).items())
+            for track in song._cereal_tracks():
+                yield _record('track', source,
+                              [('song', song.number), *track.items()])
+    if dump.reg_data is not None:
+        for setting in dump.reg_data.settings.iter_settings():
+            yield _record('setting', source, [
+                ('bank', setting.bank),
+                ('button', setting.button),
+                ('values', setting._cereal()),
+            ])
+
+
+def error_record(source, error):
+    """
+    A record ('error' type) for a dump that couldn't be read.
+    """
+    return _record('error', source, [
+        ('error', type(error).__name__),
+        ('description', getattr(error, 'description', str(error))),
+    ])
+
+
+def write_ndjson(outfile, records, flush=False):
+    """
+    Write each record to the (text-mode) file object as one line of JSON,
+    as the records come in.
+    If flush, the file is flushed after each record.
+    Returns the number of records written.
+    """
+    count = 0
+    encode = json.JSONEncoder(separators=(',', ':')).encode
+    for record in records:
+        outfile.write(encode(record))
+        outfile.write('\n')
+        if flush:
+            outfile.flush()
+        count += 1
+    return count
@@ -0,0 +1,177 @@
+"""
+dumpstore.py
+
+Deduplicated on-disk storage for the bulk dumps.
+
+Each user song track chunk and each registration setting is stored once,
+as a file named by the hash of its contents, and a dump is kept as a
+manifest (JSON) of the hashes.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+from .exceptions import NotRecordedError
+from .dumpdata.songdata import SongData, midi_header
+from .dumpdata.songevents import correct_octaves
+from .dumpdata.regdata import RegSetting
+
+
+class DumpStore(object):
+    """
+    A directory of blobs and manifests:
+    root/blobs/ab/cdef...  the unique data, named by sha256 hash
+    root/manifests/NAME.json  the manifest for each dump
+
+    Manifest format:
+    {"song_data": {
+        "header": hash of the song section data before the blocks,
+        "songs": [{"info": UserSong._cereal(),
+                   "tracks": [[track number, hash], ...]}, ...]}
+     "reg_data": {"settings": [[bank, button, hash], ...]}}
+    with null for sections not present in the dump.
+    """
+    HASH = hashlib.sha256
+
+    def __init__(self, root):
+        self.root = root
+        self._blob_dir = os.path.join(root, 'blobs')
+        self._manifest_dir = os.path.join(root, 'manifests')
+        os.makedirs(self._blob_dir, exist_ok=True)
+        os.makedirs(self._manifest_dir, exist_ok=True)
+
+    # blobs
+    def _blob_path(self, digest):
+        return os.path.join(self._blob_dir, digest[:2], digest[2:])
+
+    @staticmethod
+    def _write_atomic(path, data, mode='wb'):
+        # write to a temporary file and move into place, so that
+        # a blob or manifest is never seen half-written.
+        dirname = os.path.dirname(path)
+        fd, tmp = tempfile.mkstemp(dir=dirname)
+        try:
+            with open(fd, mode) as outfile:
+                outfile.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def put_blob(self, data):
+        """
+        Store data (bytes-like) if not already stored.
+        Returns the hash (hex string).
+        """
+        digest = self.HASH(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._write_atomic(path, data)
+        return digest
+
+    def get_blob(self, digest):
+        """
+        The stored data for the hash, as bytes.
+        KeyError raised if not stored.
+        """
+        try:
+            with open(self._blob_path(digest), 'rb') as infile:
+                return infile.read()
+        except FileNotFoundError:
+            raise KeyError(digest)
+
+    # manifests
+    def _manifest_path(self, name):
+        if not name or os.sep in name or name.startswith('.'):
+            raise ValueError(f"Invalid name: {name!r}")
+        return os.path.join(self._manifest_dir, name + '.json')
+
+    def names(self):
+        """List of the names of the stored dumps"""
+        return sorted(f[:-len('.json')] for f in os.listdir(self._manifest_dir)
+                      if f.endswith('.json'))
+
+    def get_manifest(self, name):
+        """
+        The manifest of a stored dump.
+        KeyError raised if no dump with that name.
+        """
+        try:
+            with open(self._manifest_path(name), 'r') as infile:
+                return json.load(infile)
+        except FileNotFoundError:
+            raise KeyError(name)
+
+    def _song_manifest(self, song_data):
+        songs = song_data.songs
+        header = song_data.data[:SongData.BLOCK_DATA_SLICE.start]
+        song_list = []
+        for song in songs:
+            tracks = [[track.track, self.put_blob(b''.join(track.blocks))]
+                      for track in song._datatracks]
+            song_list.append({'info': song._cereal(), 'tracks': tracks})
+        return {'header': self.put_blob(header), 'songs': song_list}
+
+    def _reg_manifest(self, reg_data):
+        settings = [[bank, button, self.put_blob(data)]
+                    for bank, button, data, _
+                    in reg_data.settings.iter_raw_values()]
+        return {'settings': settings}
+
+    def add_dump(self, name, dump):
+        """
+        Store a DgxDump under name, replacing any with the same name.
+        Returns the manifest.
+        """
+        manifest = {
+            'song_data': (self._song_manifest(dump.song_data)
+                          if dump.song_data else None),
+            'reg_data': (self._reg_manifest(dump.reg_data)
+                         if dump.reg_data else None),
+        }
+        self._write_atomic(self._manifest_path(name),
+                           json.dumps(manifest, indent=1), 'w')
+        return manifest
+
+    # lookups
+    def song_tracks(self, name, number):
+        """
+        The [track number, hash] pairs for the recorded tracks of
+        user song number (1-5) of a stored dump.
+        """
+        if not (1 <= number <= 5):
+            raise ValueError("song number out of range")
+        song_data = self.get_manifest(name)['song_data']
+        if song_data is None:
+            raise KeyError(f"No song data in {name!r}")
+        return song_data['songs'][number-1]['tracks']
+
+    def song_midi(self, name, number, octave_correct=False):
+        """
+        The MIDI file for user song number (1-5) of a stored dump, as bytes.
+        NotRecordedError raised if the song isn't recorded.
+        """
+        tracks = self.song_tracks(name, number)
+        if not tracks:
+            raise NotRecordedError("Song not recorded")
+        chunks = [midi_header(len(tracks))]
+        for track, digest in tracks:
+            chunk = self.get_blob(digest)
+            if octave_correct and track != 0:
+                chunk = correct_octaves([chunk])
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def reg_setting(self, name, bank, button):
+        """
+        The RegSetting for a bank and button of a stored dump.
+        """
+        reg_data = self.get_manifest(name)['reg_data']
+        if reg_data is None:
+            raise KeyError(f"No registration data in {name!r}")
+        for sbank, sbutton, digest in reg_data['settings']:
+            if (sbank, sbutton) == (bank, button):
+                return RegSetting(bank, button, self.get_blob(digest))
+        raise ValueError(f"Invalid bank/button: {bank},{button}")
@@ -44,3 +44,11 @@ class MessageSequenceError(MessageError):
         else:
             msg = dmsg.message
         super().__init__(description, msg)
+
+
+class TransferTimeoutError(ExtractorError):
+    """
+    Exception raised when no data has come in for too long
+    while waiting for the rest of a transfer
+    """
+    pass
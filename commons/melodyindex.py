@@ -0,0 +1,309 @@
+"""
+melodyindex.py
+
+Finding the user songs that contain a melody.
+
+The notes of each track are boiled down to a melody (the highest note
+starting at each tick), and the intervals between successive notes are
+indexed as n-grams, so that the search doesn't depend on the key.
+The index is an sqlite database, mapping each n-gram to the places it
+appears (an inverted index). A query looks up its n-grams to find the
+candidates, and only those are checked against the whole query.
+"""
+import array
+import collections
+import contextlib
+import re
+import sqlite3
+
+from .exceptions import NotRecordedError
+from .dumpdata.songevents import NOTE_ON, decode_track_blocks, correct_octaves
+from .tempomap import TempoMap
+from .values import RootNote, enharmonia
+
+# number of intervals in an n-gram (i.e. n+1 notes)
+DEFAULT_N = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value
+);
+CREATE TABLE IF NOT EXISTS melodies (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    song INTEGER NOT NULL,
+    track INTEGER NOT NULL,
+    notes BLOB NOT NULL,
+    times BLOB NOT NULL,
+    UNIQUE (source, song, track)
+);
+CREATE TABLE IF NOT EXISTS grams (
+    gram BLOB NOT NULL,
+    melody INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (gram, melody, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS grams_melody ON grams (melody);
+"""
+
+# the times (in milliseconds) are stored as arrays of this type
+_TIME_TYPECODE = 'I'
+
+MelodyMatch = collections.namedtuple(
+    "MelodyMatch", "source song track position time transpose")
+
+_NOTE_RE = re.compile(r'([A-G](?:#|b|♯|♭)?)(-?\d+)$')
+
+
+def parse_note(name):
+    """
+    The note number for a note name with octave, e.g. 'C3' (60), 'F#4',
+    'Bb2' (octaves numbered as on the instrument, see values.NoteValue),
+    or a plain number.
+    ValueError raised if invalid.
+    """
+    if name.isdigit():
+        number = int(name)
+    else:
+        match = _NOTE_RE.match(name)
+        if match is None:
+            raise ValueError(f"Invalid note: {name!r}")
+        root, octave = match.groups()
+        number = (int(octave) + 2) * 12 + enharmonia(RootNote.from_name(root))
+        # (Cb and B# wrap around the octave)
+        if root[0] == 'C' and number % 12 == 11:
+            number -= 12
+        elif root[0] == 'B' and number % 12 == 0:
+            number += 12
+    if not 0 <= number <= 0x7F:
+        raise ValueError(f"Note out of range: {name!r}")
+    return number
+
+
+def track_melody(events):
+    """
+    The melody of a track, from its songevents.TrackEvents.
+    Returns (ticks, notes) arrays: the highest of the notes that start at
+    each tick, and the tick.
+    """
+    ticks = array.array('L')
+    notes = array.array('B')
+    for i in events.iter_indices(NOTE_ON):
+        if not events.data2[i]:
+            # (note off)
+            continue
+        tick = events.ticks[i]
+        note = events.data1[i]
+        if ticks and ticks[-1] == tick:
+            if note > notes[-1]:
+                notes[-1] = note
+        else:
+            ticks.append(tick)
+            notes.append(note)
+    return ticks, notes
+
+
+def intervals(notes):
+    """
+    The intervals between successive notes, as bytes (interval + 0x80,
+    which is always in 0x01-0xFF), so that the n-grams are just slices.
+    """
+    return bytes(b - a + 0x80 for a, b in zip(notes, notes[1:]))
+
+
+class MelodyIndex(object):
+    """
+    The melody index database at path (created if needed).
+    n: the number of intervals in the n-grams, only used when creating
+    (ValueError raised if it doesn't match an existing index).
+    Use as a context manager to commit the changes at the end
+    (or call commit).
+    """
+    def __init__(self, path, n=None):
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM settings WHERE key = 'n'").fetchone()
+        if row is None:
+            self.n = DEFAULT_N if n is None else n
+            if self.n < 1:
+                raise ValueError(f"Invalid n-gram size: {self.n}")
+            self._conn.execute(
+                "INSERT INTO settings VALUES ('n', ?)", (self.n,))
+        else:
+            self.n = row[0]
+            if n is not None and n != self.n:
+                raise ValueError(
+                    f"Index uses {self.n}-grams, not {n}-grams")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        self.close()
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+    def sources(self):
+        """List of the sources in the index"""
+        return [source for source, in self._conn.execute(
+            "SELECT DISTINCT source FROM melodies ORDER BY source")]
+
+    def remove_source(self, source):
+        """Remove everything indexed under source"""
+        self._conn.execute(
+            "DELETE FROM grams WHERE melody IN "
+            "(SELECT id FROM melodies WHERE source = ?)", (source,))
+        self._conn.execute(
+            "DELETE FROM melodies WHERE source = ?", (source,))
+
+    @contextlib.contextmanager
+    def _replacing(self, source):
+        # remove what's indexed under source, to index it again, in a
+        # savepoint: if the indexing fails, the source is left as it was
+        if not self._conn.in_transaction:
+            self._conn.execute("BEGIN")
+        self._conn.execute("SAVEPOINT replacing")
+        try:
+            self.remove_source(source)
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK TO replacing")
+            raise
+        finally:
+            self._conn.execute("RELEASE replacing")
+
+    def add_song(self, source, number, track_chunks, tempo_map=None):
+        """
+        Index the tracks of a song.
+        track_chunks: (track number, blocks) for each track
+        (as UserSong.track_blocks), Track A (0) being the time track.
+        tempo_map: the tempomap.TempoMap for the times of the notes,
+        by default made from Track A (wherever it is in track_chunks).
+        Returns the number of tracks indexed (the ones with notes).
+        """
+        track_chunks = list(track_chunks)
+        if tempo_map is None:
+            time_blocks = dict(track_chunks).get(0)
+            if time_blocks is None:
+                tempo_map = TempoMap()
+            else:
+                tempo_map = TempoMap.from_track_events(
+                    decode_track_blocks(time_blocks))
+        count = 0
+        for track, blocks in track_chunks:
+            if track == 0:
+                continue
+            events = decode_track_blocks([correct_octaves(blocks)])
+            ticks, notes = track_melody(events)
+            if not notes:
+                continue
+            times = array.array(
+                _TIME_TYPECODE,
+                (round(tempo_map.tick_to_seconds(tick) * 1000)
+                 for tick in ticks))
+            melody = self._conn.execute(
+                "INSERT INTO melodies (source, song, track, notes, times) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (source, number, track, notes.tobytes(), times.tobytes())
+            ).lastrowid
+            ivals = intervals(notes)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO grams VALUES (?, ?, ?)",
+                ((ivals[i:i+self.n], melody, i)
+                 for i in range(len(ivals) - self.n + 1)))
+            count += 1
+        return count
+
+    def add_songs(self, source, songs):
+        """
+        Index the user songs (e.g. from SongDumpSection.songs) under source,
+        replacing anything already there.
+        Returns the number of tracks indexed.
+        If there's an error partway through (e.g. MalformedDataError from
+        decoding a track), what was there before is left as it was.
+        """
+        count = 0
+        with self._replacing(source):
+            for song in songs:
+                try:
+                    track_chunks = song.track_blocks()
+                except NotRecordedError:
+                    continue
+                count += self.add_song(source, song.number, track_chunks,
+                                       song.tempo_map)
+        return count
+
+    def add_stored_dump(self, store, name):
+        """
+        Index the user songs of a dump in a dumpstore.DumpStore,
+        under its name, replacing anything already there.
+        Returns the number of tracks indexed.
+        KeyError raised if the dump or any of its tracks isn't in the
+        store (leaving what was there before as it was).
+        """
+        count = 0
+        with self._replacing(name):
+            for number in range(1, 5+1):
+                track_chunks = [(track, [store.get_blob(digest)])
+                                for track, digest
+                                in store.song_tracks(name, number)]
+                count += self.add_song(name, number, track_chunks)
+        return count
+
+    def _candidates(self, grams):
+        # the melodies having all the n-grams.
+        # (rarest first, so the set is smallest from the start)
+        counts = sorted(
+            (self._conn.execute("SELECT COUNT(*) FROM grams WHERE gram = ?",
+                                (gram,)).fetchone()[0], gram)
+            for gram in grams)
+        candidates = None
+        for _, gram in counts:
+            found = {melody for melody, in self._conn.execute(
+                "SELECT DISTINCT melody FROM grams WHERE gram = ?", (gram,))}
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, notes):
+        """
+        Find the melody (a sequence of note numbers, at least n+1 of them)
+        in any key.
+        Returns a list of MelodyMatch, for each place it's found:
+        source, song and track; position, the index of the first note
+        in the track's melody; time, when the first note starts,
+        in milliseconds; transpose, how many semitones the found melody is
+        above the query.
+        """
+        query = intervals(notes)
+        if len(query) < self.n:
+            raise ValueError(f"At least {self.n+1} notes needed")
+        grams = {query[i:i+self.n] for i in range(len(query) - self.n + 1)}
+        candidates = self._candidates(grams)
+        matches = []
+        for melody in sorted(candidates):
+            source, song, track, mnotes, mtimes = self._conn.execute(
+                "SELECT source, song, track, notes, times FROM melodies "
+                "WHERE id = ?", (melody,)).fetchone()
+            times = array.array(_TIME_TYPECODE, mtimes)
+            # check the whole query, where the first n-gram is
+            positions = self._conn.execute(
+                "SELECT position FROM grams WHERE gram = ? AND melody = ? "
+                "ORDER BY position", (query[:self.n], melody))
+            ivals = intervals(mnotes)
+            for position, in positions:
+                if ivals[position:position+len(query)] == query:
+                    matches.append(MelodyMatch(
+                        source, song, track, position, times[position],
+                        mnotes[position] - notes[0]))
+        matches.sort()
+        return matches
@@ -42,7 +42,7 @@ from .wrappers import (
     RpnDataCombo, NoteEvent, bonus_strings, Bonus, GuideTracks,
     WrappedMessage, WrappedChannelMessage, WrappedProgramChangeMessage)
 from . import exclusives
-from ..tables import voices, styles, chords
+from ..tables import lookup
 from .. import util
 
 
@@ -259,7 +259,7 @@ class ChannelState(MidiState):
 
     def _change_program(self, program):
         msb, lsb = self.bank()
-        voice = voices.from_bank_program_default(msb, lsb, program)
+        voice = lookup.voice_from_bank_program_default(msb, lsb, program)
         if voice is not None:
             self[MessageType.PROGRAM_CHANGE] = voice
         return voice
@@ -654,7 +654,7 @@ class MidiControlState(MidiState):
     def _handle_chord(self, message, type, chordbytes):
         # We use SeqSpec.CHORD as the slot.
         try:
-            value = chords.byte_chord(chordbytes)
+            value = lookup.chord_from_bytes(chordbytes)
         except (KeyError, ValueError):
             value = None
         self[SeqSpec.CHORD] = value
@@ -671,7 +671,7 @@ class MidiControlState(MidiState):
         assert type is SeqSpec.STYLE
         # ss is the style number, minus 1.
         try:
-            value = styles.from_number(ss+1)
+            value = lookup.style_from_number(ss+1)
             bonus = None
         except KeyError:
             value = None
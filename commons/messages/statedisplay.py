@@ -0,0 +1,118 @@
+"""
+statedisplay.py
+
+Displaying the state of a MidiControlState as a screenful of text,
+and keeping it up to date from a port's callback thread.
+"""
+
+import threading
+
+from .controlstate import MidiControlState
+from .wrappers import MessageType, Control, Rpn, SysEx, SeqSpec, Special
+
+# Each column: (heading, key, width)
+CHANNEL_COLUMNS = (
+    ("Vol", Control.VOLUME, 3),
+    ("Exp", Control.EXPRESSION, 3),
+    ("Pan", Control.PAN, 3),
+    ("Rev", Control.REVERB, 3),
+    ("Cho", Control.CHORUS, 3),
+    ("Ped", Control.PEDAL, 3),
+    ("Oct", Special.OCTAVE, 3),
+    ("PBR", Rpn.PITCH_BEND_RANGE, 3),
+    ("Fine", Rpn.FINE_TUNE, 4),
+    ("Crse", Rpn.COARSE_TUNE, 4),
+    ("Bend", MessageType.PITCHWHEEL, 5),
+)
+
+VOICE_WIDTH = 30
+
+BLANK_VALUE = "-"
+
+
+def _value_string(value):
+    if value is None:
+        return BLANK_VALUE
+    return str(value)
+
+
+def render_state(state):
+    """
+    The lines of text (without line breaks) displaying the state of a
+    MidiControlState: the instrument settings and song settings,
+    then one line per channel.
+    """
+    def v(key):
+        return _value_string(state[key])
+
+    lines = [
+        f"Master Volume: {v(SysEx.MASTER_VOL)}  "
+        f"Master Tuning: {v(SysEx.MASTER_TUNE)}  "
+        f"Reverb: {v(SysEx.REVERB_TYPE)}  "
+        f"Chorus: {v(SysEx.CHORUS_TYPE)}  "
+        f"Local: {v(Control.LOCAL)}",
+        f"Style: {v(SeqSpec.STYLE)}  "
+        f"Style Volume: {v(SeqSpec.STYLE_VOL)}  "
+        f"Section: {v(SeqSpec.SECTION)}  "
+        f"Chord: {v(SeqSpec.CHORD)}  "
+        f"Tempo: {v(MessageType.TEMPO)}",
+        "",
+    ]
+    heading = " ".join(f"{name:>{width}}"
+                       for name, _, width in CHANNEL_COLUMNS)
+    lines.append(f"Ch {'Voice':<{VOICE_WIDTH}} {heading}")
+    for number, channel in enumerate(state.channels, 1):
+        voice = channel[MessageType.PROGRAM_CHANGE]
+        if voice is None:
+            voice_string = BLANK_VALUE
+        else:
+            voice_string = str(voice)
+        values = " ".join(
+            f"{_value_string(channel[key]):>{width}}"
+            for _, key, width in CHANNEL_COLUMNS)
+        lines.append(f"{number:>2} "
+                     f"{voice_string[:VOICE_WIDTH]:<{VOICE_WIDTH}} {values}")
+    return lines
+
+
+class StateMonitor(object):
+    """
+    Keeps a MidiControlState, fed from the callback thread with feed,
+    and rendered from another (at its own pace) with render_changed.
+    Any number of messages can come in between renders;
+    only the latest state is rendered.
+    """
+    def __init__(self, state=None):
+        if state is None:
+            state = MidiControlState(wrap_notes=False)
+        self.state = state
+        self.message_count = 0
+        self._lock = threading.Lock()
+        # so that the first render_changed always renders.
+        self._changed = True
+
+    def feed(self, message):
+        """
+        Feed a message to the state (e.g. as a port callback).
+        """
+        with self._lock:
+            self.message_count += 1
+            if self.state.feed(message) is not None:
+                self._changed = True
+
+    def render(self):
+        """The lines for the current state (see render_state)"""
+        with self._lock:
+            self._changed = False
+            return render_state(self.state)
+
+    def render_changed(self):
+        """
+        The lines for the current state if it has changed since the last
+        render, else None.
+        """
+        with self._lock:
+            if not self._changed:
+                return None
+            self._changed = False
+            return render_state(self.state)
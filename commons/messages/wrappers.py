@@ -13,12 +13,13 @@ from ..util import twohex, hexspace
 
 class _LongformEnum(enum.Enum):
     def __str__(self):
-        return _LONGFORM_MAP.get(self, super().__str__())
+        # (the display strings are all worked out in advance, see below)
+        return _DISPLAY_STRINGS[self]
 
 
 class _StringValueEnum(enum.Enum):
     def __str__(self):
-        return str(self.value)
+        return _DISPLAY_STRINGS[self]
 
 
 class MessageType(_LongformEnum):
@@ -155,6 +156,21 @@ _LONGFORM_MAP = {
     Rpn.NULL:                   "Null",
 }
 
+# The display strings for every member of the enums, so that str()
+# is just a dict lookup.
+_DISPLAY_STRINGS = {}
+for _enum_class in (MessageType, Control, Rpn):
+    for _member in _enum_class:
+        _DISPLAY_STRINGS[_member] = _LONGFORM_MAP.get(
+            _member, enum.Enum.__str__(_member))
+for _enum_class in (SysEx, SeqSpec, Special):
+    for _member in _enum_class:
+        _DISPLAY_STRINGS[_member] = str(_member.value)
+del _enum_class, _member
+
+# "0 " to "F "
+_CHANNEL_PREFIXES = tuple(f"{channel:X} " for channel in range(16))
+
 
 class UnknownControl(namedtuple('UnknownControl', 'value')):
     __slots__ = ()
@@ -244,9 +260,9 @@ class WrappedMessage(namedtuple('WrappedMessage', 'message wrap_type value bonus
         return super().__new__(cls, message, wrap_type, value, bonus)
 
     def __str__(self):
-        return " ".join(
+        return " ".join([
             str(i) for i in (self.wrap_type, self.value, self.bonus)
-            if i is not None)
+            if i is not None])
 
     def __repr__(self):
         return f"<{self!s} {self.message!r}>"
@@ -259,7 +275,7 @@ class WrappedChannelMessage(WrappedMessage):
         return self.message.channel
 
     def __str__(self):
-        return f"{self.channel:X} {super().__str__()}"
+        return _CHANNEL_PREFIXES[self.message.channel] + super().__str__()
 
 class WrappedProgramChangeMessage(WrappedChannelMessage):
 
@@ -269,7 +285,8 @@ class WrappedProgramChangeMessage(WrappedChannelMessage):
 
     def __str__(self):
         voice_string = self.value.voice_string_extended()
-        s = f"{self.channel:X} {self.wrap_type!s} {voice_string}"
+        s = (f"{_CHANNEL_PREFIXES[self.message.channel]}"
+             f"{self.wrap_type!s} {voice_string}")
         if self.bonus is not None:
             s += f" {self.bonus!s}"
         return s
\ No newline at end of file
@@ -3,13 +3,18 @@ mido_util.py
 
 utilities for working with mido ports and messages
 """
-import logging
+import binascii
 import contextlib
+import itertools
+import logging
+import os
+import select
 
 import mido
 import mido.ports
 
 from . import util
+from .exceptions import TransferTimeoutError
 
 
 def guess_portname(fragment, portlist):
@@ -127,36 +132,186 @@ def read_syx_file(infile):
     """
     data = infile.read()
     parser = mido.Parser()
-    if data[0] == 0xF0:
-        parser.feed(data)
-    else:
-        # get rid of non-space whitespace
-        text = data.translate(None, b'\t\n\r\f\v').decode('latin1')
-        parser.feed(bytes.fromhex(text))
+    parser.feed(_syx_bytes(data))
     return iter(parser)
 
 
-# this was probably a bad idea
-def read_syx_file_gen(infile, n=1024):
-    parser = mido.Parser()
-    data = infile.read1(n)
+_WHITESPACE = b' \t\n\r\f\v'
+
+# the longest incomplete sysex message kept while reading chunks
+# (the bulk dump messages are just over 2 KB)
+MAX_SYSEX_FRAME = 0x1000
+
+
+def _syx_bytes(data):
+    # binary or hex, as bytes
     if data[0] == 0xF0:
-        while data:
-            parser.feed(data)
-            yield from parser
-            data = infile.read1(n)
+        return data
+    # get rid of non-space whitespace
+    text = data.translate(None, b'\t\n\r\f\v').decode('latin1')
+    return bytes.fromhex(text)
+
+
+def scan_sysex_frames(data, sections=None):
+    """
+    Find the Yamaha sysex messages in binary data without parsing them,
+    yielding (start, end) for each complete message (F0 to F7 inclusive).
+    If sections is given (a collection of section bytes, e.g. 0x0A for the
+    song section of a bulk dump), only the messages with one of those
+    section bytes are yielded, and the others are skipped over.
+    """
+    # index of the section byte (after F0, and the 5 header bytes)
+    section_index = 6
+    find = data.find
+    start = find(b'\xF0')
+    while start >= 0:
+        end = find(b'\xF7', start)
+        if end < 0:
+            break
+        end += 1
+        # a message interrupted by another F0 is broken
+        restart = find(b'\xF0', start+1, end)
+        if restart >= 0:
+            start = restart
+            continue
+        if (end - start > section_index + 1
+                and data[start+1] == util.YAMAHA
+                and (sections is None
+                     or data[start+section_index] in sections)):
+            yield start, end
+        start = find(b'\xF0', end)
+
+
+def decode_hex_chunks(chunks):
+    """
+    Decode hexadecimal text from an iterable of chunks (bytes, e.g. read
+    from a binary mode file), yielding the decoded bytes for each chunk.
+    Whitespace is ignored, even between the two digits of a byte
+    (a digit left over at the end of a chunk is carried over to the next).
+    ValueError raised for anything else that isn't hex,
+    or if there's an odd number of digits.
+    """
+    carry = b''
+    for chunk in chunks:
+        digits = carry + chunk.translate(None, _WHITESPACE)
+        if len(digits) % 2:
+            carry = digits[-1:]
+            digits = digits[:-1]
+        else:
+            carry = b''
+        try:
+            yield binascii.unhexlify(digits)
+        except binascii.Error as e:
+            raise ValueError(str(e))
+    if carry:
+        raise ValueError("Odd number of hex digits")
+
+
+def iter_fd_chunks(fd, n=0x10000, timeout=None):
+    """
+    Read from a file descriptor (e.g. a pipe, like stdin) as the data comes
+    in, yielding each chunk (of up to n bytes) as soon as it's read, instead
+    of waiting for n bytes or EOF.
+    TransferTimeoutError raised if nothing comes in for timeout seconds
+    (None to wait forever).
+    """
+    while True:
+        if timeout is not None:
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                raise TransferTimeoutError(
+                    f"No data received for {timeout} seconds")
+        chunk = os.read(fd, n)
+        if not chunk:
+            return
+        yield chunk
+
+
+def decode_syx_chunks(chunks):
+    """
+    Turn an iterable of chunks of a binary or hex syx file into
+    chunks of binary data.
+    """
+    chunks = iter(chunks)
+    for first in chunks:
+        # (we can't tell what it is from just whitespace)
+        if first.strip():
+            break
     else:
-        line = data + infile.readline()
-        while line:
-            text = line.translate(None, b'\t\n\r\f\v').decode('latin1')
-            parser.feed(bytes.fromhex(text))
-            yield from parser
-            line = infile.readline()
+        return
+    chunks = itertools.chain((first,), chunks)
+    if first.lstrip()[:1] == b'\xF0':
+        yield from chunks
+    else:
+        yield from decode_hex_chunks(chunks)
+
+
+def iter_syx_chunks(infile, n=0x10000):
+    """
+    Read a binary or hex syx file from a binary mode file object in chunks
+    of (up to) n bytes, yielding the binary data for each chunk.
+    """
+    return decode_syx_chunks(iter(lambda: infile.read(n), b''))
+
+
+def iter_sysex_frames(chunks, sections=None):
+    """
+    Reassemble the Yamaha sysex messages (as scan_sysex_frames) from an
+    iterable of chunks of binary data, yielding each complete message as
+    bytes (F0 to F7 inclusive), as soon as its last chunk comes in.
+    Only an incomplete message is kept between chunks, and it's dropped
+    once it's longer than MAX_SYSEX_FRAME bytes.
+    """
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        if b'\xF7' in chunk:
+            for start, end in scan_sysex_frames(buf, sections):
+                yield bytes(buf[start:end])
+        # keep the message still coming in, if any
+        last = buf.rfind(b'\xF0')
+        if (last >= 0 and buf.find(b'\xF7', last) < 0
+                and len(buf) - last <= MAX_SYSEX_FRAME):
+            del buf[:last]
+        else:
+            buf.clear()
+
+
+def iter_syx_messages(chunks, sections=None):
+    """
+    Parse the Yamaha sysex messages from an iterable of chunks of a binary
+    or hex syx file (see decode_syx_chunks and iter_sysex_frames),
+    yielding each mido Message as soon as it's complete.
+    sections: only parse the messages with these section bytes
+    (see scan_sysex_frames).
+    """
+    parser = mido.Parser()
+    for frame in iter_sysex_frames(decode_syx_chunks(chunks), sections):
+        parser.feed(frame)
+        yield from parser
+
+
+def read_syx_file_gen(infile, n=0x10000, sections=None):
+    """
+    Read in the Yamaha sysex messages from a binary or hex syx file,
+    a chunk at a time (see iter_syx_messages),
+    so the memory used doesn't depend on the size of the file.
+    Takes a binary mode file object.
+    Generator, yields mido Messages.
+    """
+    return iter_syx_messages(iter(lambda: infile.read(n), b''), sections)
 
 
 # read in messages
 @contextlib.contextmanager
-def read_messages_file(filename, mfile=False, log=__name__):
+def read_messages_file(filename, mfile=False, log=__name__, sections=None,
+                       timeout=None):
+        """
+        sections: only read the sysex messages for these section bytes
+        (syx files only. See read_syx_file_gen)
+        timeout: for syx from stdin, raise TransferTimeoutError if nothing
+        comes in for this many seconds
+        """
         logger = logging.getLogger(log)
         # if args.sfile or args.mfile:
         if mfile:
@@ -166,13 +321,20 @@ def read_messages_file(filename, mfile=False, log=__name__):
         else:  # args.sfile
             file_form = "syx"
             file_mode = "rb"
-            mfunc = read_syx_file
+
+            def mfunc(infile):
+                return read_syx_file_gen(infile, sections=sections)
         if filename == '-':
             # stdin
-            # Needs EOF.
-            # to do it better, we could do it asynchronously somehow
             file_display = "stdin"
             file_context = util.nonclosing_stdstream(file_mode)
+            if not mfile:
+                # read syx straight from the pipe, as it comes in,
+                # so the messages don't have to wait for EOF.
+                def mfunc(infile):
+                    return iter_syx_messages(
+                        iter_fd_chunks(infile.fileno(), timeout=timeout),
+                        sections)
         else:
             file_display = f"file {filename!r}"
             file_context = open(filename, file_mode)
@@ -0,0 +1,180 @@
+"""
+playback.py
+
+Playing a user song straight out of a dump, to a MIDI port.
+
+The events of each track are read from the song's blocks as they're
+needed (without making a MIDI file first), merged in time order and
+timed using the song's tempo map, so playback can start as soon as the
+song section has been read, from any measure.
+"""
+
+import time
+
+import mido
+
+from .dumpdata import songevents
+from .trackmerge import END_OF_TRACK, merge_track_records
+
+
+def iter_track_records(blocks, track_number=0, octave_correct=True):
+    """
+    Yields (tick, track_number, message) for the events of a track, read
+    from its blocks (see songevents.iter_raw_events) as they're needed.
+    The meta events are left out, except for the end of track
+    (as trackmerge.END_OF_TRACK).
+    If octave_correct, the main voice octave is applied to the notes
+    (see songevents.OctaveCorrector).
+    """
+    corrector = songevents.OctaveCorrector() if octave_correct else None
+    tick = 0
+    for delta, status, data in songevents.iter_raw_events(blocks):
+        tick += delta
+        if status == songevents.META:
+            if data[0] == songevents.META_END_OF_TRACK:
+                yield tick, track_number, END_OF_TRACK
+            continue
+        elif status == songevents.SYSEX:
+            # (the stored data ends with the F7)
+            if data.endswith(b'\xF7'):
+                data = data[:-1]
+            message = mido.Message('sysex', data=data)
+        elif status == songevents.SYSEX_ESCAPE:
+            # can't be sent as a message on its own
+            continue
+        else:
+            if corrector is not None:
+                data = corrector.correct(status, data)
+                if data is None:
+                    continue
+            message = mido.Message.from_bytes((status,) + data)
+        yield tick, track_number, message
+
+
+def iter_song_records(song, tracks=None, octave_correct=True):
+    """
+    Yields (tick, track number, message) for the whole song, in time order
+    (as trackmerge.merge_track_records, so ending with END_OF_TRACK).
+    tracks: the track numbers (0 = Track A, 1-5) to play, default all.
+    NotRecordedError raised if the song isn't recorded.
+    """
+    # (Track A has no notes, so it's left alone)
+    return merge_track_records(
+        [iter_track_records(blocks, number, octave_correct and number != 0)
+         for number, blocks in song.track_blocks()
+         if tracks is None or number in tracks])
+
+
+# the parameter number controllers (MSB, LSB) of the registered and
+# the non-registered parameters
+_PARAMETER_NUMBERS = {101: (101, 100), 100: (101, 100),
+                      99: (99, 98), 98: (99, 98)}
+# the controllers that set the selected parameter: data entry MSB,
+# and the LSB, increment and decrement that can follow it
+_DATA_ENTRY_MSB = 6
+_DATA_ENTRY = frozenset((6, 38, 96, 97))
+
+
+def chase_records(records, start_tick):
+    """
+    Yields the records from start_tick on, after the messages needed to
+    bring the instrument into the state it would be in at start_tick
+    had the song been played from the start (the sysex messages, then the
+    last of each controller, the data entry for each parameter (RPN or
+    NRPN) after its parameter number, the parameter number last selected,
+    and the last program change and pitchwheel on each channel),
+    all at start_tick.
+    The notes before start_tick are skipped.
+    """
+    sysex = []
+    # (channel, control) -> record, channel -> record
+    controls = {}
+    numbers = {}
+    programs = {}
+    pitchwheels = {}
+    # channel -> the parameter number controllers last used
+    selected = {}
+    # (channel, parameter number) -> (number records, data entry records)
+    parameters = {}
+    records = iter(records)
+    for record in records:
+        tick, track_number, message = record
+        if tick >= start_tick or message is END_OF_TRACK:
+            break
+        if message.type == 'sysex':
+            sysex.append(record)
+        elif message.type == 'control_change':
+            channel, control = message.channel, message.control
+            if control in _PARAMETER_NUMBERS:
+                numbers[channel, control] = record
+                selected[channel] = _PARAMETER_NUMBERS[control]
+            elif control in _DATA_ENTRY and channel in selected:
+                number = tuple(numbers[channel, c] for c in selected[channel]
+                               if (channel, c) in numbers)
+                key = (channel, tuple((m.control, m.value)
+                                      for _, _, m in number))
+                # (increments and decrements go from the last data entry)
+                if control == _DATA_ENTRY_MSB or key not in parameters:
+                    parameters[key] = (number, [])
+                parameters[key][1].append(record)
+            else:
+                controls[channel, control] = record
+        elif message.type == 'program_change':
+            programs[message.channel] = record
+        elif message.type == 'pitchwheel':
+            pitchwheels[message.channel] = record
+    else:
+        return
+    parameter_records = [r for number, data in parameters.values()
+                         for r in number + tuple(data)]
+    selected_records = [numbers[channel, c]
+                        for channel, pair in selected.items()
+                        for c in pair if (channel, c) in numbers]
+    for group in (sysex, controls.values(), parameter_records,
+                  selected_records, programs.values(), pitchwheels.values()):
+        for _, chased_track, chased in group:
+            yield start_tick, chased_track, chased
+    yield max(tick, start_tick), track_number, message
+    yield from records
+
+
+def iter_song_playback(song, start_measure=1, tracks=None,
+                       octave_correct=True, speedup=1):
+    """
+    Yields (seconds, message) for playing the song from the start of
+    start_measure (numbered from 1), where seconds is the time from the
+    start of the playback (according to the tempo map of the song, sped up
+    by speedup).
+    The last message is END_OF_TRACK, at the end of the song.
+    ValueError raised if start_measure is past the end of the song.
+    NotRecordedError raised if the song isn't recorded.
+    """
+    if speedup <= 0:
+        raise ValueError("Speedup must be positive!")
+    records = iter_song_records(song, tracks, octave_correct)
+    if start_measure > max(song.duration, 1):
+        raise ValueError(f"Song is only {song.duration} measures long")
+    tempo_map = song.tempo_map
+    start_tick = tempo_map.measure_to_tick(start_measure)
+    start_seconds = tempo_map.tick_to_seconds(start_tick)
+    if start_tick:
+        records = chase_records(records, start_tick)
+    for tick, _, message in records:
+        seconds = tempo_map.tick_to_seconds(tick) - start_seconds
+        yield seconds / speedup, message
+
+
+def play(port, timed_messages, clock=time.perf_counter, sleep=time.sleep):
+    """
+    Send the messages of (seconds, message) pairs to the port,
+    each at its time from the start
+    (timed against the clock from the start, so the delays don't add up).
+    Meta messages aren't sent (but are waited for).
+    """
+    start = clock()
+    for seconds, message in timed_messages:
+        delay = start + seconds - clock()
+        if delay > 0:
+            sleep(delay)
+        if not message.is_meta:
+            port.send(message)
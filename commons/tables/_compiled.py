@@ -0,0 +1,694 @@
+"""
+_compiled.py
+
+Generated by table_build.py from the CSV tables. Do not edit.
+"""
+
+# sha256 of the CSV files these were built from
+DIGESTS = {
+    'tables/voices.csv': '4f9ae0f3f239a6ce46054e1c0dda632a7833ea42900111f1e13ca8ef9c0577bb',
+    'tables/styles.csv': 'c1a40d902ec3397e225936a99b2abfdc9440033d251510262c79f02f8b6b2560',
+    'tables/chords.csv': '0bccd0906ac9ec4d31aaa3b9d4d5acc8cf17d0c1f4da552a235c07e1d9a23635',
+}
+
+TABLES = {
+    'tables/voices.csv': (
+        (1, 'Live! Grand Piano', '', 'PIANO', 0, 113, 0),
+        (2, 'Live! Warm Grand', 'Live! Warm Grand Piano', 'PIANO', 0, 114, 0),
+        (3, 'Grand Piano', '', 'PIANO', 0, 112, 0),
+        (4, 'Bright Piano', '', 'PIANO', 0, 112, 1),
+        (5, 'Honky-tonk Piano', '', 'PIANO', 0, 112, 3),
+        (6, 'MIDI Grand Piano', '', 'PIANO', 0, 112, 2),
+        (7, 'CP 80', '', 'PIANO', 0, 113, 2),
+        (8, 'Harpsichord', '', 'PIANO', 0, 112, 6),
+        (9, 'Cool! Galaxy EP', 'Cool! Galaxy Electric Piano', 'E.PIANO', 0, 114, 4),
+        (10, 'Cool! Suitcase EP', 'Cool! Suitcase Electric Piano', 'E.PIANO', 0, 118, 4),
+        (11, 'Cool! E.Piano', 'Cool! Electric Piano', 'E.PIANO', 0, 119, 4),
+        (12, 'Funky E.Piano', 'Funky Electric Piano', 'E.PIANO', 0, 112, 4),
+        (13, 'DX Modern E.Piano', 'DX Modern Electric Piano', 'E.PIANO', 0, 112, 5),
+        (14, 'Hyper Tines', '', 'E.PIANO', 0, 113, 5),
+        (15, 'Venus E.Piano', 'Venus Electric Piano', 'E.PIANO', 0, 114, 5),
+        (16, 'E.Clavichord', '', 'E.PIANO', 0, 114, 7),
+        (17, 'Clavi', '', 'E.PIANO', 0, 112, 7),
+        (18, 'Cool! Organ', '', 'ORGAN', 0, 118, 18),
+        (19, 'Jazz Organ 1', '', 'ORGAN', 0, 112, 16),
+        (20, 'Jazz Organ 2', '', 'ORGAN', 0, 113, 16),
+        (21, 'Click Organ', '', 'ORGAN', 0, 112, 17),
+        (22, 'Bright Organ', '', 'ORGAN', 0, 116, 16),
+        (23, 'Rock Organ', '', 'ORGAN', 0, 112, 18),
+        (24, 'Purple Organ', '', 'ORGAN', 0, 114, 18),
+        (25, "16'+2' Organ", '', 'ORGAN', 0, 118, 16),
+        (26, "16'+4' Organ", '', 'ORGAN', 0, 119, 16),
+        (27, 'Theater Organ', '', 'ORGAN', 0, 114, 16),
+        (28, 'Church Organ', '', 'ORGAN', 0, 112, 19),
+        (29, 'Chapel Organ', '', 'ORGAN', 0, 113, 19),
+        (30, 'Reed Organ', '', 'ORGAN', 0, 112, 20),
+        (31, 'Trad Accordion', 'Traditional Accordion', 'ACCORDION', 0, 113, 21),
+        (32, 'Musette Accordion', '', 'ACCORDION', 0, 112, 21),
+        (33, 'Bandoneon', '', 'ACCORDION', 0, 113, 23),
+        (34, 'Harmonica', '', 'ACCORDION', 0, 112, 22),
+        (35, 'Classical Guitar', '', 'GUITAR', 0, 112, 24),
+        (36, 'Folk Guitar', '', 'GUITAR', 0, 112, 25),
+        (37, '12Strings Guitar', '', 'GUITAR', 0, 113, 25),
+        (38, 'Jazz Guitar', '', 'GUITAR', 0, 112, 26),
+        (39, 'Octave Guitar', '', 'GUITAR', 0, 113, 26),
+        (40, 'Clean Guitar', '', 'GUITAR', 0, 112, 27),
+        (41, "60's Clean Guitar", '', 'GUITAR', 0, 117, 27),
+        (42, 'Muted Guitar', '', 'GUITAR', 0, 112, 28),
+        (43, 'Overdriven', 'Overdriven Guitar', 'GUITAR', 0, 112, 29),
+        (44, 'Distortion', 'Distortion Guitar', 'GUITAR', 0, 112, 30),
+        (45, 'Acoustic Bass', '', 'BASS', 0, 112, 32),
+        (46, 'Finger Bass', '', 'BASS', 0, 112, 33),
+        (47, 'Pick Bass', '', 'BASS', 0, 112, 34),
+        (48, 'Fretless Bass', '', 'BASS', 0, 112, 35),
+        (49, 'Slap Bass', '', 'BASS', 0, 112, 36),
+        (50, 'Synth Bass', '', 'BASS', 0, 112, 38),
+        (51, 'Hi-Q Bass', '', 'BASS', 0, 113, 38),
+        (52, 'Dance Bass', '', 'BASS', 0, 113, 39),
+        (53, 'Live! Orchestra', '', 'STRINGS', 0, 116, 49),
+        (54, 'String Ensemble', '', 'STRINGS', 0, 112, 48),
+        (55, 'Chamber Strings', '', 'STRINGS', 0, 112, 49),
+        (56, 'Synth Strings', '', 'STRINGS', 0, 112, 50),
+        (57, 'Slow Strings', '', 'STRINGS', 0, 113, 49),
+        (58, 'Tremolo Strings', '', 'STRINGS', 0, 112, 44),
+        (59, 'Pizzicato Strings', '', 'STRINGS', 0, 112, 45),
+        (60, 'Violin', '', 'STRINGS', 0, 112, 40),
+        (61, 'Cello', '', 'STRINGS', 0, 112, 42),
+        (62, 'Contrabass', '', 'STRINGS', 0, 112, 43),
+        (63, 'Banjo', '', 'STRINGS', 0, 112, 105),
+        (64, 'Harp', '', 'STRINGS', 0, 112, 46),
+        (65, 'Orchestra Hit', '', 'STRINGS', 0, 112, 55),
+        (66, 'Choir', '', 'CHOIR', 0, 112, 52),
+        (67, 'Vocal Ensemble', '', 'CHOIR', 0, 113, 52),
+        (68, 'Vox Humana', '', 'CHOIR', 0, 112, 53),
+        (69, 'Air Choir', '', 'CHOIR', 0, 112, 54),
+        (70, 'Sweet! Tenor Sax', '', 'SAXOPHONE', 0, 117, 66),
+        (71, 'Sweet! Soprano', 'Sweet! Soprano Sax', 'SAXOPHONE', 0, 113, 64),
+        (72, 'Tenor Sax', '', 'SAXOPHONE', 0, 112, 66),
+        (73, 'Alto Sax', '', 'SAXOPHONE', 0, 112, 65),
+        (74, 'Soprano Sax', '', 'SAXOPHONE', 0, 112, 64),
+        (75, 'Baritone Sax', '', 'SAXOPHONE', 0, 112, 67),
+        (76, 'Breathy Tenor Sax', '', 'SAXOPHONE', 0, 114, 66),
+        (77, 'Oboe', '', 'SAXOPHONE', 0, 112, 68),
+        (78, 'Clarinet', '', 'SAXOPHONE', 0, 112, 71),
+        (79, 'English Horn', '', 'SAXOPHONE', 0, 112, 69),
+        (80, 'Bassoon', '', 'SAXOPHONE', 0, 112, 70),
+        (81, 'Sweet! Trumpet', '', 'TRUMPET', 0, 115, 56),
+        (82, 'Trumpet', '', 'TRUMPET', 0, 112, 56),
+        (83, 'Muted Trumpet', '', 'TRUMPET', 0, 112, 59),
+        (84, 'Trombone', '', 'TRUMPET', 0, 112, 57),
+        (85, 'Trombone Section', '', 'TRUMPET', 0, 113, 57),
+        (86, 'French Horn', '', 'TRUMPET', 0, 112, 60),
+        (87, 'Tuba', '', 'TRUMPET', 0, 112, 58),
+        (88, 'Brass Section', '', 'BRASS', 0, 112, 61),
+        (89, 'Big Band Brass', '', 'BRASS', 0, 113, 61),
+        (90, 'Mellow Horns', '', 'BRASS', 0, 119, 61),
+        (91, 'Synth Brass', '', 'BRASS', 0, 112, 62),
+        (92, "80's Brass", '', 'BRASS', 0, 113, 62),
+        (93, 'Techno Brass', '', 'BRASS', 0, 114, 62),
+        (94, 'Sweet! Flute', '', 'FLUTE', 0, 114, 73),
+        (95, 'Sweet! Pan Flute', '', 'FLUTE', 0, 113, 75),
+        (96, 'Flute', '', 'FLUTE', 0, 112, 73),
+        (97, 'Piccolo', '', 'FLUTE', 0, 112, 72),
+        (98, 'Pan Flute', '', 'FLUTE', 0, 112, 75),
+        (99, 'Recorder', '', 'FLUTE', 0, 112, 74),
+        (100, 'Ocarina', '', 'FLUTE', 0, 112, 79),
+        (101, 'Square Lead', '', 'SYNTH LEAD', 0, 112, 80),
+        (102, 'Sawtooth Lead', '', 'SYNTH LEAD', 0, 112, 81),
+        (103, 'Voice Lead', '', 'SYNTH LEAD', 0, 112, 85),
+        (104, 'Star Dust', '', 'SYNTH LEAD', 0, 112, 98),
+        (105, 'Brightness', '', 'SYNTH LEAD', 0, 112, 100),
+        (106, 'Analogon', '', 'SYNTH LEAD', 0, 115, 81),
+        (107, 'Fargo', '', 'SYNTH LEAD', 0, 119, 81),
+        (108, 'SweetHeaven', '', 'SYNTH PAD', 0, 118, 88),
+        (109, 'Fantasia', '', 'SYNTH PAD', 0, 112, 88),
+        (110, 'Bell Pad', '', 'SYNTH PAD', 0, 113, 100),
+        (111, 'Xenon Pad', '', 'SYNTH PAD', 0, 112, 91),
+        (112, 'Equinox', '', 'SYNTH PAD', 0, 112, 94),
+        (113, 'Dark Moon', '', 'SYNTH PAD', 0, 113, 89),
+        (114, 'Vibraphone', '', 'PERCUSSION', 0, 112, 11),
+        (115, 'Marimba', '', 'PERCUSSION', 0, 112, 12),
+        (116, 'Xylophone', '', 'PERCUSSION', 0, 112, 13),
+        (117, 'Steel Drums', '', 'PERCUSSION', 0, 112, 114),
+        (118, 'Celesta', '', 'PERCUSSION', 0, 112, 8),
+        (119, 'Music Box', '', 'PERCUSSION', 0, 112, 10),
+        (120, 'Tubular Bells', '', 'PERCUSSION', 0, 112, 14),
+        (121, 'Timpani', '', 'PERCUSSION', 0, 112, 47),
+        (122, 'Standard Kit 1', '', 'DRUM KITS', 127, 0, 0),
+        (123, 'Standard Kit 2', '', 'DRUM KITS', 127, 0, 1),
+        (124, 'Room Kit', '', 'DRUM KITS', 127, 0, 8),
+        (125, 'Rock Kit', '', 'DRUM KITS', 127, 0, 16),
+        (126, 'Electronic Kit', '', 'DRUM KITS', 127, 0, 24),
+        (127, 'Analog Kit', '', 'DRUM KITS', 127, 0, 25),
+        (128, 'Dance Kit', '', 'DRUM KITS', 127, 0, 27),
+        (129, 'Jazz Kit', '', 'DRUM KITS', 127, 0, 32),
+        (130, 'Brush Kit', '', 'DRUM KITS', 127, 0, 40),
+        (131, 'Symphony Kit', '', 'DRUM KITS', 127, 0, 48),
+        (132, 'SFX Kit 1', '', 'DRUM KITS', 126, 0, 0),
+        (133, 'SFX Kit 2', '', 'DRUM KITS', 126, 0, 1),
+        (134, 'Grand Piano', '', 'XG PIANO', 0, 0, 0),
+        (135, 'Grand Piano KSP', '', 'XG PIANO', 0, 1, 0),
+        (136, 'Piano Strings', '', 'XG PIANO', 0, 40, 0),
+        (137, 'Dream', '', 'XG PIANO', 0, 41, 0),
+        (138, 'Bright Piano', '', 'XG PIANO', 0, 0, 1),
+        (139, 'Bright Piano KSP', '', 'XG PIANO', 0, 1, 1),
+        (140, 'Electric Grand', 'Electric Grand Piano', 'XG PIANO', 0, 0, 2),
+        (141, 'Electric Grand KSP', 'Electric Grand Piano KSP', 'XG PIANO', 0, 1, 2),
+        (142, 'Detuned CP80', '', 'XG PIANO', 0, 32, 2),
+        (143, 'Honky-tonk Piano', '', 'XG PIANO', 0, 0, 3),
+        (144, 'Honky-tonk KSP', 'Honky-tonk Piano KSP', 'XG PIANO', 0, 1, 3),
+        (145, 'Electric Piano 1', '', 'XG PIANO', 0, 0, 4),
+        (146, 'Electric Pno1 KSP', 'Electric Piano 1 KSP', 'XG PIANO', 0, 1, 4),
+        (147, 'Chorus E.Piano 1', 'Chorus Electric Piano 1', 'XG PIANO', 0, 32, 4),
+        (148, 'Electric Piano 2', '', 'XG PIANO', 0, 0, 5),
+        (149, 'Electric Pno2 KSP', 'Electric Piano 2 KSP', 'XG PIANO', 0, 1, 5),
+        (150, 'Chorus E.Piano 2', 'Chorus Electric Piano 2', 'XG PIANO', 0, 32, 5),
+        (151, 'DX + Analog EP', 'DX + Analog Electric Piano', 'XG PIANO', 0, 41, 5),
+        (152, 'Harpsichord', '', 'XG PIANO', 0, 0, 6),
+        (153, 'Harpsichord KSP', '', 'XG PIANO', 0, 1, 6),
+        (154, 'Harpsichord 3', '', 'XG PIANO', 0, 35, 6),
+        (155, 'Clavi', '', 'XG PIANO', 0, 0, 7),
+        (156, 'Clavi KSP', '', 'XG PIANO', 0, 1, 7),
+        (157, 'Celesta', '', 'XG CHROMATIC', 0, 0, 8),
+        (158, 'Glockenspiel', '', 'XG CHROMATIC', 0, 0, 9),
+        (159, 'Music Box', '', 'XG CHROMATIC', 0, 0, 10),
+        (160, 'Orgel', '', 'XG CHROMATIC', 0, 64, 10),
+        (161, 'Vibraphone', '', 'XG CHROMATIC', 0, 0, 11),
+        (162, 'Vibraphone KSP', '', 'XG CHROMATIC', 0, 1, 11),
+        (163, 'Marimba', '', 'XG CHROMATIC', 0, 0, 12),
+        (164, 'Marimba KSP', '', 'XG CHROMATIC', 0, 1, 12),
+        (165, 'Sine Marimba', '', 'XG CHROMATIC', 0, 64, 12),
+        (166, 'Balimba', '', 'XG CHROMATIC', 0, 97, 12),
+        (167, 'Log Drums', '', 'XG CHROMATIC', 0, 98, 12),
+        (168, 'Xylophone', '', 'XG CHROMATIC', 0, 0, 13),
+        (169, 'Tubular Bells', '', 'XG CHROMATIC', 0, 0, 14),
+        (170, 'Church Bells', '', 'XG CHROMATIC', 0, 96, 14),
+        (171, 'Carillon', '', 'XG CHROMATIC', 0, 97, 14),
+        (172, 'Dulcimer', '', 'XG CHROMATIC', 0, 0, 15),
+        (173, 'Dulcimer 2', '', 'XG CHROMATIC', 0, 35, 15),
+        (174, 'Cimbalom', '', 'XG CHROMATIC', 0, 96, 15),
+        (175, 'Santur', '', 'XG CHROMATIC', 0, 97, 15),
+        (176, 'Drawbar Organ', 'DrawOrg', 'XG ORGAN', 0, 0, 16),
+        (177, 'Detuned Drb Org', 'Detuned DrawOrg', 'XG ORGAN', 0, 32, 16),
+        (178, '60s Drb Organ 1', "60's DrawOrg 1", 'XG ORGAN', 0, 33, 16),
+        (179, '60s Drb Organ 2', "60's DrawOrg 2", 'XG ORGAN', 0, 34, 16),
+        (180, '70s Drb Organ 1', "70's DrawOrg 1", 'XG ORGAN', 0, 35, 16),
+        (181, '60s Drb Organ 3', "60's DrawOrg 3", 'XG ORGAN', 0, 37, 16),
+        (182, "16+2'2/3", '', 'XG ORGAN', 0, 40, 16),
+        (183, 'Organ Bass', '', 'XG ORGAN', 0, 64, 16),
+        (184, '70s Drb Organ 2', "70's DrawOrg 2", 'XG ORGAN', 0, 65, 16),
+        (185, 'Cheezy Organ', '', 'XG ORGAN', 0, 66, 16),
+        (186, 'Drawbar Organ 3', 'DrawOrg 3', 'XG ORGAN', 0, 67, 16),
+        (187, 'Percussive Organ', '', 'XG ORGAN', 0, 0, 17),
+        (188, '70s Perc Organ', "70's Percussive Organ", 'XG ORGAN', 0, 24, 17),
+        (189, 'Detuned Perc Org', 'Detuned Percussive Organ', 'XG ORGAN', 0, 32, 17),
+        (190, 'Light Organ', '', 'XG ORGAN', 0, 33, 17),
+        (191, 'Perc Organ 2', 'Percussive Organ 2', 'XG ORGAN', 0, 37, 17),
+        (192, 'Rock Organ', '', 'XG ORGAN', 0, 0, 18),
+        (193, 'Rotary Organ', '', 'XG ORGAN', 0, 64, 18),
+        (194, 'Slow Rotary', '', 'XG ORGAN', 0, 65, 18),
+        (195, 'Fast Rotary', '', 'XG ORGAN', 0, 66, 18),
+        (196, 'Church Organ', '', 'XG ORGAN', 0, 0, 19),
+        (197, 'Church Organ 3', '', 'XG ORGAN', 0, 32, 19),
+        (198, 'Church Organ 2', '', 'XG ORGAN', 0, 35, 19),
+        (199, 'Notre Dame', '', 'XG ORGAN', 0, 40, 19),
+        (200, 'Organ Flute', '', 'XG ORGAN', 0, 64, 19),
+        (201, 'Trem Organ Flute', 'Tremolo Organ Flute', 'XG ORGAN', 0, 65, 19),
+        (202, 'Reed Organ', '', 'XG ORGAN', 0, 0, 20),
+        (203, 'Puff Organ', '', 'XG ORGAN', 0, 40, 20),
+        (204, 'Accordion', '', 'XG ORGAN', 0, 0, 21),
+        (205, 'Harmonica', '', 'XG ORGAN', 0, 0, 22),
+        (206, 'Harmonica 2', '', 'XG ORGAN', 0, 32, 22),
+        (207, 'Tango Accordion', '', 'XG ORGAN', 0, 0, 23),
+        (208, 'Tango Accordion 2', '', 'XG ORGAN', 0, 64, 23),
+        (209, 'Nylon Guitar', '', 'XG GUITAR', 0, 0, 24),
+        (210, 'Vel Gtr Harmonics', 'Velocity Guitar Harmonics', 'XG GUITAR', 0, 43, 24),
+        (211, 'Ukulele', '', 'XG GUITAR', 0, 96, 24),
+        (212, 'Steel Guitar', '', 'XG GUITAR', 0, 0, 25),
+        (213, '12-string Guitar', '', 'XG GUITAR', 0, 35, 25),
+        (214, 'Nylon & Steel', 'Nylon & Steel Guitar', 'XG GUITAR', 0, 40, 25),
+        (215, 'Steel with Body', 'Steel Guitar with Body Sound', 'XG GUITAR', 0, 41, 25),
+        (216, 'Mandolin', '', 'XG GUITAR', 0, 96, 25),
+        (217, 'Jazz Guitar', '', 'XG GUITAR', 0, 0, 26),
+        (218, 'Jazz Amp', '', 'XG GUITAR', 0, 32, 26),
+        (219, 'Clean Guitar', '', 'XG GUITAR', 0, 0, 27),
+        (220, 'Chorus Guitar', '', 'XG GUITAR', 0, 32, 27),
+        (221, 'Muted Guitar', '', 'XG GUITAR', 0, 0, 28),
+        (222, 'Funk Guitar 1', '', 'XG GUITAR', 0, 40, 28),
+        (223, 'Muted Steel Guitar', '', 'XG GUITAR', 0, 41, 28),
+        (224, 'Jazz Man', '', 'XG GUITAR', 0, 45, 28),
+        (225, 'Overdriven', 'Overdriven Guitar', 'XG GUITAR', 0, 0, 29),
+        (226, 'Guitar Pinch', '', 'XG GUITAR', 0, 43, 29),
+        (227, 'Distortion', 'Distortion Guitar', 'XG GUITAR', 0, 0, 30),
+        (228, 'Feedback Guitar', '', 'XG GUITAR', 0, 40, 30),
+        (229, 'Feedback Guitar 2', '', 'XG GUITAR', 0, 41, 30),
+        (230, 'Guitar Harmonics', '', 'XG GUITAR', 0, 0, 31),
+        (231, 'Guitar Feedback', '', 'XG GUITAR', 0, 65, 31),
+        (232, 'Guitar Harmonics 2', '', 'XG GUITAR', 0, 66, 31),
+        (233, 'Acoustic Bass', '', 'XG BASS', 0, 0, 32),
+        (234, 'Jazz Rhythm', '', 'XG BASS', 0, 40, 32),
+        (235, 'Vel Xfade Uplight', 'Velocity Crossfade Upright Bass', 'XG BASS', 0, 45, 32),
+        (236, 'Finger Bass', '', 'XG BASS', 0, 0, 33),
+        (237, 'Finger Dark', '', 'XG BASS', 0, 18, 33),
+        (238, 'Bass&Dist.E.Gt', 'Bass & Distorted Electric Guitar', 'XG BASS', 0, 40, 33),
+        (239, 'Finger Slap Bass', '', 'XG BASS', 0, 43, 33),
+        (240, 'Finger Bass 2', '', 'XG BASS', 0, 45, 33),
+        (241, 'Modulated Bass', '', 'XG BASS', 0, 65, 33),
+        (242, 'Pick Bass', '', 'XG BASS', 0, 0, 34),
+        (243, 'Muted Pick Bass', '', 'XG BASS', 0, 28, 34),
+        (244, 'Fretless Bass', '', 'XG BASS', 0, 0, 35),
+        (245, 'Fretless Bass 2', '', 'XG BASS', 0, 32, 35),
+        (246, 'Fretless Bass 3', '', 'XG BASS', 0, 33, 35),
+        (247, 'Fretless Bass 4', '', 'XG BASS', 0, 34, 35),
+        (248, 'Slap Bass 1', '', 'XG BASS', 0, 0, 36),
+        (249, 'Punch Thumb Bass', '', 'XG BASS', 0, 32, 36),
+        (250, 'Slap Bass 2', '', 'XG BASS', 0, 0, 37),
+        (251, 'Velocity SW Slap', 'Velocity Switch Slap', 'XG BASS', 0, 43, 37),
+        (252, 'Synth Bass 1', '', 'XG BASS', 0, 0, 38),
+        (253, 'Techno Syn Bass', 'Techno Synth Bass', 'XG BASS', 0, 40, 38),
+        (254, 'Synth Bass 2', '', 'XG BASS', 0, 0, 39),
+        (255, 'Mellow Syn Bass', 'Mellow Synth Bass', 'XG BASS', 0, 6, 39),
+        (256, 'Sequenced Bass', '', 'XG BASS', 0, 12, 39),
+        (257, 'Click Synth Bass', '', 'XG BASS', 0, 18, 39),
+        (258, 'Syn Bass 2 Dark', 'Synth Bass 2 Dark', 'XG BASS', 0, 19, 39),
+        (259, 'Modular Syn Bass', 'Modular Synth Bass', 'XG BASS', 0, 40, 39),
+        (260, 'DX Bass', '', 'XG BASS', 0, 41, 39),
+        (261, 'Violin', '', 'XG STRING', 0, 0, 40),
+        (262, 'Slow Violin', '', 'XG STRING', 0, 8, 40),
+        (263, 'Viola', '', 'XG STRING', 0, 0, 41),
+        (264, 'Cello', '', 'XG STRING', 0, 0, 42),
+        (265, 'Contrabass', '', 'XG STRING', 0, 0, 43),
+        (266, 'Tremolo Strings', '', 'XG STRING', 0, 0, 44),
+        (267, 'Slow Trem Strs', 'Slow Tremolo Strings', 'XG STRING', 0, 8, 44),
+        (268, 'Suspense Strings', '', 'XG STRING', 0, 40, 44),
+        (269, 'Pizzicato Strings', '', 'XG STRING', 0, 0, 45),
+        (270, 'Orchestral Harp', '', 'XG STRING', 0, 0, 46),
+        (271, 'Yang Chin', '', 'XG STRING', 0, 40, 46),
+        (272, 'Timpani', '', 'XG STRING', 0, 0, 47),
+        (273, 'Strings 1', '', 'XG ENSEMBLE', 0, 0, 48),
+        (274, 'Stereo Strings', '', 'XG ENSEMBLE', 0, 3, 48),
+        (275, 'Slow Strings', '', 'XG ENSEMBLE', 0, 8, 48),
+        (276, "60's Strings", '', 'XG ENSEMBLE', 0, 35, 48),
+        (277, 'Orchestra', '', 'XG ENSEMBLE', 0, 40, 48),
+        (278, 'Orchestra 2', '', 'XG ENSEMBLE', 0, 41, 48),
+        (279, 'Trem Orchestra', 'Tremolo Orchestra', 'XG ENSEMBLE', 0, 42, 48),
+        (280, 'Velocity Strings', '', 'XG ENSEMBLE', 0, 45, 48),
+        (281, 'Strings 2', '', 'XG ENSEMBLE', 0, 0, 49),
+        (282, 'Stereo Slow Strs', 'Stereo Slow Strings', 'XG ENSEMBLE', 0, 3, 49),
+        (283, 'Legato Strings', '', 'XG ENSEMBLE', 0, 8, 49),
+        (284, 'Warm Strings', '', 'XG ENSEMBLE', 0, 40, 49),
+        (285, 'Kingdom', '', 'XG ENSEMBLE', 0, 41, 49),
+        (286, 'Synth Strings 1', '', 'XG ENSEMBLE', 0, 0, 50),
+        (287, 'Synth Strings 2', '', 'XG ENSEMBLE', 0, 0, 51),
+        (288, 'Choir Aahs ', '', 'XG ENSEMBLE', 0, 0, 52),
+        (289, 'Stereo Choir', '', 'XG ENSEMBLE', 0, 3, 52),
+        (290, 'Mellow Choir', '', 'XG ENSEMBLE', 0, 32, 52),
+        (291, 'Choir Strings', '', 'XG ENSEMBLE', 0, 40, 52),
+        (292, 'Voice Oohs', '', 'XG ENSEMBLE', 0, 0, 53),
+        (293, 'Synth Voice', '', 'XG ENSEMBLE', 0, 0, 54),
+        (294, 'Synth Voice 2', '', 'XG ENSEMBLE', 0, 40, 54),
+        (295, 'Choral', '', 'XG ENSEMBLE', 0, 41, 54),
+        (296, 'Analog Voice', '', 'XG ENSEMBLE', 0, 64, 54),
+        (297, 'Orchestra Hit', '', 'XG ENSEMBLE', 0, 0, 55),
+        (298, 'Orchestra Hit 2', '', 'XG ENSEMBLE', 0, 35, 55),
+        (299, 'Impact', '', 'XG ENSEMBLE', 0, 64, 55),
+        (300, 'Trumpet ', '', 'XG BRASS', 0, 0, 56),
+        (301, 'Warm Trumpet', '', 'XG BRASS', 0, 32, 56),
+        (302, 'Trombone', '', 'XG BRASS', 0, 0, 57),
+        (303, 'Trombone 2', '', 'XG BRASS', 0, 18, 57),
+        (304, 'Tuba', '', 'XG BRASS', 0, 0, 58),
+        (305, 'Muted Trumpet', '', 'XG BRASS', 0, 0, 59),
+        (306, 'French Horn', '', 'XG BRASS', 0, 0, 60),
+        (307, 'French Horn Solo', '', 'XG BRASS', 0, 6, 60),
+        (308, 'French Horn 2', '', 'XG BRASS', 0, 32, 60),
+        (309, 'Horn Orchestra', '', 'XG BRASS', 0, 37, 60),
+        (310, 'Brass Section', '', 'XG BRASS', 0, 0, 61),
+        (311, 'Trp&Trb Section', 'Trumpet & Trombone Section', 'XG BRASS', 0, 35, 61),
+        (312, 'Synth Brass 1', '', 'XG BRASS', 0, 0, 62),
+        (313, 'Reso Syn Brass', 'Resonant Synth Brass', 'XG BRASS', 0, 20, 62),
+        (314, 'Synth Brass 2', '', 'XG BRASS', 0, 0, 63),
+        (315, 'Soft Brass', '', 'XG BRASS', 0, 18, 63),
+        (316, 'Choir Brass', '', 'XG BRASS', 0, 41, 63),
+        (317, 'Soprano Sax', '', 'XG REED', 0, 0, 64),
+        (318, 'Alto Sax', '', 'XG REED', 0, 0, 65),
+        (319, 'Sax Section', '', 'XG REED', 0, 40, 65),
+        (320, 'Tenor Sax', '', 'XG REED', 0, 0, 66),
+        (321, 'Breathy Tenor Sax', '', 'XG REED', 0, 40, 66),
+        (322, 'Baritone Sax', '', 'XG REED', 0, 0, 67),
+        (323, 'Oboe', '', 'XG REED', 0, 0, 68),
+        (324, 'English Horn', '', 'XG REED', 0, 0, 69),
+        (325, 'Bassoon', '', 'XG REED', 0, 0, 70),
+        (326, 'Clarinet', '', 'XG REED', 0, 0, 71),
+        (327, 'Piccolo', '', 'XG PIPE', 0, 0, 72),
+        (328, 'Flute', '', 'XG PIPE', 0, 0, 73),
+        (329, 'Recorder', '', 'XG PIPE', 0, 0, 74),
+        (330, 'Pan Flute', '', 'XG PIPE', 0, 0, 75),
+        (331, 'Blown Bottle', '', 'XG PIPE', 0, 0, 76),
+        (332, 'Shakuhachi', '', 'XG PIPE', 0, 0, 77),
+        (333, 'Whistle', '', 'XG PIPE', 0, 0, 78),
+        (334, 'Ocarina', '', 'XG PIPE', 0, 0, 79),
+        (335, 'Square Lead', '', 'XG SYNTH LEAD', 0, 0, 80),
+        (336, 'Square Lead 2', '', 'XG SYNTH LEAD', 0, 6, 80),
+        (337, 'LM Square', '', 'XG SYNTH LEAD', 0, 8, 80),
+        (338, 'Hollow', '', 'XG SYNTH LEAD', 0, 18, 80),
+        (339, 'Shroud', '', 'XG SYNTH LEAD', 0, 19, 80),
+        (340, 'Mellow', '', 'XG SYNTH LEAD', 0, 64, 80),
+        (341, 'Solo Sine', '', 'XG SYNTH LEAD', 0, 65, 80),
+        (342, 'Sine Lead', '', 'XG SYNTH LEAD', 0, 66, 80),
+        (343, 'Sawtooth Lead', '', 'XG SYNTH LEAD', 0, 0, 81),
+        (344, 'Sawtooth Lead 2', '', 'XG SYNTH LEAD', 0, 6, 81),
+        (345, 'Thick Sawtooth', '', 'XG SYNTH LEAD', 0, 8, 81),
+        (346, 'Dynamic Sawtooth', '', 'XG SYNTH LEAD', 0, 18, 81),
+        (347, 'Digital Sawtooth', '', 'XG SYNTH LEAD', 0, 19, 81),
+        (348, 'Big Lead', '', 'XG SYNTH LEAD', 0, 20, 81),
+        (349, 'Sequenced Analog', '', 'XG SYNTH LEAD', 0, 96, 81),
+        (350, 'Calliope Lead', '', 'XG SYNTH LEAD', 0, 0, 82),
+        (351, 'Pure Pad', '', 'XG SYNTH LEAD', 0, 65, 82),
+        (352, 'Chiff Lead', '', 'XG SYNTH LEAD', 0, 0, 83),
+        (353, 'Charang Lead', '', 'XG SYNTH LEAD', 0, 0, 84),
+        (354, 'Distorted Lead', '', 'XG SYNTH LEAD', 0, 64, 84),
+        (355, 'Voice Lead', '', 'XG SYNTH LEAD', 0, 0, 85),
+        (356, 'Fifths Lead', '', 'XG SYNTH LEAD', 0, 0, 86),
+        (357, 'Big Five', '', 'XG SYNTH LEAD', 0, 35, 86),
+        (358, 'Bass & Lead', '', 'XG SYNTH LEAD', 0, 0, 87),
+        (359, 'Big & Low', '', 'XG SYNTH LEAD', 0, 16, 87),
+        (360, 'Fat & Perky', '', 'XG SYNTH LEAD', 0, 64, 87),
+        (361, 'Soft Whirl', '', 'XG SYNTH LEAD', 0, 65, 87),
+        (362, 'New Age Pad', '', 'XG SYNTH PAD', 0, 0, 88),
+        (363, 'Fantasy', '', 'XG SYNTH PAD', 0, 64, 88),
+        (364, 'Warm Pad', '', 'XG SYNTH PAD', 0, 0, 89),
+        (365, 'Poly Synth Pad', '', 'XG SYNTH PAD', 0, 0, 90),
+        (366, 'Choir Pad', '', 'XG SYNTH PAD', 0, 0, 91),
+        (367, 'Itopia', '', 'XG SYNTH PAD', 0, 66, 91),
+        (368, 'Bowed Pad', '', 'XG SYNTH PAD', 0, 0, 92),
+        (369, 'Metallic Pad', '', 'XG SYNTH PAD', 0, 0, 93),
+        (370, 'Halo Pad', '', 'XG SYNTH PAD', 0, 0, 94),
+        (371, 'Sweep Pad', '', 'XG SYNTH PAD', 0, 0, 95),
+        (372, 'Rain', '', 'XG SYNTH EFFECTS', 0, 0, 96),
+        (373, 'African Wind', '', 'XG SYNTH EFFECTS', 0, 65, 96),
+        (374, 'Carib', '', 'XG SYNTH EFFECTS', 0, 66, 96),
+        (375, 'Sound Track', '', 'XG SYNTH EFFECTS', 0, 0, 97),
+        (376, 'Prologue', '', 'XG SYNTH EFFECTS', 0, 27, 97),
+        (377, 'Crystal', '', 'XG SYNTH EFFECTS', 0, 0, 98),
+        (378, 'Synth Drum Comp', '', 'XG SYNTH EFFECTS', 0, 12, 98),
+        (379, 'Popcorn', '', 'XG SYNTH EFFECTS', 0, 14, 98),
+        (380, 'Tiny Bells', '', 'XG SYNTH EFFECTS', 0, 18, 98),
+        (381, 'Round Glocken', 'Round Glockenspiel', 'XG SYNTH EFFECTS', 0, 35, 98),
+        (382, 'Glocken Chime', 'Glockenspiel Chimes', 'XG SYNTH EFFECTS', 0, 40, 98),
+        (383, 'Clear Bells', '', 'XG SYNTH EFFECTS', 0, 41, 98),
+        (384, 'Chorus Bells', '', 'XG SYNTH EFFECTS', 0, 42, 98),
+        (385, 'Soft Crystal', '', 'XG SYNTH EFFECTS', 0, 65, 98),
+        (386, 'Air Bells', '', 'XG SYNTH EFFECTS', 0, 70, 98),
+        (387, 'Bell Harp', '', 'XG SYNTH EFFECTS', 0, 71, 98),
+        (388, 'Gamelimba', '', 'XG SYNTH EFFECTS', 0, 72, 98),
+        (389, 'Atmosphere', '', 'XG SYNTH EFFECTS', 0, 0, 99),
+        (390, 'Warm Atmosphere', '', 'XG SYNTH EFFECTS', 0, 18, 99),
+        (391, 'Hollow Release', '', 'XG SYNTH EFFECTS', 0, 19, 99),
+        (392, 'Nylon E.Piano', 'Nylon Electric Piano', 'XG SYNTH EFFECTS', 0, 40, 99),
+        (393, 'Nylon Harp', '', 'XG SYNTH EFFECTS', 0, 64, 99),
+        (394, 'Harp Vox', '', 'XG SYNTH EFFECTS', 0, 65, 99),
+        (395, 'Atmosphere Pad', '', 'XG SYNTH EFFECTS', 0, 66, 99),
+        (396, 'Brightness', '', 'XG SYNTH EFFECTS', 0, 0, 100),
+        (397, 'Goblins', '', 'XG SYNTH EFFECTS', 0, 0, 101),
+        (398, 'Goblins Synth', '', 'XG SYNTH EFFECTS', 0, 64, 101),
+        (399, 'Creeper', '', 'XG SYNTH EFFECTS', 0, 65, 101),
+        (400, 'Ritual', '', 'XG SYNTH EFFECTS', 0, 67, 101),
+        (401, 'To Heaven', '', 'XG SYNTH EFFECTS', 0, 68, 101),
+        (402, 'Night', '', 'XG SYNTH EFFECTS', 0, 70, 101),
+        (403, 'Glisten', '', 'XG SYNTH EFFECTS', 0, 71, 101),
+        (404, 'Bell Choir', '', 'XG SYNTH EFFECTS', 0, 96, 101),
+        (405, 'Echoes', '', 'XG SYNTH EFFECTS', 0, 0, 102),
+        (406, 'Sci-Fi', '', 'XG SYNTH EFFECTS', 0, 0, 103),
+        (407, 'Sitar', '', 'XG WORLD', 0, 0, 104),
+        (408, 'Detuned Sitar', '', 'XG WORLD', 0, 32, 104),
+        (409, 'Sitar 2', '', 'XG WORLD', 0, 35, 104),
+        (410, 'Tamboura', '', 'XG WORLD', 0, 97, 104),
+        (411, 'Banjo', '', 'XG WORLD', 0, 0, 105),
+        (412, 'Muted Banjo', '', 'XG WORLD', 0, 28, 105),
+        (413, 'Rabab', '', 'XG WORLD', 0, 96, 105),
+        (414, 'Gopichant', '', 'XG WORLD', 0, 97, 105),
+        (415, 'Oud', '', 'XG WORLD', 0, 98, 105),
+        (416, 'Shamisen', '', 'XG WORLD', 0, 0, 106),
+        (417, 'Koto', '', 'XG WORLD', 0, 0, 107),
+        (418, 'Taisho-kin', '', 'XG WORLD', 0, 96, 107),
+        (419, 'Kanoon', '', 'XG WORLD', 0, 97, 107),
+        (420, 'Kalimba', '', 'XG WORLD', 0, 0, 108),
+        (421, 'Bagpipe', '', 'XG WORLD', 0, 0, 109),
+        (422, 'Fiddle', '', 'XG WORLD', 0, 0, 110),
+        (423, 'Shanai', '', 'XG WORLD', 0, 0, 111),
+        (424, 'Tinkle Bell', '', 'XG PERCUSSIVE', 0, 0, 112),
+        (425, 'Bonang', '', 'XG PERCUSSIVE', 0, 96, 112),
+        (426, 'Altair', '', 'XG PERCUSSIVE', 0, 97, 112),
+        (427, 'Gamelan Gongs', '', 'XG PERCUSSIVE', 0, 98, 112),
+        (428, 'St Gamelan Gong', 'Stereo Gamelan Gongs', 'XG PERCUSSIVE', 0, 99, 112),
+        (429, 'Rama Cymbal', '', 'XG PERCUSSIVE', 0, 100, 112),
+        (430, 'Agogo', '', 'XG PERCUSSIVE', 0, 0, 113),
+        (431, 'Steel Drums', '', 'XG PERCUSSIVE', 0, 0, 114),
+        (432, 'Glass Percussion', '', 'XG PERCUSSIVE', 0, 97, 114),
+        (433, 'Thai Bells', '', 'XG PERCUSSIVE', 0, 98, 114),
+        (434, 'Woodblock', '', 'XG PERCUSSIVE', 0, 0, 115),
+        (435, 'Castanets', '', 'XG PERCUSSIVE', 0, 96, 115),
+        (436, 'Taiko Drum', '', 'XG PERCUSSIVE', 0, 0, 116),
+        (437, 'Gran Cassa', '', 'XG PERCUSSIVE', 0, 96, 116),
+        (438, 'Melodic Tom', '', 'XG PERCUSSIVE', 0, 0, 117),
+        (439, 'Melodic Tom 2', '', 'XG PERCUSSIVE', 0, 64, 117),
+        (440, 'Real Tom', '', 'XG PERCUSSIVE', 0, 65, 117),
+        (441, 'Rock Tom', '', 'XG PERCUSSIVE', 0, 66, 117),
+        (442, 'Synth Drum', '', 'XG PERCUSSIVE', 0, 0, 118),
+        (443, 'Analog Tom', '', 'XG PERCUSSIVE', 0, 64, 118),
+        (444, 'Electronic Perc', 'Electronic Percussion', 'XG PERCUSSIVE', 0, 65, 118),
+        (445, 'Reverse Cymbal', '', 'XG PERCUSSIVE', 0, 0, 119),
+        (446, 'Fret Noise', '', 'XG SOUND EFFECTS', 0, 0, 120),
+        (447, 'Breath Noise', '', 'XG SOUND EFFECTS', 0, 0, 121),
+        (448, 'Seashore', '', 'XG SOUND EFFECTS', 0, 0, 122),
+        (449, 'Bird Tweet', '', 'XG SOUND EFFECTS', 0, 0, 123),
+        (450, 'Telephone Ring', '', 'XG SOUND EFFECTS', 0, 0, 124),
+        (451, 'Helicopter', '', 'XG SOUND EFFECTS', 0, 0, 125),
+        (452, 'Applause', '', 'XG SOUND EFFECTS', 0, 0, 126),
+        (453, 'Gunshot', '', 'XG SOUND EFFECTS', 0, 0, 127),
+        (454, 'Cutting Noise', '', 'XG SOUND EFFECTS', 64, 0, 0),
+        (455, 'Cutting Noise 2', '', 'XG SOUND EFFECTS', 64, 0, 1),
+        (456, 'String Slap', '', 'XG SOUND EFFECTS', 64, 0, 3),
+        (457, 'Flute Key Click', '', 'XG SOUND EFFECTS', 64, 0, 16),
+        (458, 'Shower', '', 'XG SOUND EFFECTS', 64, 0, 32),
+        (459, 'Thunder', '', 'XG SOUND EFFECTS', 64, 0, 33),
+        (460, 'Wind', '', 'XG SOUND EFFECTS', 64, 0, 34),
+        (461, 'Stream', '', 'XG SOUND EFFECTS', 64, 0, 35),
+        (462, 'Bubble', '', 'XG SOUND EFFECTS', 64, 0, 36),
+        (463, 'Feed', '', 'XG SOUND EFFECTS', 64, 0, 37),
+        (464, 'Dog', '', 'XG SOUND EFFECTS', 64, 0, 48),
+        (465, 'Horse', '', 'XG SOUND EFFECTS', 64, 0, 49),
+        (466, 'Bird Tweet 2', '', 'XG SOUND EFFECTS', 64, 0, 50),
+        (467, 'Maou', '', 'XG SOUND EFFECTS', 64, 0, 55),
+        (468, 'Phone Call', '', 'XG SOUND EFFECTS', 64, 0, 64),
+        (469, 'Door Squeak', '', 'XG SOUND EFFECTS', 64, 0, 65),
+        (470, 'Door Slam', '', 'XG SOUND EFFECTS', 64, 0, 66),
+        (471, 'Scratch Cut', '', 'XG SOUND EFFECTS', 64, 0, 67),
+        (472, 'Scratch Split', '', 'XG SOUND EFFECTS', 64, 0, 68),
+        (473, 'Wind Chime', '', 'XG SOUND EFFECTS', 64, 0, 69),
+        (474, 'Telephone Ring 2', '', 'XG SOUND EFFECTS', 64, 0, 70),
+        (475, 'Car Engine Ignition', '', 'XG SOUND EFFECTS', 64, 0, 80),
+        (476, 'Car Tires Squeal', '', 'XG SOUND EFFECTS', 64, 0, 81),
+        (477, 'Car Passing', '', 'XG SOUND EFFECTS', 64, 0, 82),
+        (478, 'Car Crash', '', 'XG SOUND EFFECTS', 64, 0, 83),
+        (479, 'Siren', '', 'XG SOUND EFFECTS', 64, 0, 84),
+        (480, 'Train', '', 'XG SOUND EFFECTS', 64, 0, 85),
+        (481, 'Jet Plane', '', 'XG SOUND EFFECTS', 64, 0, 86),
+        (482, 'Starship', '', 'XG SOUND EFFECTS', 64, 0, 87),
+        (483, 'Burst', '', 'XG SOUND EFFECTS', 64, 0, 88),
+        (484, 'Roller Coaster', '', 'XG SOUND EFFECTS', 64, 0, 89),
+        (485, 'Submarine', '', 'XG SOUND EFFECTS', 64, 0, 90),
+        (486, 'Laugh', '', 'XG SOUND EFFECTS', 64, 0, 96),
+        (487, 'Scream', '', 'XG SOUND EFFECTS', 64, 0, 97),
+        (488, 'Punch', '', 'XG SOUND EFFECTS', 64, 0, 98),
+        (489, 'Heartbeat', '', 'XG SOUND EFFECTS', 64, 0, 99),
+        (490, 'Footsteps', '', 'XG SOUND EFFECTS', 64, 0, 100),
+        (491, 'Machine Gun', '', 'XG SOUND EFFECTS', 64, 0, 112),
+        (492, 'Laser Gun', '', 'XG SOUND EFFECTS', 64, 0, 113),
+        (493, 'Explosion', '', 'XG SOUND EFFECTS', 64, 0, 114),
+        (494, 'Firework', '', 'XG SOUND EFFECTS', 64, 0, 115),
+    ),
+    'tables/styles.csv': (
+        (1, '8BeatModern', '8BEAT'),
+        (2, "60'sGuitarPop", '8BEAT'),
+        (3, '8BeatAdria', '8BEAT'),
+        (4, "60's8Beat", '8BEAT'),
+        (5, '8Beat', '8BEAT'),
+        (6, 'OffBeat', '8BEAT'),
+        (7, "60'sRock", '8BEAT'),
+        (8, 'HardRock', '8BEAT'),
+        (9, 'RockShuffle', '8BEAT'),
+        (10, '8BeatRock', '8BEAT'),
+        (11, '16Beat', '16BEAT'),
+        (12, 'PopShuffle1', '16BEAT'),
+        (13, 'PopShuffle2', '16BEAT'),
+        (14, 'GuitarPop', '16BEAT'),
+        (15, '16BeatUptempo', '16BEAT'),
+        (16, 'KoolShuffle', '16BEAT'),
+        (17, 'JazzRock', '16BEAT'),
+        (18, 'HipHopLight', '16BEAT'),
+        (19, 'PianoBallad', 'BALLAD'),
+        (20, 'LoveSong', 'BALLAD'),
+        (21, '6/8ModernEP', 'BALLAD'),
+        (22, '6/8SlowRock', 'BALLAD'),
+        (23, 'OrganBallad', 'BALLAD'),
+        (24, 'PopBallad', 'BALLAD'),
+        (25, '16BeatBallad1', 'BALLAD'),
+        (26, '16BeatBallad2', 'BALLAD'),
+        (27, 'EuroTrance', 'DANCE'),
+        (28, 'Ibiza', 'DANCE'),
+        (29, 'HouseMusik', 'DANCE'),
+        (30, 'SwingHouse', 'DANCE'),
+        (31, 'TechnoPolis', 'DANCE'),
+        (32, 'Clubdance', 'DANCE'),
+        (33, 'ClubLatin', 'DANCE'),
+        (34, 'Garage1', 'DANCE'),
+        (35, 'Garage2', 'DANCE'),
+        (36, 'TechnoParty', 'DANCE'),
+        (37, 'UKPop', 'DANCE'),
+        (38, 'HipHopGroove', 'DANCE'),
+        (39, 'HipShuffle', 'DANCE'),
+        (40, 'HipHopPop', 'DANCE'),
+        (41, "70'sDisco1", 'DISCO'),
+        (42, "70'sDisco2", 'DISCO'),
+        (43, 'LatinDisco', 'DISCO'),
+        (44, 'DiscoPhilly', 'DISCO'),
+        (45, 'SaturdayNight', 'DISCO'),
+        (46, 'DiscoChocolate', 'DISCO'),
+        (47, 'DiscoHands', 'DISCO'),
+        (48, 'BigBandFast', 'SWING&JAZZ'),
+        (49, 'BigBandMedium', 'SWING&JAZZ'),
+        (50, 'BigBandBallad', 'SWING&JAZZ'),
+        (51, 'BigBandShuffle', 'SWING&JAZZ'),
+        (52, 'JazzClub', 'SWING&JAZZ'),
+        (53, 'Swing1', 'SWING&JAZZ'),
+        (54, 'Swing2', 'SWING&JAZZ'),
+        (55, 'Five/Four', 'SWING&JAZZ'),
+        (56, 'JazzBallad', 'SWING&JAZZ'),
+        (57, 'Dixieland', 'SWING&JAZZ'),
+        (58, 'Ragtime', 'SWING&JAZZ'),
+        (59, 'AfroCuban', 'SWING&JAZZ'),
+        (60, 'Charleston', 'SWING&JAZZ'),
+        (61, 'Soul', 'R&B'),
+        (62, 'DetroitPop1', 'R&B'),
+        (63, "60'sRock&Roll", 'R&B'),
+        (64, '6/8Soul', 'R&B'),
+        (65, 'CrocoTwist', 'R&B'),
+        (66, 'Rock&Roll', 'R&B'),
+        (67, 'DetroitPop2', 'R&B'),
+        (68, 'BoogieWoogie', 'R&B'),
+        (69, 'ComboBoogie', 'R&B'),
+        (70, '6/8Blues', 'R&B'),
+        (71, 'Country8Beat', 'COUNTRY'),
+        (72, 'CountryPop', 'COUNTRY'),
+        (73, 'CountrySwing', 'COUNTRY'),
+        (74, 'Country2/4', 'COUNTRY'),
+        (75, 'CowboyBoogie', 'COUNTRY'),
+        (76, 'CountryShuffle', 'COUNTRY'),
+        (77, 'Bluegrass', 'COUNTRY'),
+        (78, 'BrazilianSamba', 'LATIN'),
+        (79, 'BossaNova', 'LATIN'),
+        (80, 'PopBossa', 'LATIN'),
+        (81, 'Tijuana', 'LATIN'),
+        (82, 'DiscoLatin', 'LATIN'),
+        (83, 'Mambo', 'LATIN'),
+        (84, 'Salsa', 'LATIN'),
+        (85, 'Beguine', 'LATIN'),
+        (86, 'GuitarRumba', 'LATIN'),
+        (87, 'RumbaFlamenca', 'LATIN'),
+        (88, 'RumbaIsland', 'LATIN'),
+        (89, 'Reggae', 'LATIN'),
+        (90, 'VienneseWaltz', 'BALLROOM'),
+        (91, 'EnglishWaltz', 'BALLROOM'),
+        (92, 'Slowfox', 'BALLROOM'),
+        (93, 'Foxtrot', 'BALLROOM'),
+        (94, 'Quickstep', 'BALLROOM'),
+        (95, 'Tango', 'BALLROOM'),
+        (96, 'Pasodoble', 'BALLROOM'),
+        (97, 'Samba', 'BALLROOM'),
+        (98, 'ChaChaCha', 'BALLROOM'),
+        (99, 'Rumba', 'BALLROOM'),
+        (100, 'Jive', 'BALLROOM'),
+        (101, 'USMarch', 'TRADITIONAL'),
+        (102, '6/8March', 'TRADITIONAL'),
+        (103, 'GermanMarch', 'TRADITIONAL'),
+        (104, 'PolkaPop', 'TRADITIONAL'),
+        (105, 'OberPolka', 'TRADITIONAL'),
+        (106, 'Tarantella', 'TRADITIONAL'),
+        (107, 'Showtune', 'TRADITIONAL'),
+        (108, 'ChristmasSwing', 'TRADITIONAL'),
+        (109, 'ChristmasWaltz', 'TRADITIONAL'),
+        (110, 'ScottishReel', 'TRADITIONAL'),
+        (111, 'Hawaiian', 'TRADITIONAL'),
+        (112, 'GuitarSerenade', 'WALTZ'),
+        (113, 'SwingWaltz', 'WALTZ'),
+        (114, 'JazzWaltz1', 'WALTZ'),
+        (115, 'JazzWaltz2', 'WALTZ'),
+        (116, 'CountryWaltz', 'WALTZ'),
+        (117, 'OberWaltzer', 'WALTZ'),
+        (118, 'Musette', 'WALTZ'),
+        (119, 'DJ-HipHop', 'DJ'),
+        (120, 'DJ-DanceSwing', 'DJ'),
+        (121, 'DJ-House', 'DJ'),
+        (122, 'DJ-GarageHouse', 'DJ'),
+        (123, 'DJ-PopR&B', 'DJ'),
+        (124, 'Stride', 'PIANIST'),
+        (125, 'PianoSwing', 'PIANIST'),
+        (126, 'PianoRag', 'PIANIST'),
+        (127, 'Arpeggio', 'PIANIST'),
+        (128, 'Musical', 'PIANIST'),
+        (129, 'Habanera', 'PIANIST'),
+        (130, 'SlowRock', 'PIANIST'),
+        (131, '8BtPianoBallad', 'PIANIST'),
+        (132, 'PianoMarch', 'PIANIST'),
+        (133, '6/8PianoMarch', 'PIANIST'),
+        (134, 'PianoWaltz', 'PIANIST'),
+        (135, 'PianoBeguine', 'PIANIST'),
+        (136, '(External Style)', 'MEMORY CARD'),
+    ),
+    'tables/chords.csv': (
+        (0, 'major', 'M', '{}', '{}'),
+        (1, 'sixth', '6', '{}6', '{}6'),
+        (2, 'major seventh', 'M7', '{}M7', '{}M7'),
+        (3, 'major seventh add sharp eleventh', 'M7(♯11)', '{}M7(♯11)', '{}M7^♯11'),
+        (4, 'add ninth', '(9)', '{}(9)', '{}9'),
+        (5, 'major seventh ninth', 'M7(9)', '{}M7(9)', '{}m7^9'),
+        (6, 'sixth ninth', '6(9)', '{}6(9)', '{}6^9'),
+        (7, 'augmented', 'aug', '{}aug', '{}aug'),
+        (8, 'minor', 'm', '{}m', '{}m'),
+        (9, 'minor sixth', 'm6', '{}m6', '{}m6'),
+        (10, 'minor seventh', 'm7', '{}m7', '{}m7'),
+        (11, 'minor seventh flatted fifth', 'm7♭5', '{}m7♭5', '{}m7^♭5'),
+        (12, 'minor add ninth', 'm(9)', '{}m(9)', '{}m9'),
+        (13, 'minor seventh ninth', 'm7(9)', '{}m7(9)', '{}m7^9'),
+        (14, 'minor seventh add eleventh', 'm7(11)', '{}m7(11)', '{}m7^11'),
+        (15, 'minor major seventh', 'mM7', '{}mM7', '{}mM7'),
+        (16, 'minor major seventh ninth', 'mM7(9)', '{}mM7(9)', '{}mM7^9'),
+        (17, 'diminished', 'dim', '{}dim', '{}dim'),
+        (18, 'diminished seventh', 'dim7', '{}dim7', '{}dim7'),
+        (19, 'seventh', '7', '{}7', '{}7'),
+        (20, 'seventh suspended fourth', '7sus4', '{}7sus4', '{}7sus4'),
+        (21, 'seventh flatted fifth', '7♭5', '{}7♭5', '{}7^♭5'),
+        (22, 'seventh ninth', '7(9)', '{}7(9)', '{}7^9'),
+        (23, 'seventh add sharp eleventh', '7(♯11)', '{}7(♯11)', '{}7^♯11'),
+        (24, 'seventh add thirteenth', '7(13)', '{}7(13)', '{}7^13'),
+        (25, 'seventh flatted ninth', '7(♭9)', '{}7(♭9)', '{}7^♭9'),
+        (26, 'seventh add flatted thirteenth', '7(♭13)', '{}7(♭13)', '{}7^♭13'),
+        (27, 'seventh sharp ninth', '7(♯9)', '{}7(♯9)', '{}7^♯9'),
+        (28, 'major seventh augmented', 'M7aug', '{}M7aug', '{}M7aug'),
+        (29, 'seventh augmented', '7aug', '{}7aug', '{}7aug'),
+        (30, 'octave', '1+8', '{}1+8', '{}1+8'),
+        (31, 'perfect fifth', '1+5', '{}1+5', '{}1+5'),
+        (32, 'suspended fourth', 'sus4', '{}sus4', '{}sus4'),
+        (33, 'suspended second', 'sus2', '{}sus2', '{}sus2'),
+        (34, '(no chord)', 'cc', '[{}cc]', ''),
+        (35, 'major seventh flatted fifth', 'M7♭5', '{}M7♭5', '{}m7^♭5'),
+        (36, 'flatted fifth', '(♭5)', '{}(♭5)', '{}^♭5'),
+        (37, 'minor major seventh flatted fifth', 'mM7♭5', '{}mM7♭5', '{}mM7^♭5'),
+        (38, '(1+♭2+♭3)', '(1+♭2+♭3)', '[{}* (1+♭2+♭3)]', '{}*'),
+        (39, '(1+♭2+♭5)', '(1+♭2+♭5)', '[{}* (1+♭2+♭5)]', '{}*'),
+        (40, '(1+♭2+5)', '(1+♭2+5)', '[{}* (1+♭2+5)]', '{}*'),
+        (41, '(1+♭2+♭7)', '(1+♭2+♭7)', '[{}* (1+♭2+♭7)]', '{}*'),
+        (42, '(1+2+3)', '(1+2+3)', '[{}* (1+2+3)]', '{}*'),
+    ),
+}
@@ -14,12 +14,14 @@ from ..values import (RootNote, NoteBase, NoteAcc,
 
 ChordType = collections.namedtuple('ChordType', 'code name abbr abbr_format disp_format')
 
+CHORD_TABLE = table_util.TableSpec(
+    'tables/chords.csv', ChordType, (partial(int, base=16), str, str, str, str))
+
 class _ChordLookup(object):
 
     @util.lazy_property
     def codes(self):
-        return table_util.read_csv_table_namedtuple_listmapping(
-            'tables/chords.csv', ChordType, [partial(int, base=16), str, str, str, str])
+        return table_util.read_table_namedtuple_listmapping(CHORD_TABLE)
 
     @util.lazy_property
     def names(self):
@@ -0,0 +1,230 @@
+"""
+lookup.py
+
+One precomputed index for looking up the voices, styles and chords,
+by number or code (flat lists, or a dict keyed by a packed integer for
+the bank/program triples) and by name (case-insensitive, with prefix search).
+The index is built on first use.
+"""
+
+import bisect
+import collections
+
+from . import voices, styles, chords
+from .. import util
+
+VOICE = 'voice'
+STYLE = 'style'
+CHORD = 'chord'
+
+NameEntry = collections.namedtuple("NameEntry", "key kind name value")
+
+
+def pack_bank_program(msb, lsb, prog):
+    """Pack the bank and program bytes into one integer key"""
+    return (msb << 14) | (lsb << 7) | prog
+
+
+def normalise_name(name):
+    """The form of a name used for matching: casefolded, single spaces"""
+    return " ".join(name.casefold().split())
+
+
+# useless class, again
+class _LookupIndex(object):
+
+    @util.lazy_property
+    def voice_numbers(self):
+        # index = number. 0 is unused.
+        table = [None] * (max(voices._LOOKUP.numbers) + 1)
+        for number, voice in voices._LOOKUP.numbers.items():
+            table[number] = voice
+        return table
+
+    @util.lazy_property
+    def bank_programs(self):
+        return {pack_bank_program(*key): voice
+                for key, voice in voices._LOOKUP.bank_programs.items()}
+
+    @util.lazy_property
+    def style_numbers(self):
+        table = [None] * (max(styles._LOOKUP.numbers) + 1)
+        for number, style in styles._LOOKUP.numbers.items():
+            table[number] = style
+        return table
+
+    @util.lazy_property
+    def chord_codes(self):
+        # one for every byte value, None for invalid codes
+        table = [None] * 0x100
+        for code, ctype in chords.CHORDS.codes.items():
+            table[code] = ctype
+        return table
+
+    @util.lazy_property
+    def root_notes(self):
+        # likewise.
+        table = [None] * 0x100
+        for byte in range(0x100):
+            try:
+                table[byte] = chords.byte_note(byte)
+            except KeyError:
+                pass
+        return table
+
+    @util.lazy_property
+    def names(self):
+        # normalised name -> list of entries, in table order
+        # (so for voices the non-XG voice comes first)
+        names = collections.OrderedDict()
+
+        def add(kind, name, value):
+            key = normalise_name(name)
+            entries = names.setdefault(key, [])
+            # no duplicates for the same thing
+            if not any(e.value is value for e in entries):
+                entries.append(NameEntry(key, kind, name, value))
+
+        for voice in self.voice_numbers[1:]:
+            add(VOICE, voice.name, voice)
+            add(VOICE, voice.fullname, voice)
+        for style in self.style_numbers[1:]:
+            add(STYLE, style.name, style)
+        for ctype in chords.CHORDS.codes.values():
+            add(CHORD, ctype.name, ctype)
+        return names
+
+    @util.lazy_property
+    def sorted_names(self):
+        return sorted(self.names)
+
+
+_INDEX = _LookupIndex()
+
+
+def voice_from_number(number):
+    """
+    Look up a voice by number.
+    KeyError raised if no voice has that number.
+    """
+    if number > 0:
+        try:
+            voice = _INDEX.voice_numbers[number]
+        except (IndexError, TypeError):
+            pass
+        else:
+            if voice is not None:
+                return voice
+    raise KeyError(number)
+
+
+def voice_from_bank_program(msb, lsb, prog):
+    """
+    Look up a voice by bank and program bytes (as voices.from_bank_program).
+    KeyError raised if no voice has those bytes.
+    """
+    try:
+        return _INDEX.bank_programs[pack_bank_program(msb, lsb, prog)]
+    except KeyError:
+        raise KeyError((msb, lsb, prog))
+
+
+def voice_from_bank_program_default(msb, lsb, prog):
+    """
+    As voices.from_bank_program_default:
+    Returns None to indicate no change to the voice,
+    SILENT to indicate that the voice is deactivated,
+    or the voice.
+    """
+    bank_programs = _INDEX.bank_programs
+    if msb == 0x7F:  # Drum Kit. Ignore LSB.
+        return bank_programs.get(pack_bank_program(msb, 0, prog))
+    voice = bank_programs.get(pack_bank_program(msb, lsb, prog))
+    if voice is None and msb != 0x7E:
+        # Fall back to LSB 0 (but not for the SFX Kit)
+        voice = bank_programs.get(pack_bank_program(msb, 0, prog))
+    if voice is None:
+        return voices.SILENT
+    return voice
+
+
+def style_from_number(number):
+    """
+    Look up a style by number.
+    KeyError raised if no style has that number.
+    """
+    if number > 0:
+        try:
+            style = _INDEX.style_numbers[number]
+        except (IndexError, TypeError):
+            pass
+        else:
+            if style is not None:
+                return style
+    raise KeyError(number)
+
+
+def chord_type(code):
+    """
+    Look up a chords.ChordType by its code byte.
+    KeyError raised if no chord type has that code.
+    """
+    ctype = _INDEX.chord_codes[code]
+    if ctype is None:
+        raise KeyError(code)
+    return ctype
+
+
+def chord_from_bytes(chordbytes):
+    """
+    As chords.byte_chord: get the Chord for the four chord bytes.
+    KeyError raised for invalid notes or chord types,
+    ValueError for an invalid combination.
+    """
+    cr, ct, bn, bt = chordbytes
+    root_notes = _INDEX.root_notes
+    chord_codes = _INDEX.chord_codes
+    root = root_notes[cr]
+    bass = root_notes[bn]
+    ctype = chord_codes[ct]
+    btype = chord_codes[bt]
+    if root is None or bass is None or ctype is None or btype is None:
+        raise KeyError(chordbytes)
+    if (cr, ct) == (bn, bt):
+        return chords.Chord(root, ctype)
+    elif bt == chords.BASS_CODE:
+        return chords.Chord(root, ctype, bass)
+    raise ValueError(chordbytes)
+
+
+def from_name(name, kind=None):
+    """
+    Look up a voice, style or chord type by name, ignoring case and extra
+    spaces. kind (VOICE, STYLE or CHORD) restricts it to one table.
+    For duplicate names, the earlier one in the table wins
+    (so non-XG voices are preferred, like voices.from_name).
+    KeyError raised if nothing has that name.
+    """
+    for entry in _INDEX.names.get(normalise_name(name), ()):
+        if kind is None or entry.kind == kind:
+            return entry.value
+    raise KeyError(name)
+
+
+def search(prefix, kind=None):
+    """
+    List of the NameEntry for all the names starting with prefix
+    (ignoring case and extra spaces), in alphabetical order of the name.
+    kind (VOICE, STYLE or CHORD) restricts it to one table.
+    """
+    key = normalise_name(prefix)
+    sorted_names = _INDEX.sorted_names
+    names = _INDEX.names
+    results = []
+    for i in range(bisect.bisect_left(sorted_names, key), len(sorted_names)):
+        name = sorted_names[i]
+        if not name.startswith(key):
+            break
+        results.extend(e for e in names[name]
+                       if kind is None or e.kind == kind)
+    return results
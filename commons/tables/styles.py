@@ -13,11 +13,14 @@ class Style(collections.namedtuple('Style', 'number name category')):
     def __str__(self):
         return f"{self.number:03d} {self.name}"
 
+STYLE_TABLE = table_util.TableSpec(
+    'tables/styles.csv', Style, (int, str, str))
+
 class _StyleLookup(object):
     @util.lazy_property
     def numbers(self):
-        return table_util.read_csv_table_namedtuple_listmapping(
-            'tables/styles.csv', Style, [int, str, str], start=1)
+        return table_util.read_table_namedtuple_listmapping(
+            STYLE_TABLE, start=1)
 
     @util.lazy_property
     def names(self):
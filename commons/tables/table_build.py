@@ -0,0 +1,91 @@
+"""
+table_build.py
+
+Compile the CSV tables into a Python module (_compiled.py), so that the
+lookups don't need to read and parse the CSV files in every process.
+
+Run as: python -m commons.tables.table_build [--check]
+Rerun whenever the CSV files change. With --check, nothing is written and
+the exit status is nonzero if the compiled module is missing or out of date.
+"""
+
+import argparse
+import os
+import sys
+
+from . import table_util, voices, styles, chords
+
+TABLE_SPECS = (voices.VOICE_TABLE, styles.STYLE_TABLE, chords.CHORD_TABLE)
+
+COMPILED_PATH = os.path.join(os.path.dirname(__file__), '_compiled.py')
+
+
+def csv_rows(spec):
+    """The rows of the table, as plain tuples, read from the CSV file"""
+    return [tuple(nt) for nt in table_util.read_table_namedtuple(
+        spec, use_compiled=False)]
+
+
+def compiled_source(specs=TABLE_SPECS):
+    """The source code of the compiled module, as a string"""
+    lines = [
+        '"""',
+        '_compiled.py',
+        '',
+        'Generated by table_build.py from the CSV tables. Do not edit.',
+        '"""',
+        '',
+        '# sha256 of the CSV files these were built from',
+        'DIGESTS = {',
+    ]
+    for spec in specs:
+        lines.append(f'    {spec.resource!r}: '
+                     f'{table_util.csv_digest(spec.resource)!r},')
+    lines.append('}')
+    lines.append('')
+    lines.append('TABLES = {')
+    for spec in specs:
+        lines.append(f'    {spec.resource!r}: (')
+        for row in csv_rows(spec):
+            lines.append(f'        {row!r},')
+        lines.append('    ),')
+    lines.append('}')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def stale_tables(specs=TABLE_SPECS):
+    """
+    List of the resources of the tables where the compiled module
+    is missing, or doesn't match the CSV file.
+    """
+    try:
+        from . import _compiled
+    except ImportError:
+        return [spec.resource for spec in specs]
+    return [spec.resource for spec in specs
+            if (_compiled.DIGESTS.get(spec.resource)
+                != table_util.csv_digest(spec.resource))
+            or _compiled.TABLES.get(spec.resource) != tuple(csv_rows(spec))]
+
+
+def build(path=COMPILED_PATH, specs=TABLE_SPECS):
+    """Write out the compiled module"""
+    source = compiled_source(specs)
+    with open(path, 'w', encoding='utf8') as outfile:
+        outfile.write(source)
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(
+        description="Compile the CSV tables into _compiled.py")
+    argparser.add_argument(
+        '--check', action='store_true',
+        help="Only check that the compiled tables are up to date")
+    args = argparser.parse_args()
+    if args.check:
+        stale = stale_tables()
+        for resource in stale:
+            print(f"Out of date: {resource}", file=sys.stderr)
+        sys.exit(1 if stale else 0)
+    build()
@@ -4,6 +4,8 @@ table_util.py
 Getting stuff out of the CSV tables
 """
 
+import collections
+import hashlib
 import pkgutil
 import csv
 
@@ -13,6 +15,12 @@ from ..util import ListMapping
 class TableUtilError(Exception):
     pass
 
+
+# Everything needed to read a table:
+# the resource name (of the CSV file), the namedtuple, and the factories.
+TableSpec = collections.namedtuple("TableSpec",
+    "resource constructor factories")
+
 def read_csv_table(resource, package=__name__, encoding='utf8', **kwargs):
     """
     Read the data in from the CSV file specified by resource.
@@ -69,3 +77,45 @@ def read_csv_table_namedtuple_listmapping(resource, constructor, factories=None,
             resource, constructor, factories, header,
             package, encoding, **kwargs)
     return ListMapping(((t[0], t) for t in nts), start)
+
+
+def csv_digest(resource, package=__name__):
+    """
+    sha256 hex digest of the CSV file specified by resource.
+    """
+    return hashlib.sha256(pkgutil.get_data(package, resource)).hexdigest()
+
+
+def compiled_rows(resource):
+    """
+    The rows (tuples of values, with factories already applied) of the
+    table from the generated _compiled module (see table_build.py),
+    or None if there isn't one (or it doesn't have the table).
+    """
+    try:
+        from . import _compiled
+    except ImportError:
+        return None
+    return _compiled.TABLES.get(resource)
+
+
+def read_table_namedtuple(spec, use_compiled=True):
+    """
+    Yield the rows of the table specified by the TableSpec as namedtuples,
+    from the compiled tables if available (and use_compiled),
+    otherwise from the CSV file (with read_csv_table_namedtuple).
+    """
+    rows = compiled_rows(spec.resource) if use_compiled else None
+    if rows is None:
+        return read_csv_table_namedtuple(
+            spec.resource, spec.constructor, spec.factories)
+    return map(spec.constructor._make, rows)
+
+
+def read_table_namedtuple_listmapping(spec, start=0, use_compiled=True):
+    """
+    Uses read_table_namedtuple to get the namedtuples, and puts them
+    in a ListMapping keyed by the first field.
+    """
+    nts = read_table_namedtuple(spec, use_compiled)
+    return ListMapping(((t[0], t) for t in nts), start)
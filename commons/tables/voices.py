@@ -26,6 +26,9 @@ class Voice(collections.namedtuple("Voice",
             n = format(self.number, "03d")
         return f"{n} {self.name}"
 
+VOICE_TABLE = table_util.TableSpec(
+    'tables/voices.csv', Voice, (int, str, str, str, int, int, int))
+
 # The Silent None Voice.
 # must redo this properly.....
 SILENT = Voice(None, None, None, None, None, None, None)
@@ -45,9 +48,7 @@ class _VoiceLookup(object):
         _names_xg = {}
         # read in data from csv file
         full_name_count = 0
-        for r_voice in table_util.read_csv_table_namedtuple(
-            'tables/voices.csv', Voice, (int, str, str, str, int, int, int)
-        ):
+        for r_voice in table_util.read_table_namedtuple(VOICE_TABLE):
             # The fullnames are not included if different from name,
             # so we manually handle that
             if r_voice.fullname:
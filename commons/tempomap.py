@@ -0,0 +1,149 @@
+"""
+tempomap.py
+
+An index of the tempo changes (and time signatures) of a song, made once
+from its time track (Track A of a user song, or track 0 of a MIDI file),
+so that converting between ticks and seconds, or finding where a measure
+starts, is a binary search instead of going through the whole song.
+"""
+
+import bisect
+import collections
+
+# (as in the MIDI file spec)
+DEFAULT_TEMPO = 500000
+DEFAULT_TIME_SIGNATURE = (4, 4)
+
+# ticks per beat (quarter note) of the user songs
+USER_SONG_TICKS_PER_BEAT = 96
+
+TimeSignatureChange = collections.namedtuple(
+    "TimeSignatureChange", "tick measure numerator denominator")
+
+
+class TempoMap(object):
+    """
+    tempo_changes: iterable of (tick, tempo) in order, tempo being
+        microseconds per beat (as in the set tempo meta event)
+    ticks_per_beat: the resolution of the ticks
+    time_signatures: iterable of (tick, numerator, denominator) in order
+
+    Attributes (parallel lists, one entry per tempo breakpoint,
+    the first always at tick 0):
+    ticks: the tick of each breakpoint
+    micros: the time of each breakpoint, in microseconds from the start
+    tempos: the tempo from each breakpoint on
+    """
+    def __init__(self, tempo_changes=(),
+                 ticks_per_beat=USER_SONG_TICKS_PER_BEAT, time_signatures=()):
+        self.ticks_per_beat = ticks_per_beat
+        self.ticks = [0]
+        self.micros = [0.0]
+        self.tempos = [DEFAULT_TEMPO]
+        for tick, tempo in tempo_changes:
+            if tick < self.ticks[-1]:
+                raise ValueError("Tempo changes out of order")
+            if tick == self.ticks[-1]:
+                # the later one wins
+                self.tempos[-1] = tempo
+                continue
+            self.micros.append(self.micros[-1] + (tick - self.ticks[-1])
+                               * self.tempos[-1] / ticks_per_beat)
+            self.ticks.append(tick)
+            self.tempos.append(tempo)
+
+        self.time_signatures = [TimeSignatureChange(
+            0, 1, *DEFAULT_TIME_SIGNATURE)]
+        for tick, numerator, denominator in time_signatures:
+            last = self.time_signatures[-1]
+            if tick < last.tick:
+                raise ValueError("Time signatures out of order")
+            # (a change part way through a measure starts a new one)
+            measures = -(-(tick - last.tick) // self._measure_ticks(last))
+            change = TimeSignatureChange(
+                tick, last.measure + measures, numerator, denominator)
+            if tick == last.tick:
+                self.time_signatures[-1] = change._replace(
+                    measure=last.measure)
+            else:
+                self.time_signatures.append(change)
+        self._signature_measures = [s.measure for s in self.time_signatures]
+        self._signature_ticks = [s.tick for s in self.time_signatures]
+
+    @classmethod
+    def from_track_events(cls, events,
+                          ticks_per_beat=USER_SONG_TICKS_PER_BEAT):
+        """
+        Make from the songevents.TrackEvents of a time track (Track A).
+        """
+        # (imported here, so as not to need the song data otherwise)
+        from .dumpdata import songevents
+        tempo_changes = (
+            (tick, int.from_bytes(data, 'big'))
+            for tick, data in events.iter_meta(songevents.META_TEMPO))
+        time_signatures = (
+            (tick, data[0], 2**data[1])
+            for tick, data in events.iter_meta(
+                songevents.META_TIME_SIGNATURE))
+        return cls(tempo_changes, ticks_per_beat, time_signatures)
+
+    @classmethod
+    def from_midi_track(cls, track, ticks_per_beat):
+        """
+        Make from a mido.MidiTrack (track 0 of a MIDI file, or all the
+        tracks merged)
+        """
+        tempo_changes = []
+        time_signatures = []
+        tick = 0
+        for message in track:
+            tick += message.time
+            if message.type == 'set_tempo':
+                tempo_changes.append((tick, message.tempo))
+            elif message.type == 'time_signature':
+                time_signatures.append(
+                    (tick, message.numerator, message.denominator))
+        return cls(tempo_changes, ticks_per_beat, time_signatures)
+
+    def tempo_at(self, tick):
+        """The tempo at the tick"""
+        return self.tempos[max(bisect.bisect_right(self.ticks, tick) - 1, 0)]
+
+    def tick_to_seconds(self, tick):
+        """Seconds from the start to the tick"""
+        i = max(bisect.bisect_right(self.ticks, tick) - 1, 0)
+        return (self.micros[i] + (tick - self.ticks[i])
+                * self.tempos[i] / self.ticks_per_beat) / 1e6
+
+    def seconds_to_tick(self, seconds):
+        """The tick (as a float) at seconds from the start"""
+        micros = seconds * 1e6
+        i = max(bisect.bisect_right(self.micros, micros) - 1, 0)
+        return (self.ticks[i] + (micros - self.micros[i])
+                * self.ticks_per_beat / self.tempos[i])
+
+    def _measure_ticks(self, signature):
+        # length of a measure, in ticks
+        return (self.ticks_per_beat * 4 * signature.numerator
+                // signature.denominator)
+
+    def measure_to_tick(self, measure):
+        """The tick where the measure (numbered from 1) starts"""
+        if measure < 1:
+            raise ValueError(f"Invalid measure: {measure}")
+        i = bisect.bisect_right(self._signature_measures, measure) - 1
+        signature = self.time_signatures[i]
+        return (signature.tick
+                + (measure - signature.measure)
+                * self._measure_ticks(signature))
+
+    def tick_to_measure(self, tick):
+        """
+        (measure, beat tick) for the tick: the measure it's in (from 1)
+        and how many ticks into the measure it is
+        """
+        i = max(bisect.bisect_right(self._signature_ticks, tick) - 1, 0)
+        signature = self.time_signatures[i]
+        measures, rem = divmod(tick - signature.tick,
+                               self._measure_ticks(signature))
+        return signature.measure + measures, rem
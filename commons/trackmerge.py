@@ -0,0 +1,97 @@
+"""
+trackmerge.py
+
+Merging the tracks of a Standard MIDI File (mido.MidiTrack objects) into
+one stream, in playback order, without copying any of the messages.
+Each track is walked lazily, with absolute ticks, and the tracks are merged
+with a heap, giving (tick, track number, message) records.
+"""
+
+import heapq
+import operator
+
+import mido
+
+# (mido's default, as in the MIDI file spec)
+DEFAULT_TEMPO = 500000
+
+# the one end of track message at the end of a merge
+END_OF_TRACK = mido.MetaMessage('end_of_track')
+
+
+def iter_track_ticks(track, track_number=0, types=None):
+    """
+    Yields (tick, track_number, message) for each message in the track,
+    where tick is the absolute time in ticks.
+    types: only yield the messages of these types
+    (the ticks still count all of them)
+    """
+    tick = 0
+    for message in track:
+        tick += message.time
+        if types is None or message.type in types:
+            yield tick, track_number, message
+
+
+def merge_track_records(record_iters):
+    """
+    Merge iterables of (tick, track number, message) records (each in tick
+    order, e.g. from iter_track_ticks) into one, in tick order.
+    Records with the same tick come out in the order of the iterables,
+    which is the same order as mido.merge_tracks.
+    Also like mido.merge_tracks, the end of track messages are left out,
+    and one (END_OF_TRACK) comes at the end, at the last tick.
+    """
+    last = (0, None)
+    for record in heapq.merge(*record_iters, key=operator.itemgetter(0)):
+        if record[2].type != 'end_of_track':
+            yield record
+        last = record
+    yield last[0], last[1], END_OF_TRACK
+
+
+def merge_tracks(tracks, track_numbers=None):
+    """
+    Merge the tracks, as merge_track_records.
+    track_numbers: the numbers to give the tracks in the records
+    (by default, their indices)
+    """
+    if track_numbers is None:
+        track_numbers = range(len(tracks))
+    return merge_track_records(
+        [iter_track_ticks(track, number)
+         for track, number in zip(tracks, track_numbers)])
+
+
+def iter_delta_seconds(records, ticks_per_beat, tempo=DEFAULT_TEMPO):
+    """
+    Yields (delta, track number, message) for merged records,
+    where delta is the time in seconds since the previous record,
+    following the tempo changes (0 if none).
+    These are exactly the times of the messages when iterating over
+    a mido.MidiFile.
+    """
+    last_tick = 0
+    for tick, track_number, message in records:
+        if tick > last_tick:
+            delta = mido.tick2second(tick - last_tick, ticks_per_beat, tempo)
+            last_tick = tick
+        else:
+            delta = 0
+        yield delta, track_number, message
+        if message.type == 'set_tempo':
+            tempo = message.tempo
+
+
+def iter_seconds(records, ticks_per_beat, tempo=DEFAULT_TEMPO):
+    """
+    Yields (seconds, track number, message) for merged records,
+    where seconds is the time from the start.
+    (added up from iter_delta_seconds, so the numbers are the same as
+    adding up the times when iterating over a mido.MidiFile)
+    """
+    seconds = 0
+    for delta, track_number, message in iter_delta_seconds(
+            records, ticks_per_beat, tempo):
+        seconds += delta
+        yield seconds, track_number, message
@@ -0,0 +1,174 @@
+"""
+transfer.py
+
+Keeping track of a bulk dump transfer as it comes in: the data rate,
+the messages received so far against the number expected, an ETA,
+and how long the gaps between messages were,
+with deadlines so that a stalled transfer can be given up on.
+"""
+
+import bisect
+import time
+
+from .exceptions import TransferTimeoutError
+from .dumpdata.messages import SongDumpSection, RegDumpSection
+
+# The number of messages in a full dump
+EXPECTED_COUNT = (SongDumpSection.EXPECTED_COUNT
+                  + RegDumpSection.EXPECTED_COUNT)
+
+# upper bounds of the gap histogram bins, in seconds (the last is open)
+GAP_BINS = (0.001, 0.01, 0.1, 1.0)
+
+
+def _gap_bin_label(i):
+    def ms(x):
+        return f"{x*1000:g}ms"
+    if i == 0:
+        return f"< {ms(GAP_BINS[0])}"
+    elif i == len(GAP_BINS):
+        return f">= {ms(GAP_BINS[-1])}"
+    return f"{ms(GAP_BINS[i-1])}-{ms(GAP_BINS[i])}"
+
+
+class TransferMonitor(object):
+    """
+    Records the sysex messages of a transfer as they come in (with feed).
+    expected_count: the number of messages expected, None if not known.
+    clock: the time function to use (time.monotonic by default)
+    """
+    def __init__(self, expected_count=EXPECTED_COUNT, clock=time.monotonic):
+        self.expected_count = expected_count
+        self._clock = clock
+        self.start_time = clock()
+        self.first_time = None
+        self.last_time = None
+        self.count = 0
+        self.byte_count = 0
+        self.max_gap = 0.0
+        self.gap_counts = [0] * (len(GAP_BINS) + 1)
+
+    def feed(self, message):
+        """
+        Record a message as received now.
+        Anything other than sysex is ignored.
+        """
+        if message.type != 'sysex':
+            return
+        now = self._clock()
+        if self.last_time is None:
+            self.first_time = now
+        else:
+            gap = now - self.last_time
+            self.gap_counts[bisect.bisect_right(GAP_BINS, gap)] += 1
+            self.max_gap = max(self.max_gap, gap)
+        self.last_time = now
+        self.count += 1
+        # (plus the F0 and F7)
+        self.byte_count += len(message.data) + 2
+
+    @property
+    def elapsed(self):
+        """Seconds since the first message (0 if none yet)"""
+        if self.first_time is None:
+            return 0.0
+        return self._clock() - self.first_time
+
+    @property
+    def rate(self):
+        """Bytes per second, from the first message to the last"""
+        if self.count < 2 or self.last_time == self.first_time:
+            return None
+        return self.byte_count / (self.last_time - self.first_time)
+
+    @property
+    def eta(self):
+        """
+        Estimated seconds until the last message, from the average gap
+        so far. None if it can't be estimated.
+        """
+        if self.expected_count is None or self.count < 2:
+            return None
+        remaining = max(self.expected_count - self.count, 0)
+        mean_gap = (self.last_time - self.first_time) / (self.count - 1)
+        return remaining * mean_gap
+
+    def now(self):
+        """The time now, by the monitor's clock"""
+        return self._clock()
+
+    def since_start(self):
+        """Seconds since the monitor started (waiting time included)"""
+        return self._clock() - self.start_time
+
+    def idle(self):
+        """Seconds since the last message (or since starting, if none)"""
+        if self.last_time is None:
+            return self.since_start()
+        return self._clock() - self.last_time
+
+    def status_line(self):
+        """A one-line progress report"""
+        expected = "?" if self.expected_count is None else self.expected_count
+        rate = self.rate
+        rate_str = "-" if rate is None else f"{rate/1000:.1f} kB/s"
+        eta = self.eta
+        eta_str = "-" if eta is None else f"{eta:.1f} s"
+        return (f"Message {self.count}/{expected}, {self.byte_count} bytes, "
+                f"{rate_str}, ETA {eta_str}")
+
+    def summary_lines(self):
+        """A report on the whole transfer so far, gap histogram included"""
+        rate = self.rate
+        rate_str = "-" if rate is None else f"{rate/1000:.2f} kB/s"
+        lines = [
+            f"Messages: {self.count}"
+            + ("" if self.expected_count is None
+               else f" of {self.expected_count}"),
+            f"Bytes: {self.byte_count}",
+            f"Time: {self.elapsed:.2f} s",
+            f"Rate: {rate_str}",
+            f"Longest gap: {self.max_gap*1000:.1f} ms",
+            "Gaps between messages:",
+        ]
+        width = max(len(_gap_bin_label(i)) for i in range(len(GAP_BINS)+1))
+        for i, count in enumerate(self.gap_counts):
+            lines.append(f" {_gap_bin_label(i):>{width}}: {count}")
+        return lines
+
+
+def monitor_messages(source, monitor, message_timeout=None,
+                     total_timeout=None, poll_interval=0.01):
+    """
+    Generator, yields the messages from source, feeding each to the monitor.
+    TransferTimeoutError raised if more than message_timeout seconds pass
+    between messages (not counting the wait for the first message),
+    or total_timeout seconds since the monitor started.
+    If source is a mido input port, it's polled so that the deadlines are
+    checked even if nothing comes in; otherwise (e.g. files) they're only
+    checked as each message arrives.
+    """
+    def check():
+        if (total_timeout is not None
+                and monitor.since_start() > total_timeout):
+            raise TransferTimeoutError(
+                f"Transfer took longer than {total_timeout} seconds")
+        if (message_timeout is not None and monitor.count
+                and monitor.idle() > message_timeout):
+            raise TransferTimeoutError(
+                f"No message received for {message_timeout} seconds")
+
+    if hasattr(source, 'poll'):
+        while True:
+            message = source.poll()
+            if message is None:
+                check()
+                time.sleep(poll_interval)
+                continue
+            monitor.feed(message)
+            yield message
+    else:
+        for message in source:
+            check()
+            monitor.feed(message)
+            yield message
@@ -4,6 +4,8 @@ util.py
 Utilities and helper functions that don't require mido
 
 """
+import io
+import os
 import sys
 import itertools
 import collections
@@ -318,6 +320,42 @@ class nonclosing_stdstream(object):
         pass
 
 
+def write_buffers(outfile, buffers):
+    """
+    Write a sequence of bytes-like objects to a (binary-mode) file object,
+    without concatenating them first.
+    If the file has a file descriptor and the platform has os.writev,
+    the buffers are handed straight to writev (scatter-gather),
+    otherwise falls back to the file object's writelines.
+    """
+    try:
+        fd = outfile.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fd = None
+    if fd is None or not hasattr(os, 'writev'):
+        outfile.writelines(buffers)
+        return
+    # anything already buffered in the file object has to go first.
+    outfile.flush()
+    try:
+        iov_max = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        iov_max = 1024
+    if iov_max <= 0:
+        iov_max = 1024
+    views = [memoryview(b) for b in buffers]
+    start = 0
+    while start < len(views):
+        written = os.writev(fd, views[start:start+iov_max])
+        # writev can return having written only some of the data,
+        # so skip past everything that was written and go again
+        while start < len(views) and written >= len(views[start]):
+            written -= len(views[start])
+            start += 1
+        if written:
+            views[start] = views[start][written:]
+
+
 def open_file_stdstream(filename, *args, **kwargs):
     """
     little wrapper around nonclosing_stdstream, for use as context manager
@@ -104,7 +104,7 @@ class RCTypeCodeLookup(object):
             self._to_codes[t] = msb, lsb
             self._from_codes[msb, lsb] = t
 
-    def from_code(self, msb, lsb):
+    def _from_code_fallback(self, msb, lsb):
         try:
             val = self._from_codes[msb, lsb]
         except KeyError:
@@ -114,6 +114,17 @@ class RCTypeCodeLookup(object):
                 val = self._from_codes[0x00, 0x00]
         return val
 
+    @util.lazy_property
+    def _code_table(self):
+        # every (7-bit) msb, lsb pair, with the fallbacks already applied.
+        return [self._from_code_fallback(msb, lsb)
+                for msb in range(0x80) for lsb in range(0x80)]
+
+    def from_code(self, msb, lsb):
+        if 0 <= msb < 0x80 and 0 <= lsb < 0x80:
+            return self._code_table[(msb << 7) | lsb]
+        return self._from_code_fallback(msb, lsb)
+
     def __getitem__(self, key):
         return self._to_codes[key]
 
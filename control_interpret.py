@@ -2,25 +2,29 @@
 control_interpret.py
 
 Reads a stream of mido text, or an smf file, prints out an interpetation of the
-control messages. Optionally, can annotate
+control messages. Optionally, can annotate.
+Several files can be given, which can be interpreted in parallel (-j);
+the output is the same as reading the files one after another.
 """
 
 
 import argparse
+import concurrent.futures
+import io
 import logging
 import sys
 
 import mido
 
-from commons import util, mido_util
+from commons import util, mido_util, trackmerge
 from commons.messages import controlstate
 
 argparser = argparse.ArgumentParser(
     description="Print out an interpretation of the control messages.")
 
 argparser.add_argument(
-    'filename', type=str,
-    help="file to read from")
+    'filenames', type=str, nargs='+', metavar='filename',
+    help="file(s) to read from")
 
 argparser.add_argument(
     '-a', '--annotate', action='store_true',
@@ -35,149 +39,227 @@ argparser.add_argument(
     help='Read file as a Standard Midi File instead of midotext. '
          'Optionally, specify the tracks to read')
 
+argparser.add_argument(
+    '-j', '--jobs', type=int, default=1, metavar='N',
+    help='Number of worker processes for interpreting multiple files')
+
+
+# Number of lines to collect before writing them out together
+BUFFER_LINES = 1024
+
+
+def _is_interactive(stream):
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _message_string(message, time):
+    # str(message), but with the time replaced, without copying the message.
+    if time is None:
+        return str(message)
+    if message.is_meta:
+        # (not many of these)
+        return str(message.copy(time=time))
+    return f"{mido.format_as_string(message, include_time=False)} time={time}"
+
+
+def state_write(messages, output_stream, wrap_notes, annotate,
+                interactive=None, timed=False):
+    """
+    Write out the interpretation of the messages.
+    If interactive, each line is written and flushed as soon as it's ready;
+    otherwise the lines are written out BUFFER_LINES at a time.
+    By default, interactive if the output stream is a terminal.
+    If timed, messages is an iterable of (time, message) instead,
+    with the time to show in the annotation (None for the message's own).
+    """
+    if interactive is None:
+        interactive = _is_interactive(output_stream)
+    feed = controlstate.MidiControlState(wrap_notes=wrap_notes).feed
+    lines = []
+
+    def write_lines():
+        # (cleared first, so nothing is written twice if the write fails)
+        text = ''.join(lines)
+        lines.clear()
+        output_stream.write(text)
+        if interactive:
+            output_stream.flush()
+
+    if not timed:
+        messages = ((None, message) for message in messages)
+
+    try:
+        for time, message in messages:
+            wrapped = feed(message)
+            if annotate:
+                if message.is_meta:
+                    # Since meta messages cannot be parsed from midotext,
+                    # we preface them with a comment
+                    line = '#' + _message_string(message, time)
+                else:
+                    line = _message_string(message, time)
+                if wrapped is not None:
+                    line += ' # ' + str(wrapped)
+            elif wrapped is not None:
+                line = str(wrapped)
+            else:
+                continue
+            lines.append(line + '\n')
+            if interactive or len(lines) >= BUFFER_LINES:
+                write_lines()
+    finally:
+        # (whatever we have so far, even if interrupted)
+        if lines:
+            write_lines()
+    output_stream.flush()
+
+
+def smf_timed_messages(infile, track_numbers, annotate):
+    """
+    Read a Standard Midi File from a (binary-mode) file object,
+    and return an iterable of (time, message) for the messages to interpret,
+    from the tracks in track_numbers (or all tracks if empty).
+    If annotating, time is in seconds: the time since the start
+    for all the tracks, or the time since the previous message for the
+    tracks specified. Otherwise, it's None.
+    The messages aren't copied.
+    """
+    # We don't want negative track numbers.
+    for x in track_numbers:
+        if x < 0:
+            raise ValueError(x)
+
+    # Read in the midi file.
+    smf = mido.MidiFile(file=infile)
+
+    if len(track_numbers) == 0:
+        # No tracks specified, read from all tracks.
+        if smf.type == 2:
+            # (as mido.MidiFile)
+            raise TypeError("can't merge tracks in type 2 (asynchronous) file")
+        records = trackmerge.merge_tracks(smf.tracks)
+    else:
+        # Tracks specified.
+        track_numbers = sorted(set(track_numbers))  # remove duplicates
+        tracks = [smf.tracks[x] for x in track_numbers]
+        if smf.type != 1 and len(tracks) > 1:
+            # If SMF type 0, we shouldn't get here, because there
+            # should be only one track, and we would have errored
+            # beforehand.
+            # If SMF type 2, then we should raise error,
+            # because tracks are not synchronised.
+            raise ValueError("Only one track can be specified for this SMF type")
+        # (We can treat type 0 and type 2 as the same for this.)
+        record_iters = [trackmerge.iter_track_ticks(track, x)
+                        for track, x in zip(tracks, track_numbers)]
+        if smf.type == 1 and annotate and track_numbers[0] != 0:
+            # Time track not included.
+            # For proper timings, we still need the tempo changes from it
+            # (but only those)
+            record_iters.insert(0, trackmerge.iter_track_ticks(
+                smf.tracks[0], 0, types={'set_tempo'}))
+        records = trackmerge.merge_track_records(record_iters)
 
-def state_write(messages, output_stream, wrap_notes, annotate):
-    stator = controlstate.MidiControlState(wrap_notes=wrap_notes)
     if annotate:
-        for message in messages:
-            wrapped = stator.feed(message)
-            if message.is_meta:
-                # Since meta messages cannot be parsed from midotext,
-                # we preface them with a comment
-                output_stream.write('#')
-            output_stream.write(str(message))
-            if wrapped is not None:
-                output_stream.write(' # ')
-                output_stream.write(str(wrapped))
-            output_stream.write('\n')
-            output_stream.flush()
+        # We care about time: from the start for the whole file,
+        # or from the previous message for the tracks specified.
+        if len(track_numbers) == 0:
+            timed = trackmerge.iter_seconds(records, smf.ticks_per_beat)
+        else:
+            timed = trackmerge.iter_delta_seconds(records, smf.ticks_per_beat)
+        return ((seconds, message) for seconds, _, message in timed)
     else:
-        for message in messages:
-            wrapped = stator.feed(message)
-            if wrapped is not None:
-                output_stream.write(str(wrapped)+'\n')
-                output_stream.flush()
+        # We don't care about time.
+        return ((None, message) for _, _, message in records)
+
+
+def interpret_file(filename, output_stream, smf=None,
+                   wrap_notes=False, annotate=False):
+    """
+    Interpret a single file, writing to output_stream.
+    smf is None to read the file as midotext, otherwise a list of the
+    track numbers to read from the Standard Midi File (empty for all).
+    """
+    if smf is None:
+        # smf not provided, read as midotext
+        with util.open_file_stdstream(filename, 'rt') as infile:
+            state_write(
+                messages=mido_util.readin_strings(infile, comment='#'),
+                output_stream=output_stream,
+                wrap_notes=wrap_notes,
+                annotate=annotate
+            )
+    else:
+        # smf specified.
+        with util.open_file_stdstream(filename, 'rb') as infile:
+            messages = smf_timed_messages(infile, smf, annotate)
+        # Now we have the messages, we just write out.
+        state_write(
+            messages=messages,
+            output_stream=output_stream,
+            wrap_notes=wrap_notes,
+            annotate=annotate,
+            timed=True
+        )
 
 
-def message_time_accumulate(messages, tempo_reset=False):
-    # Accumulates the time on the messages.
-    t = 0
-    for m in messages:
-        t += m.time
-        # We copy instead of mutating.
-        yield m.copy(time=t)
-        if tempo_reset and m.type == 'set_tempo':
-            t = 0
+def interpret_file_string(filename, **kwargs):
+    """
+    Interpret a single file, and return the output as a string.
+    (For use by the worker processes.)
+    """
+    with io.StringIO() as output_stream:
+        interpret_file(filename, output_stream, **kwargs)
+        return output_stream.getvalue()
+
+
+def interpret_files(filenames, output_stream, jobs=1, **kwargs):
+    """
+    Interpret each of the files in turn, writing to output_stream.
+    If jobs > 1, the files are interpreted in a pool of worker processes,
+    and the outputs are written in the order of the filenames, so the
+    output is the same as the serial run.
+    """
+    if jobs <= 1 or len(filenames) <= 1:
+        for filename in filenames:
+            interpret_file(filename, output_stream, **kwargs)
+        return
+    if '-' in filenames:
+        raise ValueError("stdin cannot be read by worker processes")
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        futures = [executor.submit(interpret_file_string, filename, **kwargs)
+                   for filename in filenames]
+        # write out in order, as each one is ready.
+        for future in futures:
+            output_stream.write(future.result())
+            output_stream.flush()
 
 
 if __name__ == '__main__':
     args = argparser.parse_args()
 
+    if args.jobs < 1:
+        argparser.error("number of jobs must be positive")
+    if args.jobs > 1 and '-' in args.filenames:
+        argparser.error("cannot read stdin with more than one job")
+
     # set up logger
     logger = logging.getLogger('control_interpret')
     handler = logging.StreamHandler()
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
 
-    if args.smf is None:
-        # smf not provided, read as midotext  
-        with util.open_file_stdstream(args.filename, 'rt') as infile:
-            try:
-                state_write(
-                    messages=mido_util.readin_strings(infile, comment='#'),
-                    output_stream=sys.stdout,
-                    wrap_notes=args.notes,
-                    annotate=args.annotate
-                )
-            except KeyboardInterrupt:
-                logger.info("Stopping on KeyboardInterrupt")
-    else:
-        # smf specified.
-        # We don't want negative track numbers.
-        for x in args.smf:
-            if x < 0:
-                raise ValueError(x)
-
-        # Read in the midi file.
-        with util.open_file_stdstream(args.filename, 'rb') as infile:
-            smf = mido.MidiFile(file=infile)
-
-        if len(args.smf) == 0:
-            # No tracks specified, read from all tracks.
-            # Mido uses the time attribute as the delta in seconds 
-            # when iterating over the file.
-            # If we are printing the annotation, we want to accumulate this
-            # but if we aren't then we don't care about the time attribute
-            # at all.
-            messages = iter(smf)
-            if args.annotate:
-                messages = message_time_accumulate(messages)
-        else:
-            # Tracks specified.
-            track_numbers = sorted(set(args.smf))  # remove duplicates
-
-            # We can treat type 0 and type 2 as the same for this.
-            tracks = [smf.tracks[x] for x in track_numbers]
-            if smf.type == 1:
-                if args.annotate:
-                    # We want proper timings. For this purpose,
-                    # we use a new MidiFile object.
-                    subsmf = mido.MidiFile(
-                        type=1,
-                        ticks_per_beat=smf.ticks_per_beat,
-                        charset=smf.charset)
-                    if track_numbers[0] != 0:
-                        # Time track not included.
-                        # We need to find all the tempo change messages
-                        # in track 0, and create a new track
-                        # with only them on it.
-                        time_track = smf.tracks[0]
-                        tempo_track = subsmf.add_track()
-                        tempo_track.extend(message_time_accumulate(
-                            time_track, tempo_reset=True))
-                    # Now we add the other tracks.
-                    # (Mutating the 'tracks' list in mido.MidiFile here)
-                    subsmf.tracks.extend(tracks)
-                    messages = iter(subsmf)
-                else:
-                    # We don't care about time.
-                    # Just combine the tracks.
-                    messages = mido.merge_tracks(tracks)
-            else:  # type 0 or 2
-                if len(tracks) > 1:
-                    # If SMF type 0, we shouldn't get here, because there
-                    # should be only one track, and we would have errored
-                    # beforehand.
-                    # If SMF type 2, then we should raise error,
-                    # because tracks are not synchronised.
-                    raise ValueError("Only one track can be specified for this SMF type")
-                if args.annotate:
-                    # We care about time.
-                    subsmf = mido.MidiFile(
-                        type=0,
-                        ticks_per_beat=smf.ticks_per_beat,
-                        charset=smf.charset)
-                    subsmf.tracks.extend(tracks)
-                    messages = iter(subsmf)
-                else:
-                    messages = tracks[0]
-        # Now we have the messages, we just write out.
-        state_write(
-            messages=messages,
+    try:
+        interpret_files(
+            args.filenames,
             output_stream=sys.stdout,
+            jobs=args.jobs,
+            smf=args.smf,
             wrap_notes=args.notes,
             annotate=args.annotate
         )
-
-            
-
-
-    
-
-
-
-
-
-
-
-
+    except KeyboardInterrupt:
+        logger.info("Stopping on KeyboardInterrupt")
@@ -0,0 +1,59 @@
+import argparse
+import json
+import logging
+import sys
+
+from commons import dgxdump, dumpdiff
+
+argparser = argparse.ArgumentParser(
+    description="Show the differences between bulk dumps. "
+                "With more than two files, each file is compared with "
+                "the one before it")
+argparser.add_argument(
+    'files', type=str, nargs='+', metavar='file',
+    help="Files to read from, oldest first")
+argparser.add_argument(
+    '--mfile', action='store_true',
+    help="Read from mido message text files instead of syx files")
+argparser.add_argument(
+    '-j', '--json', action='store_true',
+    help="Write the differences as JSON, one line per pair of files")
+argparser.add_argument(
+    '-v', '--verbose', action='count', default=0,
+    help="Verbose messages. -v for basic, -vv for file parsing messages")
+
+
+if __name__ == '__main__':
+    args = argparser.parse_args()
+    if len(args.files) < 2:
+        argparser.error("at least two files are required")
+
+    logger = logging.getLogger('dumpdiff')
+    read_logger = logging.getLogger('dumpdiff.read')
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO if args.verbose > 0 else logging.WARNING)
+    read_logger.setLevel(
+        logging.INFO if args.verbose > 1 else logging.WARNING)
+
+    try:
+        # only keep the previous dump around.
+        old_name = args.files[0]
+        old = dgxdump.read_dump_file(old_name, args.mfile,
+                                     'dumpdiff', 'dumpdiff.read')
+        for new_name in args.files[1:]:
+            new = dgxdump.read_dump_file(new_name, args.mfile,
+                                         'dumpdiff', 'dumpdiff.read')
+            diff = dumpdiff.diff_dumps(old, new)
+            if args.json:
+                json.dump({'old': old_name, 'new': new_name, 'diff': diff},
+                          sys.stdout)
+                print()
+            else:
+                print(f"--- {old_name}")
+                print(f"+++ {new_name}")
+                for line in dumpdiff.format_diff(diff):
+                    print(line)
+                print()
+            old_name, old = new_name, new
+    except KeyboardInterrupt:
+        pass
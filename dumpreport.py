@@ -0,0 +1,79 @@
+import argparse
+import logging
+import sys
+
+from commons import dgxdump, dumprecords, exceptions
+
+argparser = argparse.ArgumentParser(
+    description="Write out the contents of bulk dumps as NDJSON, "
+                "one record per line for each dump, song, track and setting")
+argparser.add_argument(
+    'files', type=str, nargs='+', metavar='file',
+    help="Files to read from ('-' for stdin)")
+argparser.add_argument(
+    '--mfile', action='store_true',
+    help="Read from mido message text files instead of syx files")
+argparser.add_argument(
+    '-f', '--flush', action='store_true',
+    help="Flush the output after every record, not just every dump")
+argparser.add_argument(
+    '-v', '--verbose', action='count', default=0,
+    help="Verbose messages. -v for basic, -vv for file parsing messages")
+
+
+def _records_or_error(records, filename, logger):
+    # some errors only come up as the songs and settings are decoded,
+    # after part of the dump's records are out. finish with an error record.
+    try:
+        yield from records
+    except exceptions.ExtractorError as e:
+        logger.warning("Error reading %r: %s", filename,
+                       getattr(e, 'description', e))
+        yield dumprecords.error_record(filename, e)
+
+
+def write_file_records(outfile, filename, mfile=False, flush=False,
+                       log=__name__, sublog=None):
+    """
+    Read the dump from the file and write out its records.
+    The dump is only kept until its records are written,
+    so that only one is in memory at a time.
+    If the file can't be read, or the dump turns out to be bad, an error
+    record is written (after any records already written for it).
+    Returns the number of records written.
+    """
+    logger = logging.getLogger(log)
+    try:
+        dump = dgxdump.read_dump_file(filename, mfile, log, sublog)
+    except (exceptions.ExtractorError, OSError) as e:
+        logger.warning("Error reading %r: %s", filename,
+                       getattr(e, 'description', e))
+        records = [dumprecords.error_record(filename, e)]
+    else:
+        records = _records_or_error(
+            dumprecords.iter_dump_records(dump, filename), filename, logger)
+    count = dumprecords.write_ndjson(outfile, records, flush)
+    outfile.flush()
+    logger.info("%d records written for %r", count, filename)
+    return count
+
+
+if __name__ == '__main__':
+    args = argparser.parse_args()
+
+    logger = logging.getLogger('dumpreport')
+    read_logger = logging.getLogger('dumpreport.read')
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO if args.verbose > 0 else logging.WARNING)
+    read_logger.setLevel(
+        logging.INFO if args.verbose > 1 else logging.WARNING)
+
+    try:
+        for filename in args.files:
+            write_file_records(sys.stdout, filename, args.mfile, args.flush,
+                               'dumpreport', 'dumpreport.read')
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # e.g. piped into head. Stop quietly.
+        sys.stderr.close()
@@ -1,7 +1,9 @@
 import argparse
 import logging
+import sys
 
-from commons import mido_util, dgxdump, exceptions
+from commons import util, mido_util, dgxdump, exceptions
+from commons.dumpdata.messages import SongDumpSection
 
 
 class UserSongNumberListAction(argparse.Action):
@@ -117,13 +119,17 @@ class RegBankButtonListAction(argparse.Action):
 argparser = argparse.ArgumentParser(
     description="Extract UserSong MIDI files from a sysex dump")
 argparser.add_argument(
-    'file', type=str,
-    help="File to read from")
+    'files', type=str, nargs='+', metavar='file',
+    help="File to read from (several files allowed with --verify)")
 
 ingroup = argparser.add_argument_group("Input options")
 ingroup.add_argument(
     '--mfile', action='store_true',
     help="Read from mido message text file instead of syx file")
+ingroup.add_argument(
+    '--timeout', type=float, metavar='SECONDS',
+    help="When reading a syx file from stdin ('-'), give up if nothing "
+         "comes in for this long (waits forever by default)")
 
 printgroup = argparser.add_argument_group("Text output (stdout)")
 printgroup.add_argument(
@@ -147,21 +153,99 @@ midigroup.add_argument(
 midigroup.add_argument(
     '-c', '--clobber', action='store_true',
     help='overwrite files that already exist (skips by default)')
+midigroup.add_argument(
+    '-r', '--raw', action='store_true',
+    help="write the tracks as stored, without applying the "
+         "main voice octave to the notes")
+
+verifygroup = argparser.add_argument_group("Verification")
+verifygroup.add_argument(
+    '--verify', action='store_true',
+    help="Only check that each file holds a complete, valid dump "
+         "(syx files only), printing PASS or FAIL for each")
 
 argparser.add_argument(
     '-v', '--verbose', action='count', default=0,
     help="Verbose messages. -v for basic, -vv for file parsing messages")
 
 
-def _read_dump_from_filename(filename, mfile=False, log=__name__, sublog=None):
-        with mido_util.read_messages_file(filename, mfile, log) as messages:
-            dump = dgxdump.DgxDump(messages, log=sublog)
-        return dump
+_read_dump_from_filename = dgxdump.read_dump_file
+
+
+def print_songs(songs, numbers):
+    logger = logging.getLogger('extractor')
+    logger.info('Printing song info to stdout')
+    for song_number in numbers:
+        songs.get_song(song_number).print_info()
+        print()
+
+
+def print_regs(reg_settings, idents):
+    """idents: list of (bank, button), or empty for all of them"""
+    logger = logging.getLogger('extractor')
+    logger.info('Printing reg info to stdout')
+    if idents == []:
+        settings = reg_settings.iter_settings()
+    else:
+        settings = (reg_settings.get_setting(*i) for i in idents)
+    for setting in settings:
+        setting.print_settings()
+        print()
+
+
+def write_songs(songs, numbers, nameformat, fmode, octave_correct=True):
+    logger = logging.getLogger('extractor')
+    logger.info('Writing User Song midi files.')
+    for song_number in numbers:
+        song = songs.get_song(song_number)
+        try:
+            buffers = song.midi_buffers(octave_correct=octave_correct)
+        except exceptions.NotRecordedError:
+            logger.info("User Song %d - not recorded.", song_number)
+        else:
+            filename = nameformat.format(song_number)
+            logger.info("User Song %d - Writing midi file %r",
+                        song_number, filename)
+            try:
+                with open(filename, fmode) as outfile:
+                    util.write_buffers(outfile, buffers)
+            except FileExistsError:
+                logger.warning("Error: file %r exists. Ignoring.",
+                               filename)
+
+
+def verify_files(filenames):
+    """
+    Verify each file, printing PASS or FAIL (with the reason) for each.
+    Returns True if all passed.
+    """
+    # (imported here, as it needs both the song and reg data modules)
+    from commons.dumpdata import verify
+    all_ok = True
+    for filename in filenames:
+        try:
+            report = verify.verify_dump_file(filename)
+        except OSError as e:
+            errors = [str(e)]
+        else:
+            errors = report.errors
+        if errors:
+            all_ok = False
+            print(f"FAIL {filename}: {'; '.join(errors)}")
+        else:
+            print(f"PASS {filename}")
+    return all_ok
 
 
 if __name__ == '__main__':
     # args
     args = argparser.parse_args()
+    if args.verify:
+        if args.mfile:
+            argparser.error("--verify only works with syx files")
+        sys.exit(0 if verify_files(args.files) else 1)
+    if len(args.files) > 1:
+        argparser.error("only one file allowed (except with --verify)")
     if all(x is None for x in (args.writesong, args.printsong, args.printreg)):
         argparser.error("at least one of -S -R -s is required (no output)")
 
@@ -187,43 +271,29 @@ if __name__ == '__main__':
         fmode = 'xb'
 
     # INPUT
-    dump = _read_dump_from_filename(args.file, args.mfile,
-                                    log='extractor', sublog='extractor.read')
-
-    # Printing to stdout.
-    if args.printsong is not None:
-        logger.info('Printing song info to stdout')
-        songs = dump.song_data.songs
-        for song_number in args.printsong:
-            songs.get_song(song_number).print_info()
-            print()
-    if args.printreg is not None:
-        logger.info('Printing reg info to stdout')
-        reg_settings = dump.reg_data.settings
-        if args.printreg == []:
-            settings = reg_settings.iter_settings()
-        else:
-            settings = (reg_settings.get_setting(*i) for i in args.printreg)
-        for setting in settings:
-            setting.print_settings()
-            print()
-
-    # Writing out songs:
-    if args.writesong is not None:
-        logger.info('Writing User Song midi files.')
-        for song_number in args.writesong:
-            song = dump.song_data.songs.get_song(song_number)
-            try:
-                midi = song.midi
-            except exceptions.NotRecordedError:
-                logger.info("User Song %d - not recorded.", song_number)
-            else:
-                filename = args.nameformat.format(song_number)
-                logger.info("User Song %d - Writing midi file %r",
-                            song_number, filename)
-                try:
-                    with open(filename, fmode) as outfile:
-                        outfile.write(midi)
-                except FileExistsError:
-                    logger.warning("Error: file %r exists. Ignoring.",
-                                   filename)
+    want_song = args.printsong is not None or args.writesong is not None
+    want_reg = args.printreg is not None
+    try:
+        with mido_util.read_messages_file(
+                args.files[0], args.mfile, log='extractor',
+                sections=dgxdump.wanted_sections(want_song, want_reg),
+                timeout=args.timeout) as messages:
+            # Each section gets dealt with as soon as it's all come in
+            # (so, from stdin, the songs are written before the registration
+            # data has been sent)
+            for section in dgxdump.iter_sections(
+                    messages, 'extractor.read', want_song, want_reg):
+                if isinstance(section, SongDumpSection):
+                    if args.printsong is not None:
+                        print_songs(section.songs, args.printsong)
+                    if args.writesong is not None:
+                        write_songs(section.songs, args.writesong,
+                                    args.nameformat, fmode,
+                                    octave_correct=not args.raw)
+                else:
+                    if args.printreg is not None:
+                        print_regs(section.settings, args.printreg)
+                sys.stdout.flush()
+    except exceptions.TransferTimeoutError as e:
+        logger.error("Error: %s", e)
+        sys.exit(1)
@@ -0,0 +1,139 @@
+"""
+melodysearch.py
+
+Index the user songs of many bulk dumps by their melodies,
+then find the songs containing a melody (in any key).
+"""
+import argparse
+import logging
+import os
+import sys
+
+from commons import dgxdump, exceptions, melodyindex
+
+# options for both commands
+commonparser = argparse.ArgumentParser(add_help=False)
+commonparser.add_argument(
+    '-i', '--index', type=str, required=True,
+    help="The index file")
+commonparser.add_argument(
+    '-v', '--verbose', action='count', default=0,
+    help="Verbose messages. -v for basic, -vv for file parsing messages")
+
+argparser = argparse.ArgumentParser(
+    description="Search the user songs of bulk dumps for a melody")
+subparsers = argparser.add_subparsers(dest='command')
+subparsers.required = True
+
+indexparser = subparsers.add_parser(
+    'index', parents=[commonparser],
+    help="Add the user songs of bulk dumps to the index "
+         "(created if it doesn't exist)")
+indexparser.add_argument(
+    'files', type=str, nargs='*', metavar='file',
+    help="Dump files to index (each replaces any earlier one of the "
+         "same name)")
+indexparser.add_argument(
+    '--mfile', action='store_true',
+    help="Read from mido message text files instead of syx files")
+indexparser.add_argument(
+    '--store', type=str, metavar='DIR',
+    help="Also index all the dumps in this dump store")
+indexparser.add_argument(
+    '-n', type=int, metavar='N',
+    help="Number of intervals in each n-gram, when creating the index "
+         f"(default {melodyindex.DEFAULT_N}). "
+         "Queries need at least N+1 notes.")
+
+queryparser = subparsers.add_parser(
+    'query', parents=[commonparser],
+    help="Find a melody")
+queryparser.add_argument(
+    'notes', type=str, nargs='+', metavar='note',
+    help="The notes of the melody, as names with octaves (e.g. C3 E3 G3, "
+         "where C3 is middle C) or note numbers")
+
+
+def index_files(index, filenames, mfile=False, log=__name__, sublog=None):
+    """
+    Add the songs of each dump file to the index, committing after each.
+    Files that can't be read or indexed are skipped (with a warning),
+    leaving what was indexed for them before as it was.
+    """
+    logger = logging.getLogger(log)
+    for filename in filenames:
+        try:
+            songs = dgxdump.read_dump_file(
+                filename, mfile, log, sublog, reg=False).song_data.songs
+            # (the songs are only decoded as they're indexed)
+            count = index.add_songs(filename, songs)
+        except (exceptions.ExtractorError, OSError) as e:
+            logger.warning("Error reading %r: %s", filename,
+                           getattr(e, 'description', e))
+            continue
+        index.commit()
+        logger.info("%d tracks indexed for %r", count, filename)
+
+
+def index_store(index, root, log=__name__):
+    """Add the songs of all the dumps in the dump store to the index."""
+    # (only needed here)
+    from commons.dumpstore import DumpStore
+    logger = logging.getLogger(log)
+    store = DumpStore(root)
+    for name in store.names():
+        try:
+            count = index.add_stored_dump(store, name)
+        except KeyError as e:
+            logger.warning("Error reading %r from the store: %s", name, e)
+            continue
+        index.commit()
+        logger.info("%d tracks indexed for %r", count, name)
+
+
+def print_matches(matches):
+    for match in matches:
+        seconds, ms = divmod(match.time, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        print(f"{match.source}\tUser Song {match.song}\t"
+              f"Track {match.track}\t{minutes}:{seconds:02d}.{ms:03d}\t"
+              f"({match.time} ms, note {match.position+1}, "
+              f"transposed {match.transpose:+d})")
+
+
+if __name__ == '__main__':
+    args = argparser.parse_args()
+
+    logger = logging.getLogger('melodysearch')
+    read_logger = logging.getLogger('melodysearch.read')
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO if args.verbose > 0 else logging.WARNING)
+    read_logger.setLevel(
+        logging.INFO if args.verbose > 1 else logging.WARNING)
+
+    if args.command == 'index':
+        if not args.files and args.store is None:
+            argparser.error("nothing to index (no files and no --store)")
+        try:
+            index = melodyindex.MelodyIndex(args.index, args.n)
+        except ValueError as e:
+            argparser.error(str(e))
+        with index:
+            index_files(index, args.files, args.mfile,
+                        'melodysearch', 'melodysearch.read')
+            if args.store is not None:
+                index_store(index, args.store, 'melodysearch')
+    else:
+        if not os.path.exists(args.index):
+            argparser.error(f"no index file {args.index!r}")
+        try:
+            notes = [melodyindex.parse_note(note) for note in args.notes]
+        except ValueError as e:
+            argparser.error(str(e))
+        with melodyindex.MelodyIndex(args.index) as index:
+            try:
+                matches = index.search(notes)
+            except ValueError as e:
+                argparser.error(str(e))
+        print_matches(matches)
+        sys.exit(0 if matches else 1)
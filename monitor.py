@@ -0,0 +1,97 @@
+"""
+monitor.py
+
+Listens to a port, and shows a live display of the state of the
+instrument (as tracked by MidiControlState): the voice and control values
+for each channel, and the style, section and chord.
+
+The display is redrawn at most RATE times per second, and only if
+something has changed; any number of messages in between are just
+fed to the state.
+"""
+import sys
+import argparse
+import time
+import logging
+
+from commons import mido_util
+from commons.messages.statedisplay import StateMonitor
+
+argparser = argparse.ArgumentParser(
+    description="Live display of the instrument state from a port")
+
+argparser.add_argument(
+    '-p', '--port', type=str,
+    help="Port to read from (run 'mido-ports' to list available ports)")
+
+portargs = argparser.add_mutually_exclusive_group()
+portargs.add_argument(
+    '-g', '--guessport', action='store_true',
+    help="Guess which port to use (partial name match on PORT)")
+portargs.add_argument(
+    '-V', '--virtual', action='store_true',
+    help='Use virtual port')
+
+argparser.add_argument(
+    '-r', '--rate', type=float, default=10, metavar='RATE',
+    help="Maximum number of redraws per second (default 10)")
+
+argparser.add_argument(
+    '-q', '--quiet', action='store_true',
+    help="Don't print progress messages to stderr")
+
+# ANSI escape codes
+CLEAR_SCREEN = "\x1b[2J"
+HOME = "\x1b[H"
+CLEAR_LINE_END = "\x1b[K"
+CLEAR_SCREEN_END = "\x1b[J"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+
+
+def draw(outfile, lines, footer):
+    # Overwrite in place, rather than clearing first, to avoid flicker.
+    outfile.write(HOME + "".join(line + CLEAR_LINE_END + "\n"
+                                 for line in (*lines, "", footer))
+                  + CLEAR_SCREEN_END)
+    outfile.flush()
+
+
+def main(args):
+    logger = logging.getLogger('monitor')
+    monitor = StateMonitor()
+    interval = 1 / args.rate
+    with mido_util.open_input(args.port, args.guessport, args.virtual,
+                              callback=monitor.feed) as inport:
+        logger.info('Reading from port %r. CtrlC to stop', inport.name)
+        sys.stdout.write(CLEAR_SCREEN + HIDE_CURSOR)
+        try:
+            while True:
+                lines = monitor.render_changed()
+                if lines is not None:
+                    draw(sys.stdout, lines,
+                         f"{inport.name}: {monitor.message_count} messages")
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logger.info('Stopping on KeyboardInterrupt')
+        finally:
+            inport.callback = None
+            sys.stdout.write(SHOW_CURSOR)
+            sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    args = argparser.parse_args()
+    if args.rate <= 0:
+        argparser.error("rate must be positive")
+
+    # set up logger
+    logger = logging.getLogger('monitor')
+    handler = logging.StreamHandler()
+    logger.addHandler(handler)
+    if args.quiet:
+        logger.setLevel(logging.WARNING)
+    else:
+        logger.setLevel(logging.INFO)
+
+    main(args)
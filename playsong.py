@@ -0,0 +1,141 @@
+"""
+playsong.py
+
+Play a user song straight from a dump to a midi port,
+without writing out a MIDI file first.
+"""
+import argparse
+import itertools
+import logging
+import sys
+import time
+
+from commons import mido_util, dgxdump, exceptions, playback
+
+argparser = argparse.ArgumentParser(
+    description="Play a user song from a sysex dump to a midi port")
+
+argparser.add_argument(
+    'filename', type=str,
+    help="file to read from ('-' for stdin)")
+argparser.add_argument(
+    'song', type=int, choices=range(1, 5+1), metavar='N',
+    help="the user song to play (1-5)")
+
+ingroup = argparser.add_argument_group("Input options")
+ingroup.add_argument(
+    '--mfile', action='store_true',
+    help="Read from mido message text file instead of syx file")
+ingroup.add_argument(
+    '--timeout', type=float, metavar='SECONDS',
+    help="When reading a syx file from stdin ('-'), give up if nothing "
+         "comes in for this long (waits forever by default)")
+
+portargs = argparser.add_mutually_exclusive_group()
+portargs.add_argument(
+    '-g', '--guessport', action='store_true',
+    help="Guess which port to use (partial name match on PORT)")
+portargs.add_argument(
+    '-V', '--virtual', action='store_true',
+    help='Use virtual port')
+
+argparser.add_argument(
+    '-p', '--port', type=str,
+    help="Port to write to (run 'mido-ports' to list available ports)")
+
+playgroup = argparser.add_argument_group("Playback options")
+playgroup.add_argument(
+    '-m', '--measure', type=int, default=1,
+    help="measure to start playing from (the controllers, programs etc. "
+         "before it are sent first)")
+playgroup.add_argument(
+    '-t', '--tracks', type=int, nargs='+', choices=range(0, 5+1),
+    metavar='T',
+    help="only play these tracks (1-5, 0 for Track A)")
+playgroup.add_argument(
+    '-s', '--speedup', type=float, default=1,
+    help="speed multiplier")
+playgroup.add_argument(
+    '-r', '--raw', action='store_true',
+    help="play the tracks as stored, without applying the "
+         "main voice octave to the notes")
+playgroup.add_argument(
+    '--prompt', action='store_true',
+    help='prompt before playback')
+
+argparser.add_argument(
+    '-v', '--verbose', action='store_true',
+    help="Verbose messages")
+
+
+def read_song(filename, number, mfile=False, timeout=None):
+    """
+    Read the user song from the dump file, reading only as far as the end
+    of the song section.
+    """
+    dump = dgxdump.read_dump_file(filename, mfile, 'playsong.read',
+                                  'playsong.read', reg=False, timeout=timeout)
+    return dump.song_data.songs.get_song(number)
+
+
+def main(args):
+    logger = logging.getLogger('playsong')
+
+    if args.measure < 1:
+        argparser.error(f"Invalid measure: {args.measure}")
+    if args.speedup <= 0:
+        argparser.error("Speedup must be positive!")
+
+    try:
+        song = read_song(args.filename, args.song, args.mfile, args.timeout)
+    except exceptions.TransferTimeoutError as e:
+        logger.error("Error: %s", e)
+        sys.exit(1)
+
+    try:
+        timed_messages = playback.iter_song_playback(
+            song, args.measure, args.tracks,
+            octave_correct=not args.raw, speedup=args.speedup)
+        # get the first one ready now (so that errors come up before
+        # opening the port, and there's no delay when starting)
+        first = next(timed_messages)
+    except exceptions.NotRecordedError:
+        logger.error("Error: %s not recorded", song.name)
+        sys.exit(1)
+    except ValueError as e:
+        logger.error("Error: %s", e)
+        sys.exit(1)
+
+    with mido_util.open_output(
+            args.port, args.guessport, args.virtual) as outport:
+        try:
+            logger.info("playing %s from measure %d to port %r",
+                        song.name, args.measure, outport.name)
+            if args.prompt:
+                input("Press enter to start")
+            playback.play(outport,
+                          itertools.chain([first], timed_messages))
+            logger.info("finished")
+        except KeyboardInterrupt:
+            # newline, as to not screw up the prompt
+            print()
+        finally:
+            # (see broadcast.py)
+            outport.reset()
+            time.sleep(0.1)
+
+
+if __name__ == '__main__':
+    args = argparser.parse_args()
+
+    # set up logger
+    logger = logging.getLogger('playsong')
+    handler = logging.StreamHandler()
+    logger.addHandler(handler)
+    if args.verbose:
+        logger.setLevel(logging.INFO)
+    else:
+        logger.setLevel(logging.WARNING)
+    logging.getLogger('playsong.read').setLevel(logging.WARNING)
+
+    main(args)
@@ -0,0 +1,155 @@
+"""
+startup_bench.py
+
+Measure the startup time of the scripts:
+the wall-clock time for short invocations of each script, and the import
+time of each module (from python -X importtime), checked against a budget
+for each invocation.
+
+Some invocations also list modules that they shouldn't need to import at
+all (e.g. writing out the songs shouldn't need the registration data or the
+voice tables); those count as over budget if they are imported.
+"""
+import argparse
+import collections
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DUMP_FILE = os.path.join(HERE, 'tests', 'data', 'dumps', 'dumptestfull.syx')
+MIDI_FILE = os.path.join(HERE, 'tests', 'data', 'outputs', 'UserSong2.mid')
+
+# These are the modules the song data doesn't need.
+_REG_MODULES = ('commons.dumpdata.regdata', 'commons.dumpdata.regvalues',
+                'commons.tables.voices', 'commons.tables.styles')
+
+Case = collections.namedtuple("Case", "name args budget forbidden")
+
+# budgets are in milliseconds (wall-clock, best of the runs)
+CASES = (
+    Case("extractor --help", ['extractor.py', '--help'], 250, ()),
+    Case("extractor -s", ['extractor.py', DUMP_FILE, '-s', '-c'], 600,
+         _REG_MODULES),
+    Case("extractor -R", ['extractor.py', DUMP_FILE, '-R', '1'], 600,
+         ('commons.dumpdata.songdata', 'commons.dumpdata.songevents')),
+    Case("extractor -S", ['extractor.py', DUMP_FILE, '-S', '1'], 600,
+         _REG_MODULES),
+    Case("collect --help", ['collect.py', '--help'], 250, ()),
+    Case("control_interpret --help", ['control_interpret.py', '--help'],
+         250, ()),
+    Case("control_interpret smf", ['control_interpret.py', MIDI_FILE, '-s'],
+         1000, ()),
+    Case("broadcast --help", ['broadcast.py', '--help'], 250, ()),
+    Case("slurp --help", ['slurp.py', '--help'], 250, ()),
+    Case("dumpdiff --help", ['dumpdiff.py', '--help'], 250, ()),
+    Case("dumpreport --help", ['dumpreport.py', '--help'], 250, ()),
+    Case("monitor --help", ['monitor.py', '--help'], 250, ()),
+    Case("playsong --help", ['playsong.py', '--help'], 250, _REG_MODULES),
+    Case("melodysearch --help", ['melodysearch.py', '--help'], 250,
+         _REG_MODULES),
+)
+
+Result = collections.namedtuple("Result",
+    "case wall imports over_budget forbidden returncode")
+
+
+def parse_importtime(stderr):
+    """
+    Parse the output of python -X importtime.
+    Returns an OrderedDict of module name -> (self, cumulative) times
+    in microseconds.
+    """
+    imports = collections.OrderedDict()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            self_us, cumul_us, name = line[len('import time:'):].split('|')
+            imports[name.strip()] = (int(self_us), int(cumul_us))
+        except ValueError:
+            # the header line
+            continue
+    return imports
+
+
+def run_case(case, runs=5, python=sys.executable, scale=1.0):
+    """
+    Run the invocation runs times (in a temporary directory, with output
+    discarded) and once more with -X importtime.
+    (--help exits with status 0, so any other exit status is a failure)
+    Returns a Result.
+    """
+    args = [os.path.join(HERE, case.args[0]), *case.args[1:]]
+    tmpdir = tempfile.mkdtemp()
+    try:
+        best = None
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([python, *args], cwd=tmpdir,
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        proc = subprocess.run([python, '-X', 'importtime', *args],
+                              cwd=tmpdir, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE, universal_newlines=True)
+    finally:
+        shutil.rmtree(tmpdir)
+    imports = parse_importtime(proc.stderr)
+    wall = best * 1000
+    forbidden = [m for m in case.forbidden if m in imports]
+    return Result(case, wall, imports, wall > case.budget * scale, forbidden,
+                  proc.returncode)
+
+
+def print_result(result, top=10, outfile=sys.stdout):
+    status = "OK"
+    if result.returncode:
+        status = f"FAILED (exit status {result.returncode})"
+    elif result.over_budget or result.forbidden:
+        status = "OVER"
+    print(f"{result.case.name}: {result.wall:.1f} ms "
+          f"(budget {result.case.budget} ms) {status}", file=outfile)
+    for module in result.forbidden:
+        print(f"  imported unnecessarily: {module}", file=outfile)
+    ranked = sorted(result.imports.items(), key=lambda x: x[1][0],
+                    reverse=True)
+    for name, (self_us, cumul_us) in ranked[:top]:
+        print(f"  {self_us/1000:8.2f} {cumul_us/1000:8.2f}  {name}",
+              file=outfile)
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(
+        description="Measure startup and import times of the scripts "
+                    "against their budgets")
+    argparser.add_argument(
+        'cases', nargs='*', metavar='case',
+        help="Only run the cases whose names start with these")
+    argparser.add_argument(
+        '-n', '--runs', type=int, default=5,
+        help="Number of timed runs of each case (the best is used)")
+    argparser.add_argument(
+        '-t', '--top', type=int, default=10,
+        help="Number of modules to list, by self import time "
+             "(in ms, with cumulative)")
+    argparser.add_argument(
+        '--scale', type=float, default=1.0,
+        help="Multiply the budgets by this, for slower machines")
+    args = argparser.parse_args()
+
+    failed = False
+    for case in CASES:
+        if args.cases and not any(case.name.startswith(c)
+                                  for c in args.cases):
+            continue
+        result = run_case(case, args.runs, scale=args.scale)
+        print_result(result, args.top)
+        if result.over_budget or result.forbidden or result.returncode:
+            failed = True
+    sys.exit(1 if failed else 0)
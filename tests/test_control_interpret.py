@@ -0,0 +1,106 @@
+import io
+
+import mido
+import pytest
+
+import control_interpret as ci
+from commons import trackmerge
+
+
+def test_parallel_equivalence():
+    filenames = ['tests/data/outputs/UserSong2.mid'] * 3
+    kwargs = dict(smf=[], wrap_notes=True, annotate=True)
+    serial = io.StringIO()
+    ci.interpret_files(filenames, serial, jobs=1, **kwargs)
+    parallel = io.StringIO()
+    ci.interpret_files(filenames, parallel, jobs=2, **kwargs)
+    assert serial.getvalue() == parallel.getvalue()
+    single = ci.interpret_file_string(filenames[0], **kwargs)
+    assert serial.getvalue() == single * 3
+
+
+class CountingStringIO(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+def test_buffered_output():
+    def messages():
+        with open('tests/data/outputs/UserSong2.mid', 'rb') as infile:
+            return list(ci.smf_timed_messages(infile, [], True))
+    outputs = []
+    for interactive in (True, False):
+        out = CountingStringIO()
+        ci.state_write(messages(), out, True, True, interactive=interactive,
+                       timed=True)
+        outputs.append(out)
+    line_count = outputs[0].getvalue().count('\n')
+    assert outputs[0].getvalue() == outputs[1].getvalue()
+    assert outputs[0].flushes >= line_count
+    assert outputs[1].flushes == 1
+    assert outputs[1].writes <= line_count // ci.BUFFER_LINES + 2
+
+
+def test_failed_output():
+    # the error from the failed write is the one that comes out
+    class BrokenOutput(CountingStringIO):
+        def write(self, s):
+            super().write(s)
+            raise BrokenPipeError
+
+    message = mido.Message('control_change', control=7)
+    out = BrokenOutput()
+    with pytest.raises(BrokenPipeError) as excinfo:
+        ci.state_write([message] * 3, out, True, True, interactive=True)
+    assert excinfo.value.__context__ is None
+    assert out.writes == 1
+
+
+def test_track_merge():
+    smf = mido.MidiFile('tests/data/outputs/UserSong2.mid')
+    records = list(trackmerge.merge_tracks(smf.tracks))
+    merged = mido.merge_tracks(smf.tracks)
+    assert len(records) == len(merged)
+    tick = 0
+    for (record_tick, track, message), expected in zip(records, merged):
+        tick += expected.time
+        assert record_tick == tick
+        assert message.copy(time=0) == expected.copy(time=0)
+    # the messages themselves, not copies
+    assert records[0][2] is smf.tracks[records[0][1]][0]
+    # and the same times as iterating over the file
+    seconds = [s for s, _, _ in trackmerge.iter_seconds(
+        records, smf.ticks_per_beat)]
+    total = 0
+    for s, message in zip(seconds, smf):
+        total += message.time
+        assert s == total
+    # the interpretation is the same with or without copies
+    with open('tests/data/outputs/UserSong2.mid', 'rb') as infile:
+        timed = list(ci.smf_timed_messages(infile, [0, 2], True))
+    untimed = io.StringIO()
+    ci.state_write([m.copy(time=t) for t, m in timed], untimed, True, True)
+    output = io.StringIO()
+    ci.state_write(timed, output, True, True, timed=True)
+    assert output.getvalue() == untimed.getvalue()
+
+
+def test_message_string():
+    messages = [mido.Message('note_on', channel=2, note=60, time=3),
+                mido.Message('sysex', data=(1, 2, 3)),
+                mido.MetaMessage('set_tempo', tempo=400000)]
+    for message in messages:
+        assert ci._message_string(message, None) == str(message)
+        for time in (0, 1.25):
+            assert (ci._message_string(message, time)
+                    == str(message.copy(time=time)))
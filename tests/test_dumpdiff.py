@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+import extractor as e
+from commons import dumpdiff
+
+
+@pytest.fixture(scope='module')
+def dumps():
+    return (e._read_dump_from_filename('tests/data/dumps/full_blank.syx'),
+            e._read_dump_from_filename('tests/data/dumps/dumptestfull.syx'),
+            e._read_dump_from_filename('tests/data/dumps/dumptestfull.txt'))
+
+
+def test_diff_same(dumps):
+    _, full, full_again = dumps
+    diff = dumpdiff.diff_dumps(full, full_again)
+    assert diff['song_data'] == {'ranges': [], 'songs': []}
+    assert diff['reg_data'] == {'ranges': [], 'settings': []}
+
+
+def test_diff_blank(dumps):
+    blank, full, _ = dumps
+    diff = dumpdiff.diff_dumps(blank, full)
+    # should be serialisable as is
+    json.dumps(diff)
+    song_diff = diff['song_data']
+    assert 'block data' in song_diff['ranges']
+    assert 'start marker' not in song_diff['ranges']
+    recorded = [song.number for song in full.song_data.songs if song.active]
+    assert [song['number'] for song in song_diff['songs']] == recorded
+    song = full.song_data.songs[1]
+    song_record = song_diff['songs'][recorded.index(2)]
+    assert song_record['changes']['size'] == [0, song.size]
+    track_record = song_record['tracks'][1]
+    assert track_record['data_changed']
+    assert (track_record['events']['notes']
+            == [None, song.events[track_record['track']].note_on_count()])
+
+    reg_diff = diff['reg_data']
+    assert reg_diff['ranges'] == ['settings']
+    assert len(reg_diff['settings']) == 16
+    first = full.reg_data.settings.get_setting(1, 1)
+    assert (reg_diff['settings'][0]['changes']['Style number'][1]
+            == str(first['Style number'].value))
+
+    lines = list(dumpdiff.format_diff(diff))
+    assert lines[0].startswith("Song data: differs in")
+    assert " User Song 2:" in lines
@@ -0,0 +1,73 @@
+import io
+import itertools
+import json
+
+import dumpreport
+from commons import dumprecords
+from commons.exceptions import MalformedDataError
+
+
+def test_records_match_cereal():
+    with open('tests/data/json/dump.json') as dj:
+        jcereal = json.load(dj)
+    out = io.StringIO()
+    count = dumpreport.write_file_records(
+        out, 'tests/data/dumps/dumptestfull.syx')
+    lines = out.getvalue().splitlines()
+    assert len(lines) == count == 1 + 5 + 5*6 + 16
+    records = [json.loads(line) for line in lines]
+    assert all(r['source'] == 'tests/data/dumps/dumptestfull.syx'
+               for r in records)
+    assert records[0] == {'type': 'dump', 'source': records[0]['source'],
+                          'song_data': True, 'reg_data': True}
+
+    # reassemble the nested version
+    songs = []
+    settings = []
+    for record in records[1:]:
+        rtype = record.pop('type')
+        del record['source']
+        if rtype == 'song':
+            record['tracks'] = []
+            songs.append(record)
+        elif rtype == 'track':
+            assert record.pop('song') == songs[-1]['number']
+            songs[-1]['tracks'].append(record)
+        else:
+            assert rtype == 'setting'
+            settings.append(record['values'])
+    assert songs == jcereal['song_data']
+    assert settings == jcereal['reg_data']
+
+
+def test_error_record():
+    out = io.StringIO()
+    assert dumpreport.write_file_records(
+        out, 'tests/data/dumps/dumptestpartial.syx') == 1
+    record = json.loads(out.getvalue())
+    assert record['type'] == 'error'
+    assert record['error'] == 'MessageSequenceError'
+
+    # files that aren't there
+    out = io.StringIO()
+    assert dumpreport.write_file_records(
+        out, 'tests/data/dumps/nonexistent.syx') == 1
+    record = json.loads(out.getvalue())
+    assert record['type'] == 'error'
+    assert record['error'] == 'FileNotFoundError'
+
+
+def test_late_error_record(monkeypatch):
+    # an error partway through the records
+    def bad_records(dump, source=None):
+        yield from itertools.islice(iter_dump_records(dump, source), 3)
+        raise MalformedDataError("Bad song")
+
+    iter_dump_records = dumprecords.iter_dump_records
+    monkeypatch.setattr(dumprecords, 'iter_dump_records', bad_records)
+    out = io.StringIO()
+    assert dumpreport.write_file_records(
+        out, 'tests/data/dumps/dumptestfull.syx') == 4
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r['type'] for r in records] == ['dump', 'song', 'track', 'error']
+    assert records[-1]['description'] == 'Bad song'
@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+import extractor as e
+from commons.dumpstore import DumpStore
+from commons.exceptions import NotRecordedError
+
+
+@pytest.fixture(scope='module')
+def dump():
+    return e._read_dump_from_filename('tests/data/dumps/dumptestfull.syx')
+
+
+def test_dump_store(dump, tmpdir):
+    store = DumpStore(str(tmpdir))
+    manifest = store.add_dump('first', dump)
+    blob_count = sum(len(files) for _, _, files
+                     in os.walk(os.path.join(str(tmpdir), 'blobs')))
+    # storing the same dump again adds no new blobs
+    assert store.add_dump('second', dump) == manifest
+    assert blob_count == sum(len(files) for _, _, files
+                             in os.walk(os.path.join(str(tmpdir), 'blobs')))
+    assert store.names() == ['first', 'second']
+
+    for song in dump.song_data.songs:
+        if song.active:
+            assert store.song_midi('second', song.number) == song.midi
+            assert (store.song_midi('second', song.number, True)
+                    == song.midi_octave_corrected)
+        else:
+            with pytest.raises(NotRecordedError):
+                store.song_midi('second', song.number)
+
+    for bank, button, data, _ in dump.reg_data.settings.iter_raw_values():
+        setting = store.reg_setting('first', bank, button)
+        assert setting.data == data
+        expected = dump.reg_data.settings.get_setting(bank, button)
+        assert ([setting[k].value for k in setting]
+                == [expected[k].value for k in expected])
+
+    with pytest.raises(KeyError):
+        store.get_manifest('third')
@@ -1,8 +1,13 @@
+import os
+
 import pytest
 import json
 
 import extractor as e
-from commons.exceptions import MessageSequenceError, NotRecordedError
+from commons import dgxdump, mido_util
+from commons.exceptions import (MessageSequenceError, NotRecordedError,
+                               TransferTimeoutError)
+from commons.dumpdata import verify
 
 
 @pytest.fixture(scope='module')
@@ -61,3 +66,82 @@ def test_sequences(ffab):
     with pytest.raises(IndexError):
         songs[5]
     assert songs[1:4:2] == [songs[1], songs[3]]
+
+
+def test_verify():
+    for filename in ['tests/data/dumps/dumptestfull.syx',
+                     'tests/data/dumps/dumptestfull.txt',
+                     'tests/data/dumps/full_blank.syx']:
+        report = verify.verify_dump_file(filename)
+        assert report.ok
+        assert [(s.name, s.count, s.run) for s in report.sections] == [
+            ('song', 39, 76904), ('reg', 2, 816)]
+    assert not verify.verify_dump_file(
+        'tests/data/dumps/dumptestpartial.syx').ok
+
+    with open('tests/data/dumps/dumptestfull.syx', 'rb') as infile:
+        data = infile.read()
+    # change one byte of the payload
+    broken = bytearray(data)
+    broken[100] ^= 0x01
+    report = verify.verify_dump_bytes(bytes(broken))
+    assert report.errors == ["Checksum invalid: song section message 1"]
+    # cut off the end
+    assert not verify.verify_dump_bytes(data[:-20]).ok
+    assert not verify.verify_dump_bytes(b'').ok
+
+
+def test_section_only(ffab, jcereal):
+    with open('tests/data/dumps/dumptestfull.syx', 'rb') as infile:
+        data = infile.read()
+    assert len(list(mido_util.scan_sysex_frames(data))) == 41
+    assert len(list(mido_util.scan_sysex_frames(data, [0x09]))) == 2
+    for filename in ['tests/data/dumps/dumptestfull.syx',
+                     'tests/data/dumps/dumptestfull.txt']:
+        reg_only = e._read_dump_from_filename(filename, song=False)
+        assert reg_only.song_data is None
+        assert reg_only.reg_data._cereal() == jcereal['reg_data']
+        song_only = e._read_dump_from_filename(filename, reg=False)
+        assert song_only.reg_data is None
+        assert song_only.song_data._cereal() == jcereal['song_data']
+    # and for the messages themselves
+    reg_only = dgxdump.DgxDump(ffab[0].iter_messages(), song=False)
+    assert list(reg_only.iter_messages()) == list(
+        ffab[0].reg_data.iter_messages())
+    # a dump of the registration section on its own
+    e._read_dump_from_filename('tests/data/dumps/regtest3.syx', song=False)
+
+
+def test_incremental_sections(ffab):
+    consumed = []
+
+    def messages():
+        for message in ffab[0].iter_messages():
+            consumed.append(message)
+            yield message
+
+    sections = dgxdump.iter_sections(messages())
+    song_section = next(sections)
+    # the song section is there before any of the reg section is read
+    assert len(consumed) == 39
+    assert song_section.songs[1].midi == ffab[0].song_data.songs[1].midi
+    reg_section = next(sections)
+    assert len(consumed) == 41
+    assert reg_section._cereal() == ffab[0].reg_data._cereal()
+
+
+def test_pipe_timeout():
+    with open('tests/data/dumps/dumptestfull.syx', 'rb') as infile:
+        data = infile.read()
+    read_fd, write_fd = os.pipe()
+    try:
+        # the messages come out without waiting for EOF
+        os.write(write_fd, data[:4000])
+        messages = mido_util.iter_syx_messages(
+            mido_util.iter_fd_chunks(read_fd, timeout=0.1))
+        assert next(messages).bin() == data[:data.index(b'\xF7') + 1]
+        with pytest.raises(TransferTimeoutError):
+            list(messages)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
@@ -0,0 +1,133 @@
+import pytest
+
+import extractor as e
+import melodysearch
+from commons import melodyindex
+from commons.dumpdata.songevents import decode_track_blocks, correct_octaves
+from commons.dumpstore import DumpStore
+from commons.exceptions import MalformedDataError
+
+
+@pytest.fixture(scope='module')
+def dump():
+    return e._read_dump_from_filename('tests/data/dumps/dumptestfull.syx')
+
+
+def test_parse_note():
+    assert melodyindex.parse_note('C3') == 60
+    assert melodyindex.parse_note('F#4') == 78
+    assert melodyindex.parse_note('Gb4') == 78
+    assert melodyindex.parse_note('Cb3') == 59
+    assert melodyindex.parse_note('B#2') == 60
+    assert melodyindex.parse_note('C-2') == 0
+    assert melodyindex.parse_note('64') == 64
+    for name in ('H3', 'C', 'G9', '128'):
+        with pytest.raises(ValueError):
+            melodyindex.parse_note(name)
+
+
+def test_melody_search(dump, tmpdir):
+    song = dump.song_data.songs[0]
+    track, blocks = song.track_blocks()[2]
+    ticks, notes = melodyindex.track_melody(
+        decode_track_blocks([correct_octaves(blocks)]))
+    # a fragment, transposed
+    query = [note - 5 for note in notes[20:28]]
+    expected = melodyindex.MelodyMatch(
+        'full', song.number, track, 20,
+        round(song.tempo_map.tick_to_seconds(ticks[20]) * 1000), 5)
+
+    path = str(tmpdir.join('melody.db'))
+    with melodyindex.MelodyIndex(path) as index:
+        count = index.add_songs('full', dump.song_data.songs)
+        # indexing again replaces, rather than adding more
+        assert index.add_songs('full', dump.song_data.songs) == count
+        store = DumpStore(str(tmpdir.join('store')))
+        store.add_dump('stored', dump)
+        assert index.add_stored_dump(store, 'stored') == count
+
+    with melodyindex.MelodyIndex(path) as index:
+        assert index.n == melodyindex.DEFAULT_N
+        assert index.sources() == ['full', 'stored']
+        matches = index.search(query)
+        assert expected in matches
+        assert expected._replace(source='stored') in matches
+        # every match really is the melody
+        for match in matches:
+            _, match_notes = melodyindex.track_melody(decode_track_blocks(
+                [correct_octaves(dict(dump.song_data.songs[match.song-1]
+                                      .track_blocks())[match.track])]))
+            found = match_notes[match.position:match.position+len(query)]
+            assert [n - match.transpose for n in found] == query
+        # (notes that go nowhere near each other)
+        assert index.search([0, 127, 0, 127, 0, 127]) == []
+        with pytest.raises(ValueError):
+            index.search(query[:melodyindex.DEFAULT_N])
+        index.remove_source('stored')
+        assert index.sources() == ['full']
+        # (the times don't depend on Track A coming first)
+        index.add_song('reversed', song.number, song.track_blocks()[::-1])
+        assert expected._replace(source='reversed') in index.search(query)
+    with pytest.raises(ValueError):
+        melodyindex.MelodyIndex(path, melodyindex.DEFAULT_N + 1)
+
+
+def test_failed_indexing(dump, tmpdir, monkeypatch):
+    # a dump that can't be indexed leaves the old entries alone
+    song = dump.song_data.songs[1]
+    _, blocks = song.track_blocks()[1]
+    _, notes = melodyindex.track_melody(
+        decode_track_blocks([correct_octaves(blocks)]))
+    query = notes[:8]
+    store = DumpStore(str(tmpdir.join('store')))
+    store.add_dump('stored', dump)
+    with melodyindex.MelodyIndex(str(tmpdir.join('melody.db'))) as index:
+        index.add_stored_dump(store, 'stored')
+        index.commit()
+        matches = index.search(query)
+        assert matches
+
+        # (failing after the first song has been indexed again)
+        get_blob = store.get_blob
+        fail_after = len(store.song_tracks('stored', 1))
+        calls = []
+
+        def failing_get_blob(digest):
+            calls.append(digest)
+            if len(calls) > fail_after:
+                raise KeyError(digest)
+            return get_blob(digest)
+
+        monkeypatch.setattr(store, 'get_blob', failing_get_blob)
+        with pytest.raises(KeyError):
+            index.add_stored_dump(store, 'stored')
+        index.commit()
+        assert index.sources() == ['stored']
+        assert index.search(query) == matches
+
+
+def test_late_index_error(dump, tmpdir, monkeypatch):
+    # an error decoding the songs, after the dump has been read
+    track_melody = melodyindex.track_melody
+    calls = []
+
+    def bad_melody(events):
+        calls.append(events)
+        if len(calls) == 2:
+            raise MalformedDataError("Bad track")
+        return track_melody(events)
+
+    _, blocks = dump.song_data.songs[1].track_blocks()[1]
+    _, notes = track_melody(decode_track_blocks([correct_octaves(blocks)]))
+    query = notes[:8]
+    full = 'tests/data/dumps/dumptestfull.syx'
+    partial = 'tests/data/dumps/dumptestpartial.syx'
+    with melodyindex.MelodyIndex(str(tmpdir.join('melody.db'))) as index:
+        melodysearch.index_files(index, [full])
+        matches = index.search(query)
+        assert matches
+        monkeypatch.setattr(melodyindex, 'track_melody', bad_melody)
+        melodysearch.index_files(index, [full, partial])
+        # the bad one is left as it was, and the next one is indexed
+        assert index.sources() == [full, partial]
+        assert [m for m in index.search(query) if m.source == full] == matches
@@ -1,12 +1,18 @@
+import io
+import os
+
 import pytest
 
+from commons import mido_util
+
 from commons.util import (pack_seven, pack_variable_length,
                           unpack_variable_length, unpack_seven,
                           reconstitute, reconstitute_all,
                           lazy_property, # lazy_class_property,
                           cumulative_slices,
                           iter_pairs,
-                          CachedSequence
+                          CachedSequence,
+                          write_buffers
                           )
 
 
@@ -174,3 +180,58 @@ def test_lazy_sequence():
     assert counter == 1
     assert seq.index(5) == 4
     assert counter > 1
+
+
+def test_write_buffers(tmp_path, monkeypatch):
+    buffers = [b'abc', memoryview(b'defgh')[1:], b'', bytearray(b'ijk')]
+    expected = b'abcefghijk'
+
+    fallback = io.BytesIO()
+    write_buffers(fallback, buffers)
+    assert fallback.getvalue() == expected
+
+    path = tmp_path / 'out.bin'
+    with open(path, 'wb') as outfile:
+        outfile.write(b'>')
+        write_buffers(outfile, buffers)
+    assert path.read_bytes() == b'>' + expected
+
+    if hasattr(os, 'writev'):
+        # writev may only write part of the data
+        real_writev = os.writev
+
+        def partial_writev(fd, views):
+            return real_writev(fd, [bytes(views[0])[:2]])
+
+        monkeypatch.setattr(os, 'writev', partial_writev)
+        with open(path, 'wb') as outfile:
+            write_buffers(outfile, buffers)
+        assert path.read_bytes() == expected
+
+
+def test_syx_chunks():
+    assert list(mido_util.decode_hex_chunks(
+        [b'F0 4', b'3\n7', b'3 F7\n'])) == [b'\xF0', b'\x43', b'\x73\xF7']
+    with pytest.raises(ValueError):
+        list(mido_util.decode_hex_chunks([b'F0 4']))
+    with pytest.raises(ValueError):
+        list(mido_util.decode_hex_chunks([b'F0 XX']))
+    frames = list(mido_util.iter_sysex_frames(
+        [b'\xF0\x43\x73\x7F\x44\x06\x09', b'\x00\xF7\xF0\x43',
+         b'\xF0\x43\x73\x7F\x44\x06\x0A\x00\xF7']))
+    # (the broken message is dropped)
+    assert frames == [b'\xF0\x43\x73\x7F\x44\x06\x09\x00\xF7',
+                      b'\xF0\x43\x73\x7F\x44\x06\x0A\x00\xF7']
+    # (as is one too long to be a bulk dump message)
+    frames = list(mido_util.iter_sysex_frames(
+        [b'\xF0\x43\x73\x7F\x44\x06\x0A'] +
+        [b'\x00' * 0x100] * (mido_util.MAX_SYSEX_FRAME // 0x100) +
+        [b'\x00\xF7\xF0\x43\x73\x7F\x44\x06\x09\x00\xF7']))
+    assert frames == [b'\xF0\x43\x73\x7F\x44\x06\x09\x00\xF7']
+    for filename in ('tests/data/dumps/dumptestfull.syx',
+                     'tests/data/dumps/dumptestfull.txt'):
+        with open(filename, 'rb') as infile:
+            whole = list(mido_util.read_syx_file(infile))
+        for n in (7, 1000):
+            with open(filename, 'rb') as infile:
+                assert list(mido_util.read_syx_file_gen(infile, n)) == whole
@@ -0,0 +1,107 @@
+import io
+
+import pytest
+import mido
+
+import extractor as e
+from commons import playback, trackmerge
+from commons.exceptions import NotRecordedError
+
+
+@pytest.fixture(scope='module')
+def songs():
+    dump = e._read_dump_from_filename('tests/data/dumps/dumptestfull.syx',
+                                      reg=False)
+    return dump.song_data.songs
+
+
+def test_song_playback(songs):
+    # the same as playing the (octave corrected) midi file
+    song = songs[1]
+    smf = mido.MidiFile(file=io.BytesIO(song.midi_octave_corrected))
+    expected = [(s, m.copy(time=0)) for s, _, m in trackmerge.iter_seconds(
+        trackmerge.merge_tracks(smf.tracks), smf.ticks_per_beat)
+        if not m.is_meta or m.type == 'end_of_track']
+    timed = list(playback.iter_song_playback(song))
+    assert len(timed) == len(expected)
+    for (s, message), (expected_s, expected_message) in zip(timed, expected):
+        assert s == pytest.approx(expected_s)
+        assert message == expected_message
+    # sped up
+    fast = list(playback.iter_song_playback(song, speedup=2))
+    assert fast[-1][0] == pytest.approx(timed[-1][0] / 2)
+    with pytest.raises(NotRecordedError):
+        next(playback.iter_song_playback(songs[3]))
+
+
+def test_song_playback_measure(songs):
+    song = songs[1]
+    tempo_map = song.tempo_map
+    start_tick = tempo_map.measure_to_tick(3)
+    records = list(playback.iter_song_records(song))
+    timed = list(playback.iter_song_playback(song, 3))
+    # everything after the start, shifted to the start time
+    start_seconds = tempo_map.tick_to_seconds(start_tick)
+    after = [m for tick, _, m in records if tick >= start_tick]
+    assert [m for _, m in timed[-len(after):]] == after
+    assert timed[-1][0] == pytest.approx(
+        tempo_map.tick_to_seconds(records[-1][0]) - start_seconds)
+    # then the chased messages before that, at the start
+    chased = timed[:-len(after)]
+    assert all(s == 0 for s, _ in chased)
+    assert not any(m.type == 'note_on' for _, m in chased)
+    programs = {}
+    for tick, _, m in records:
+        if tick < start_tick and m.type == 'program_change':
+            programs[m.channel] = m
+    assert [m for _, m in chased if m.type == 'program_change'] == list(
+        programs.values())
+    with pytest.raises(ValueError):
+        next(playback.iter_song_playback(song, song.duration + 1))
+
+
+def test_chase_parameters():
+    def control(control, value):
+        return mido.Message('control_change', control=control, value=value)
+
+    volume = control(7, 100)
+    bend_range = [control(101, 0), control(100, 0), control(6, 12)]
+    fine_tune = [control(101, 0), control(100, 1), control(6, 70),
+                 control(96, 0)]
+    note = mido.Message('note_on', note=60)
+    records = [(0, 1, m) for m in
+               [volume, *bend_range, *fine_tune, control(7, 90)]]
+    records += [(0, 1, note), (10, 1, note), (10, 1, trackmerge.END_OF_TRACK)]
+    chased = [m for tick, _, m in playback.chase_records(records, 10)]
+    # each data entry after its parameter, then the last one selected again
+    assert chased == [control(7, 90), *bend_range, *fine_tune,
+                      control(101, 0), control(100, 1),
+                      note, trackmerge.END_OF_TRACK]
+
+
+def test_play():
+    class FakeClock(object):
+        now = 0.0
+
+        def __call__(self):
+            return self.now
+
+        def sleep(self, seconds):
+            self.now += seconds
+
+    class FakePort(object):
+        def __init__(self):
+            self.sent = []
+
+        def send(self, message):
+            self.sent.append((clock.now, message))
+
+    clock = FakeClock()
+    port = FakePort()
+    note = mido.Message('note_on', note=60)
+    timed = [(0, note), (0.5, note), (0.25, note),
+             (1.0, trackmerge.END_OF_TRACK)]
+    playback.play(port, timed, clock, clock.sleep)
+    # (late messages go straight away)
+    assert port.sent == [(0, note), (0.5, note), (0.5, note)]
+    assert clock.now == 1.0
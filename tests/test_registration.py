@@ -3,6 +3,9 @@ import json
 
 from commons.mido_util import read_syx_file
 from commons.dumpdata.messages import RegDumpSection
+from commons.dumpdata.regvalues import DATA_SPECS
+from commons.dumpdata.regstore import RegStore
+from commons.dgxdump import DgxDump
 
 
 @pytest.mark.parametrize("datafile, valuefile", [
@@ -20,3 +23,50 @@ def test_reg(datafile, valuefile):
     assert dset.unusual_len() == 0
     for key, value in sets.items():
         assert str(dset[key].value) == value
+
+
+def test_reg_lazy_values():
+    with open('tests/data/dumps/regtest3.syx', 'rb') as infile:
+        settings = RegDumpSection(read_syx_file(infile)).settings
+    for setting in settings.iter_settings():
+        assert setting._dict == {}
+        for dname, (dslice, dfunc) in DATA_SPECS.SETTING_MAP.items():
+            sval = setting[dname]
+            assert sval.bytes == setting.data[dslice]
+            if setting.recorded and not sval.unusual:
+                assert sval.value == dfunc(setting.data[dslice])
+        assert list(setting) == list(DATA_SPECS.SETTING_MAP)
+    # the raw values are unpacked once, for all the settings, and shared
+    for bank, button, data, raw_values in settings.iter_raw_values():
+        assert raw_values == DATA_SPECS.SETTING_STRUCT.unpack(data)
+        assert settings.get_setting(bank, button)._raw_values is raw_values
+
+
+def test_reg_store():
+    store = RegStore()
+    for datafile in ['tests/data/dumps/dumptestfull.syx',
+                     'tests/data/dumps/full_blank.syx']:
+        with open(datafile, 'rb') as infile:
+            store.add_dump(datafile, DgxDump(read_syx_file(infile)))
+    assert len(store) == 32
+    assert store.dump_keys[store.column('dump')[20]] == (
+        'tests/data/dumps/full_blank.syx')
+
+    rows = store.select({'recorded': 1, 'Harmony': 0x7F})
+    assert [store.row_key(row) for row in rows] == [
+        ('tests/data/dumps/dumptestfull.syx', 8, 1)]
+    rows = store.select({'bank': 4, 'button': 2}, rows)
+    assert rows == []
+    # a value of the wrong type matches nothing
+    assert store.select({'Style number': '042'}) == []
+    assert store.select({'bank': 4.0, 'button': 2}) == store.select(
+        {'bank': 4, 'button': 2})
+
+    groups = store.group_by('Style number',
+                            store.select({'recorded': lambda r: not r}))
+    assert list(groups) == [0]
+
+    for row in range(len(store)):
+        setting = store.setting(row)
+        for name in store.fields[4:]:
+            assert store.decode(row, name) == setting[name].value
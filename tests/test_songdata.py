@@ -0,0 +1,182 @@
+import io
+
+import pytest
+import mido
+
+import extractor as e
+from commons.dumpdata import songevents
+from commons.dumpdata.songdata import SongDataBlockSystem
+from commons.tempomap import TempoMap
+from commons import trackmerge
+from commons.exceptions import MalformedDataError, NotRecordedError
+
+
+@pytest.fixture(scope='module')
+def songs():
+    dump = e._read_dump_from_filename('tests/data/dumps/dumptestfull.syx')
+    return dump.song_data.songs
+
+
+def test_track_events(songs):
+    song = songs[1]
+    smf = mido.MidiFile(file=io.BytesIO(song.midi))
+    datatracks = [events for events in song.events if events is not None]
+    assert len(datatracks) == len(smf.tracks)
+    for events, track in zip(datatracks, smf.tracks):
+        assert len(events) == len(track)
+        tick = 0
+        for i, msg in enumerate(track):
+            tick += msg.time
+            assert events.ticks[i] == tick
+            if msg.is_meta:
+                assert events.statuses[i] == songevents.META
+            elif msg.type == 'sysex':
+                assert events.extras[i] == bytes(msg.bin()[1:])
+            else:
+                status, *data = msg.bytes()
+                assert events.statuses[i] == status & 0xF0
+                assert events.channels[i] == status & 0x0F
+                assert events.data1[i] == data[0]
+        assert events.note_on_count() == sum(
+            1 for msg in track if msg.type == 'note_on' and msg.velocity)
+    assert songs[3].events[1] is None
+
+
+def test_chord_changes(songs):
+    changes = list(songevents.iter_chord_changes(songs[0].events[0]))
+    assert changes[0][0] == 0
+    assert str(changes[0][1]) == "C"
+    assert all(t0 <= t1 for (t0, _), (t1, _) in zip(changes, changes[1:]))
+
+
+def test_block_chains(songs):
+    report = songs.check_blocks()
+    assert not (report.broken or report.cycles
+                or report.orphans or report.shared)
+    assert len(report.chains) == 10
+
+    table = bytearray(SongDataBlockSystem.BLOCK_COUNT)
+    table[0:3] = (2, 3, 2)  # 1 -> 2 -> 3 -> 2 ...
+    table[4:7] = (6, 0xFF, 6)  # 5 -> 6, 7 -> 6
+    table[9] = 0x90  # 10 -> invalid
+    table[10] = 0xFF  # 11, unused by any track
+    block_data = bytearray(SongDataBlockSystem.BLOCK_SIZE
+                           * SongDataBlockSystem.BLOCK_COUNT)
+    # a track four blocks long, starting at block 1
+    block_data[0:8] = b'MTrk\x00\x00\x07\x00'
+    system = SongDataBlockSystem(bytes(table), block_data)
+
+    chains = system.chain_index
+    assert chains[1].blocks == (1, 2, 3)
+    assert chains[3].blocks == (3, 2)
+    assert chains[7] == (
+        (7, 6), SongDataBlockSystem.CHAIN_END)
+    assert chains[20] == (
+        (20,), SongDataBlockSystem.CHAIN_EMPTY)
+
+    report = system.integrity_report([1, 5, 0xFF, 7, 10])
+    assert report.broken == {1, 10}
+    assert report.cycles == {2, 3}
+    assert report.orphans == {11}
+    assert report.shared == {2, 6}
+
+    with pytest.raises(MalformedDataError):
+        system.get_track_blocks(1)
+
+
+def test_write_midi(songs, tmp_path):
+    path = tmp_path / 'song.mid'
+    with open(path, 'wb') as outfile:
+        songs[1].write_midi(outfile)
+    assert path.read_bytes() == songs[1].midi
+    with pytest.raises(NotRecordedError):
+        songs[3].midi_buffers()
+
+
+def test_octave_correction(songs):
+    song = songs[1]
+    raw = mido.MidiFile(file=io.BytesIO(song.midi))
+    fixed = mido.MidiFile(file=io.BytesIO(song.midi_octave_corrected))
+    # Track 1 (channel 0) is recorded with Main Octave -1
+    raw_track, fixed_track = raw.tracks[1], fixed.tracks[1]
+    assert [m.value for m in raw_track if m.type == 'polytouch'] == [0x3F]
+    assert not any(m.type == 'polytouch' for m in fixed_track)
+    assert len(fixed_track) == len(raw_track) - 1
+    assert (sum(m.time for m in fixed_track)
+            == sum(m.time for m in raw_track))
+    raw_notes = [m for m in raw_track if m.type.startswith('note')]
+    fixed_notes = [m for m in fixed_track if m.type.startswith('note')]
+    for r, f in zip(raw_notes, fixed_notes):
+        if r.channel == 0:
+            assert f.note == r.note - 12
+        else:
+            # the dual voice already has its octave applied
+            assert f.note == r.note
+    # Track A is untouched
+    assert song.midi_buffers(True)[1] == song.midi_buffers()[1]
+
+
+def test_partial_decode():
+    dump = e._read_dump_from_filename('tests/data/dumps/dumptestfull.syx')
+    section = dump.song_data
+    payload = section.payload
+    full = b''.join(dm.payload for dm in section.dm_list if not dm.end)
+    assert len(payload) == len(full)
+    omap = payload.offset_map
+    for offset in (0, 6, 7, 0x2CF, 0x106D5, len(full) - 1):
+        i, group, byte = omap.locate(offset)
+        assert omap.starts[i] + group * 7 + byte == offset
+    with pytest.raises(IndexError):
+        omap.locate(len(full))
+    # the song table only needs the header and the start of each track
+    songs = section.songs
+    assert [song.size for song in songs] == [4763, 9103, 0, 0, 0]
+    assert payload.groups_decoded < omap.group_count // 10
+    assert payload[0x2CF:0x2D5] == full[0x2CF:0x2D5]
+    assert payload[-1] == full[-1]
+    midi = songs[1].midi
+    assert payload.groups_decoded < omap.group_count // 2
+    assert bytes(payload) == full
+    assert midi == e._read_dump_from_filename(
+        'tests/data/dumps/dumptestfull.syx').song_data.songs[1].midi
+    # (the registration settings are all unpacked together, but the
+    # section is small anyway)
+    reg_payload = dump.reg_data.payload
+    setting = dump.reg_data.settings.get_setting(3, 1)
+    assert setting.data == bytes(reg_payload)[4 + 2*0x2C:4 + 3*0x2C]
+
+
+def test_tempo_map(songs):
+    for song in songs:
+        if not song.active:
+            continue
+        smf = mido.MidiFile(file=io.BytesIO(song.midi))
+        tmap = song.tempo_map
+        seconds = trackmerge.iter_seconds(
+            trackmerge.merge_tracks(smf.tracks), smf.ticks_per_beat)
+        tick_seconds = list(zip(
+            (tick for tick, _, _ in trackmerge.merge_tracks(smf.tracks)),
+            (s for s, _, _ in seconds)))
+        for tick, s in tick_seconds:
+            assert tmap.tick_to_seconds(tick) == pytest.approx(s)
+            assert tmap.seconds_to_tick(s) == pytest.approx(tick)
+    # the same from the MIDI file
+    song = songs[1]
+    smf = mido.MidiFile(file=io.BytesIO(song.midi))
+    smf_map = TempoMap.from_midi_track(smf.tracks[0], smf.ticks_per_beat)
+    assert smf_map.ticks == song.tempo_map.ticks
+    assert smf_map.tempos == song.tempo_map.tempos
+    assert smf_map.time_signatures == song.tempo_map.time_signatures
+
+
+def test_tempo_map_measures():
+    tmap = TempoMap([(96*4, 250000)], 96, [(0, 4, 4), (96*4*2, 3, 4)])
+    assert tmap.tick_to_seconds(96*4) == 2.0
+    assert tmap.tick_to_seconds(96*5) == 2.25
+    assert tmap.seconds_to_tick(2.25) == 96*5
+    assert tmap.tempo_at(96*4 - 1) == 500000
+    assert tmap.measure_to_tick(3) == 96*8
+    assert tmap.measure_to_tick(4) == 96*11
+    assert tmap.tick_to_measure(96*11 + 5) == (4, 5)
+    with pytest.raises(ValueError):
+        tmap.measure_to_tick(0)
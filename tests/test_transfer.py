@@ -0,0 +1,78 @@
+import pytest
+import mido
+
+from commons import transfer
+from commons.exceptions import TransferTimeoutError
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakePort(object):
+    """Gives out the messages at the given times (poll-style)"""
+    def __init__(self, clock, timed_messages):
+        self.clock = clock
+        self.timed_messages = list(timed_messages)
+
+    def poll(self):
+        # time passes with each poll
+        self.clock.now += 0.05
+        if (self.timed_messages
+                and self.timed_messages[0][0] <= self.clock.now):
+            return self.timed_messages.pop(0)[1]
+        return None
+
+
+def sysex(n):
+    return mido.Message('sysex', data=[0x43] + [0] * (n - 3))
+
+
+def test_monitor():
+    clock = FakeClock()
+    monitor = transfer.TransferMonitor(expected_count=4, clock=clock)
+    for t in (1.0, 1.0005, 1.5, 3.5):
+        clock.now = t
+        monitor.feed(sysex(100))
+        monitor.feed(mido.Message('clock'))
+    assert monitor.count == 4
+    assert monitor.byte_count == 400
+    assert monitor.gap_counts == [1, 0, 0, 1, 1]
+    assert monitor.max_gap == pytest.approx(2.0)
+    assert monitor.rate == pytest.approx(400 / 2.5)
+    assert monitor.eta == 0
+    assert "4/4" in monitor.status_line()
+    assert monitor.summary_lines()[0] == "Messages: 4 of 4"
+    clock.now = 4.0
+    assert monitor.now() == 4.0
+    assert monitor.since_start() == 4.0
+    assert monitor.elapsed == 3.0
+    assert monitor.idle() == 0.5
+
+
+def test_deadlines():
+    clock = FakeClock()
+    messages = [(1.0, sysex(10)), (1.2, sysex(10)), (5.0, sysex(10))]
+
+    def run(**kwargs):
+        monitor = transfer.TransferMonitor(clock=clock)
+        port = FakePort(clock, messages)
+        received = []
+        with pytest.raises(TransferTimeoutError):
+            for message in transfer.monitor_messages(
+                    port, monitor, poll_interval=0, **kwargs):
+                received.append(message)
+        return received
+
+    # the wait for the first message doesn't count for the message timeout
+    clock.now = 0
+    assert len(run(message_timeout=0.6)) == 2
+    assert 1.8 <= clock.now < 1.9
+    clock.now = 0
+    assert len(run(total_timeout=3)) == 2
+    clock.now = 0
+    assert len(run(total_timeout=10)) == 3
@@ -1,8 +1,11 @@
 import pytest
+import mido
 
 from commons import values, maps
-from commons.messages import controls, controlstate, wrappers, exclusives
-from commons.tables import voices, styles, chords
+from commons.messages import (controls, controlstate, wrappers, exclusives,
+                              statedisplay)
+from commons.tables import (voices, styles, chords, table_util, table_build,
+                            lookup)
 
 
 def test_notes():
@@ -48,6 +51,55 @@ def test_chords():
     for n in [0x00, 0x22, 0x2A]:
         assert chords.CHORDS.codes[n].code == n
 
+def test_compiled_tables():
+    # the compiled tables have to be rebuilt when the CSV files change:
+    # python -m commons.tables.table_build
+    assert table_build.stale_tables() == []
+    for spec in table_build.TABLE_SPECS:
+        assert (list(table_util.read_table_namedtuple(spec))
+                == list(table_util.read_table_namedtuple(
+                    spec, use_compiled=False)))
+
+def test_lookup():
+    for voice in voices._LOOKUP.numbers.values():
+        assert lookup.voice_from_number(voice.number) is voice
+        assert lookup.voice_from_bank_program(
+            voice.msb, voice.lsb, voice.prog) is voice
+    for n in [0, 495, -1]:
+        with pytest.raises(KeyError):
+            lookup.voice_from_number(n)
+    for bank in [(0, 0), (0, 112), (0, 5), (0x7E, 0), (0x7E, 5), (0x7F, 3)]:
+        for prog in range(128):
+            assert (lookup.voice_from_bank_program_default(*bank, prog)
+                    is voices.from_bank_program_default(*bank, prog))
+    for n in range(1, 137):
+        assert lookup.style_from_number(n) is styles.from_number(n)
+    with pytest.raises(KeyError):
+        lookup.style_from_number(137)
+
+    for chordbytes in [b'\x31\x00\x31\x00', b'\x24\x08\x43\x1E',
+                       b'\x31\x00\x32\x00', b'\x08\x00\x08\x00',
+                       b'\x31\x7F\x31\x7F']:
+        try:
+            expected = chords.byte_chord(chordbytes)
+        except (KeyError, ValueError) as e:
+            with pytest.raises(type(e)):
+                lookup.chord_from_bytes(chordbytes)
+        else:
+            assert lookup.chord_from_bytes(chordbytes) == expected
+
+    assert lookup.from_name("grand piano") is voices.from_name("Grand Piano")
+    assert (lookup.from_name("GRAND  PIANO", lookup.VOICE)
+            is voices.from_name("Grand Piano"))
+    assert lookup.from_name("8beatmodern") is styles.from_number(1)
+    assert lookup.from_name("Minor") is chords.CHORDS.names["minor"]
+    with pytest.raises(KeyError):
+        lookup.from_name("Grand Piano", lookup.STYLE)
+    names = [e.name for e in lookup.search("grand p", lookup.VOICE)]
+    assert names and all(n.lower().startswith("grand p") for n in names)
+    assert names == sorted(names, key=str.lower)
+    assert lookup.search("zzzz") == []
+
 def test_styles():
     for n in [1, 2, 8, 22, 135, 136]:
         style = styles.from_number(n)
@@ -80,3 +132,23 @@ def test_cs():
     w = s.feed(m)
     assert w.wrap_type is wrappers.SysEx.GM_ON
     assert w.value is None
+
+
+def test_state_display():
+    monitor = statedisplay.StateMonitor()
+    lines = monitor.render_changed()
+    assert len(lines) == 4 + 16
+    assert monitor.render_changed() is None
+    # clock messages don't change anything
+    monitor.feed(mido.Message('clock'))
+    assert monitor.render_changed() is None
+    for message in controls.gm_on(), controls.local(False):
+        monitor.feed(message)
+    monitor.feed(mido.Message('control_change', channel=2,
+                              control=0x07, value=42))
+    assert monitor.message_count == 4
+    lines = monitor.render_changed()
+    assert monitor.render_changed() is None
+    assert "Local: OFF" in lines[0]
+    assert lines[4+2].split()[:2] == ['3', '134']
+    assert ' 42 ' in lines[4+2]